@@ -834,6 +834,10 @@ if [ $SKIP_CHECK -eq 0 ] || [ "$CFLAG" = true ]; then
 		echo -e "${CHECKMARK}"
 		update_progress 35
 
+		echo -e "${FADE}${VERB_TEXT}zstandard"
+		"${VENVCMD}" install --upgrade zstandard --quiet >/dev/null
+		echo -e "${CHECKMARK}"
+
 		echo -e "${FADE}${VERB_TEXT}BeautifulSoup"
 		"${VENVCMD}" install --upgrade beautifulsoup4 --quiet >/dev/null
 		echo -e "${CHECKMARK}"
@@ -883,6 +887,7 @@ if [ $SKIP_CHECK -eq 0 ] || [ "$CFLAG" = true ]; then
 		-ie "psutil"\
 		-ie "yaml"\
 		-ie "orjson"\
+		-ie "zstandard"\
 		-ie "gunicorn"\
 		-ie "Flask"\
 		-ie "beautifulsoup4")
@@ -909,6 +914,9 @@ if [ $SKIP_CHECK -eq 0 ] || [ "$CFLAG" = true ]; then
 			if [ -f "${BASEDIR}/utilities/database.db" ]; then
 				chown -f ${OWNER_OF_FGDIR}:${GROUP_OF_FGDIR} "${BASEDIR}/utilities/database.db" >/dev/null 2>&1
 			fi
+			if [ -f "${BASEDIR}/utilities/database.index" ]; then
+				chown -f ${OWNER_OF_FGDIR}:${GROUP_OF_FGDIR} "${BASEDIR}/utilities/database.index" >/dev/null 2>&1
+			fi
 		fi
 	else
 		echo -e "${NC}${ORANGE}> Unable to check or generate aircraft database"
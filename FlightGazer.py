@@ -39,7 +39,7 @@ import time
 START_TIME: float = time.monotonic()
 import datetime
 STARTED_DATE: datetime = datetime.datetime.now()
-VERSION: str = 'v.11.6.2 --- 2026-08-20'
+VERSION: str = 'v.11.7.0 --- 2026-10-17'
 import os
 import argparse
 import sys
@@ -50,7 +50,6 @@ import signal
 import threading
 import asyncio
 from collections import deque
-from functools import lru_cache
 from string import Formatter
 import random
 from getpass import getuser
@@ -109,6 +108,19 @@ argflags.add_argument(
     help=("Log/display more detailed messages.\n"
     "This flag is useful for debugging.")
 )
+argflags.add_argument(
+    '--record',
+    metavar='FILE',
+    help=("Record every snapshot fetched from dump1090 to FILE (gzip-compressed) so that it can be replayed later.\n"
+    "Useful for capturing real traffic to benchmark against.")
+)
+argflags.add_argument(
+    '--replay',
+    metavar='FILE',
+    help=("Benchmark mode: feed a recording made with --record through the full processing pipeline as fast as possible,\n"
+    "print per-stage timing statistics, then exit. Implies No Display mode (but not Interactive mode).\n"
+    "The APIs are not used and flyby stats are not written.")
+)
 args = argflags.parse_args()
 if args.interactive:
     INTERACTIVE: bool = True
@@ -132,6 +144,13 @@ if args.verbose:
     VERBOSE_MODE: bool = True
 else:
     VERBOSE_MODE = False
+RECORD_FILE: str | None = args.record
+""" Where to record dump1090 snapshots to, if set. """
+REPLAY_FILE: str | None = args.replay
+""" Recording to benchmark against, if set. """
+if REPLAY_FILE:
+    NODISPLAY_MODE = True
+    RECORD_FILE = None
 
 FORGOT_TO_SET_INTERACTIVE: bool = False
 if os.environ.get('TMUX') is not None or 'tmux' in os.environ.get('TERM', ''):
@@ -364,7 +383,16 @@ try:
     from utilities.flags import getICAO
     from utilities.registrations import registration_from_hexid as reg_lookup
     from utilities.animator import Animator
-    from utilities import operators as op
+    from utilities import operator_records
+    from utilities import bincraft
+    from utilities import replay
+    from utilities import batch_geometry
+    from utilities.approach_rate import ApproachRateTracker
+    from utilities.enrichment_cache import EnrichmentCache, MISSING as CACHE_MISS
+    from utilities.loop_snapshot import LoopSnapshot, EMPTY_SNAPSHOT, publish as publish_snapshot
+    from utilities.aircraft_record import AircraftRecord
+    from utilities.prioritizer import Prioritizer
+    from utilities import warm_start
     main_logger.debug("Internal modules load-in successful.")
 except Exception as e:
     main_logger.exception(f"{e}")
@@ -378,6 +406,13 @@ except Exception as e:
 CONFIG_FILE = Path(CURRENT_DIR, "config.yaml")
 FLYBY_STATS_FILE = Path(CURRENT_DIR, "flybys.csv")
 DATABASE_FILE = Path(CURRENT_DIR, "utilities", "database.db")
+DATABASE_INDEX_FILE = Path(CURRENT_DIR, "utilities", "database.index")
+""" Memory-mapped index of `DATABASE_FILE` that's used for lookups when it's current (see `utilities/aircraft_index.py`) """
+OPERATORS_FILE = Path(CURRENT_DIR, "utilities", "operators.py")
+OPERATORS_COMPILED_FILE = Path(CURRENT_DIR, "utilities", "operators.bin")
+""" Compiled copy of `OPERATORS_FILE` that's actually used for lookups (see `utilities/operator_records.py`) """
+WARM_START_FILE = Path(CURRENT_DIR, "warm_start.json")
+""" Snapshot of the runtime state that's picked back up after a restart (see `write_warm_start()`) """
 API_URL: str = "https://aeroapi.flightaware.com/aeroapi/"
 API_CACHE_DATABASE = Path(CURRENT_DIR, "API_cache.db")
 USER_AGENT: dict = {'User-Agent': "Wget/1.25.0"}
@@ -527,6 +562,16 @@ if CORE_COUNT is None: CORE_COUNT = 1
 if psutil.LINUX:
     main_logger.debug(f"FlightGazer has been assigned to CPU {this_process.cpu_num()}")
 
+class _JobList(list):
+    """ The job list for `SafeScheduler`; lets it know when a job gets added so it can work out its sleep again. """
+    def __init__(self, on_append):
+        super().__init__()
+        self._on_append = on_append
+
+    def append(self, job) -> None:
+        super().append(job)
+        self._on_append()
+
 # make the scheduling thread more resilient
 class SafeScheduler(schedule.Scheduler):
     """
@@ -538,6 +583,10 @@ class SafeScheduler(schedule.Scheduler):
     whether other jobs will run or if they'll crash the entire script.
     ### Source:
     https://gist.github.com/mplewis/8483f1c24f2d6259aef6?permalink_comment_id=3703372#gistcomment-3703372
+
+    `run_forever()` sleeps until the next job is due instead of checking on a fixed interval.
+    It wakes up early when a job is added, when `wake()` is called, and at least every
+    `max_sleep` seconds to catch changes to the system clock (e.g. when NTP syncs after boot).
     """
 
     def __init__(
@@ -554,7 +603,35 @@ class SafeScheduler(schedule.Scheduler):
         self.reschedule_on_failure = reschedule_on_failure
         self.minutes_after_failure = minutes_after_failure
         self.seconds_after_failure = seconds_after_failure
+        self.max_sleep = 60
+        self._wakeup = threading.Condition()
+        self._woken = False
         super().__init__()
+        self.jobs = _JobList(self.wake)
+
+    def wake(self) -> None:
+        """ Have `run_forever()` check its jobs again right away. """
+        with self._wakeup:
+            self._woken = True
+            self._wakeup.notify_all()
+
+    def run_forever(self) -> None:
+        """ Run jobs as they come due. Never returns. """
+        while True:
+            self.run_pending()
+            with self._wakeup:
+                if self._woken:
+                    self._woken = False
+                    continue
+                idle = self.idle_seconds
+                sleep_for = self.max_sleep if idle is None else min(max(idle, 0.), self.max_sleep)
+                wall_start = time.time()
+                mono_start = time.monotonic()
+                self._wakeup.wait(sleep_for)
+                self._woken = False
+            # the jobs are scheduled on the wall clock but we sleep on the monotonic one
+            if abs(clock_jump := (time.time() - wall_start) - (time.monotonic() - mono_start)) > 1:
+                main_logger.debug(f"System clock changed by {clock_jump:+.1f} seconds, rechecking scheduled jobs.")
 
     def _run_job(self, job):
         global unexpected_oops
@@ -668,7 +745,9 @@ DISABLE_ACTIVE_BRIGHTNESS_AT_NIGHT: bool = False
 SCROLLING_SPEED: int = 30
 API_PERSISTENT_CACHE: bool = False
 IGNORE_AIRCRAFT_ICAOS: set | str = ''
-NO_DUMP978_SEARCH: bool = True # new setting!
+NO_DUMP978_SEARCH: bool = True
+WATCH_LOCAL_JSON: bool = True # new setting!
+DUMP1090_STREAM: str = "" # new setting!
 
 # Advanced options for LED Matrix setups that don't use the Adafruit Bonnet
 ADV_LED_PWM_LSB = 130
@@ -743,6 +822,8 @@ default_settings: dict = {
     "API_PERSISTENT_CACHE": API_PERSISTENT_CACHE,
     "IGNORE_AIRCRAFT_ICAOS": IGNORE_AIRCRAFT_ICAOS,
     "NO_DUMP978_SEARCH": NO_DUMP978_SEARCH,
+    "WATCH_LOCAL_JSON": WATCH_LOCAL_JSON,
+    "DUMP1090_STREAM": DUMP1090_STREAM,
 }
 """ Dict of default settings """
 
@@ -812,15 +893,19 @@ if not CONFIG_MISSING:
 if config: del config
 
 # Log the current operators database version
-try:
-    main_logger.info(f"Using operators database: {op.GENERATED}")
-except AttributeError:
-    # could be using the older version
-    pass
+if (operators_version := operator_records.read_generated(OPERATORS_FILE)) is not None:
+    main_logger.info(f"Using operators database: {operators_version}")
+# otherwise, could be using the older version
 
 if FASTER_REFRESH:
     LOOP_INTERVAL = 1
 
+if REPLAY_FILE:
+    # benchmark runs shouldn't make any API calls or add to the real flyby stats
+    API_KEY = ''
+    OPENWEATHER_API_KEY = ''
+    FLYBY_STATS_ENABLED = False
+
 # =========== Global Variables =============
 # ==========================================
 
@@ -834,20 +919,27 @@ If an airspy setup is detected, `Strong` is overloaded and represents the preamb
 as float. """
 DUMP1090_JSON: str | None = None
 """ Where we're pulling dump1090 data from """
+DUMP1090_BINCRAFT: str | None = None
+""" Where readsb's binCraft data is, if it's available and decodes correctly. Used instead of `DUMP1090_JSON` when set. """
 DUMP978_JSON: str | None = None
 """ Where dump978 data is, if loaded """
 
 # active plane stuff
-relevant_planes: list[dict] = []
-""" List of planes and associated stats found inside area of interest (refer to `main_loop_generator.dump1090_loop()` for keys) """
-relevant_planes_approach_rate_tracking = deque(maxlen=5)
-""" Sliding window history of `relevant_planes_list` data used for the plane selector algorithm.
-Each entry is a list of dicts representing each plane with the keys `ID`, `SlantRange`, and `Timestamp`.
+relevant_planes: list[AircraftRecord] = []
+""" List of planes and associated stats found inside area of interest (refer to `main_loop_generator.dump1090_loop()` for keys).
+Replaced as a whole every loop, never changed in place. Threads that work off a whole loop should use `loop_snapshot` instead. """
+loop_snapshot: LoopSnapshot = EMPTY_SNAPSHOT
+""" What the main loop published last: `general_stats` and `relevant_planes` as of that loop, with a sequence number
+(see `utilities/loop_snapshot.py`). Swapped out whole every loop; grab it once and read from that. """
+relevant_planes_approach_rate_tracking = ApproachRateTracker(window=5)
+""" Sliding window history of `relevant_planes` data used for the plane selector algorithm.
+Keeps the `SlantRange` and `Timestamp` of each plane over the last 5 loops (see `utilities/approach_rate.py`).
 Cleared when there are no active planes in the area. """
 focus_plane: str = ""
 """ Current plane in focus, selected by `AirplaneParser.plane_selector()`. Defaults to an empty string when no active plane is selected. """
-focus_plane_stats: dict = {}
-""" Extracted stats for `focus_plane` from `relevant_planes`, done by `AirplaneParser.plane_selector()` """
+focus_plane_stats: AircraftRecord | dict = {}
+""" Extracted stats for `focus_plane` from `relevant_planes`, done by `AirplaneParser.plane_selector()`.
+An empty dict when there's no `focus_plane`. """
 focus_plane_TTL: int = 0
 """ Assigned focus time limit (time to live) of the current `focus_plane` by the selection algorithm. """
 focus_plane_infocus: int = 0
@@ -867,9 +959,10 @@ plane_latch_times: list[int] = [
     int(15 // LOOP_INTERVAL),
 ]
 """ Precomputed table of latch times (loops) for plane selection algorithm. [2 planes, 3 planes, 4+ planes] """
-focus_plane_api_results = deque([None] * 500, maxlen=500)
+focus_plane_api_results: tuple = (None,) * 500
 """ Additional API-derived information for `focus_plane` and previously tracked planes from the FlightAware API.
-With a successful API call, the result is appended at the end of this deque.
+With a successful API call, this is replaced by a new tuple with the result added at the end (and the oldest dropped),
+so other threads can go through it without it changing under them.
 Valid keys are {
 `ID`, `Flight`, `Identity`, `Origin`, `OriginICAO`,
 `Destination`, `DestinationICAO`, `OriginInfo`, `DestinationInfo`,
@@ -882,14 +975,26 @@ api_results_waiting: bool = False
 Controls if other threads can trigger the API fetcher outside of the normal signaling chain. """
 unique_planes_seen: list[dict] = []
 """ List of nested dictionaries that tracks unique hex IDs of all plane flybys in a day.
-Keys are {`ID`, `Time`, `Flyby`} """
-callsign_lookup_cache = deque([{}] * 100, maxlen=100)
-""" Cache of previously looked up callsigns.
-Newest entries are appended to the left of this deque.
+Keys are {`ID`, `Time`, `Flyby`}. Only ever appended to (until the daily reset); use `flyby_index` to look up a plane. """
+flyby_index: dict[str, dict] = {}
+""" Index of `unique_planes_seen` by hex ID, pointing to the most recent entry for that plane.
+Must be kept in step with `unique_planes_seen`. """
+operator_index: operator_records.OperatorRecords | dict[str, dict] | None = None
+""" Every operator in `operators.py` by its 3 letter code, set up by `load_operator_index()`.
+Normally reads from `OPERATORS_COMPILED_FILE`; a plain dict if that can't be used. Either way, use `.get()`.
 Refer to `operator_lookup()` for valid keys. """
-database_lookup_cache = deque([{}] * 1000, maxlen=1000)
-""" Cache of aircraft data sourced from the database.
-Newest entries are appended to the left of this deque. """
+aircraft_cache = EnrichmentCache(maxsize=1000, negative_ttl=21600)
+""" Aircraft database results by (uppercase) ICAO hex, used by `database_lookup_many()`.
+Aircraft that aren't in the database are remembered for 6 hours. Only cleared by `aircraft_db_checker()`
+when the database version changes. """
+operator_cache = EnrichmentCache(maxsize=1000, negative_ttl=21600)
+""" Operator lookup results by 3 letter code, used by `operator_lookup()`.
+Codes that aren't in the operators database are remembered for 6 hours. """
+aircraft_state: dict[str, dict] = {}
+""" Per-aircraft state kept by the main loop, keyed by ICAO hex. Holds what doesn't change while a plane is in view
+(`Country`, `Registration`, `Database`, and the `Operator` for its current `Callsign`) and its last geometry
+(`Position`, `Distance`, `GeometryKey`, `Geometry`) so these are only worked out again when they need to be.
+`Seen` is the last time (monotonic) the plane was relevant; entries that go unseen are pruned by the main loop. """
 selection_override: bool = False
 """ When an aircraft is within the 'high-priority' dome (0.4 nmi LOS)
 this will be set to True and override the normal `focus_plane` until it leaves this area. """
@@ -977,6 +1082,39 @@ USING_FILESYSTEM_978: bool = False
 """ True if we are directly accessing dump978 json from the file system """
 USING_THREADPOOL: bool = False
 """ Enabled when both dump1090 and dump978 are available; also indicates the threadpool is available """
+io_workers = CF.ThreadPoolExecutor(max_workers=2, thread_name_prefix="io-worker")
+""" Small pool for the blocking network calls that happen outside the main loop (the FlightAware API lookups and
+the weather updates), so that the threads asking for them don't have to wait on the network. """
+json_watcher = None
+""" `JSONFileWatcher` instance when `USING_FILESYSTEM` and `WATCH_LOCAL_JSON` are enabled.
+When present, the main loop is paced by dump1090's writes to the json instead of a fixed interval. """
+aircraft_stream = None
+""" `AircraftStream` instance when `DUMP1090_STREAM` is set. When present, aircraft data comes from
+its continuously updated table instead of fetching dump1090's json. """
+unchanged_snapshots: int = 0
+""" How many polls returned a json that was identical to the previous one (and thus wasn't parsed again).
+Includes `304 Not Modified` responses when polling over the network. """
+snapshot_recorder = None
+""" `SnapshotRecorder` instance when `--record` is used. Every dump1090 snapshot we get is written to it. """
+snapshot_player = None
+""" `SnapshotPlayer` instance when `--replay` is used. When present, recorded snapshots stand in for dump1090
+and the main loop runs as fast as the rest of the pipeline allows. """
+replay_frames = None
+""" Iterator over the snapshots of `snapshot_player`. """
+replay_samples: dict[str, list] = {}
+""" Per-stage timings (ms) of every replayed snapshot, keyed by stage. """
+replay_start: float = 0.
+replay_work_done = threading.Event()
+""" Set once all the work for a replayed snapshot is complete. """
+location_boxes: tuple[float, float, float, float] | None = None
+""" Bounding boxes around our location used to skip the distance math for aircraft that clearly don't need it.
+Set by `build_location_boxes()`; None when the location isn't set.
+`location_boxes` = (`RANGE` half-height, `RANGE` half-width, `BEYOND_LOS_LIMIT` half-height, `BEYOND_LOS_LIMIT` half-width),
+with the sizes in degrees. """
+BATCH_GEOMETRY: bool = batch_geometry.NUMPY_IMPORTED
+""" Compute distances, directions, elevations, and slant ranges for busy snapshots all at once with NumPy
+(see `utilities/batch_geometry.py`). Enabled when NumPy is available; disabled if the results
+don't agree with the scalar math the first time it's used. """
 is_readsb: bool = False
 """ Tweak text output if we're connected to wiedehopf's readsb instead of dump1090 """
 is_airspy: bool = False
@@ -1049,6 +1187,10 @@ algorithm_daily_runtime: int = 0
 As reference, a `really_really_active_adsb_site` can have a value up to 16 hours. """
 process_time2: list[float] = [0., 0., 0., 0.]
 """ [time to print last console output, format data, json deserializing, json serializing] ms """
+tick_latency: float = 0.
+""" Time (ms) from the main loop starting on a snapshot to the work chain finishing with it (right before the state export) """
+plane_selection_time: float = 0.
+""" Time (ms) `AirplaneParser.plane_selector()` took on the last snapshot (`process_time[1]` includes this) """
 runtime_sizes: list[int] = [0, 0, 0]
 """ Actual debug info: [dump1090 json size, total data processed, api data transferred] bytes """
 dump1090_json_age: list[float] = [0., 0.]
@@ -1059,7 +1201,7 @@ If `determined_time_offset` is able to be calculated, readouts (Interactive disp
 but the values in this list will remain unmodified. """
 lockstep_corrector: float = 0.
 """ Time in seconds to correct drift between this script's loop and the update of the dump1090 json.
-Controlled by `synchronizer()` """
+Controlled by `synchronizer()`. Unused when `json_watcher` is active. """
 determined_time_offset: float = 0.
 """ Derived difference in time between this running instance and the dump1090 instance. Controlled by `synchonizer()` """
 display_fps: float = 0.
@@ -1071,6 +1213,9 @@ database_stats: list = [0, 0, 0, 0., 0.]
 [Total queries, queries with no result, failed queries, average response time (ms), last response time (ms)] """
 database_ver: str | None = None
 """ Current version of the database. None if there's no connection to the database. """
+synchronizer_estimates: dict | None = None
+""" What `synchronizer` has worked out about the timing of the dump1090 json once it's past Phase 1.
+Saved in the warm-start snapshot; if this was restored from one at startup, `synchronizer` skips Phase 1. """
 resource_usage: list = [0., 0., None]
 """ [CPU (normalized) and memory usage (MiB) of this running process, along with CPU temp (None if not available)] """
 determination_symphony: int = 0
@@ -1150,10 +1295,18 @@ def cleanup() -> None:
     # shutdown all threads
     dispatcher.send(message='', signal=END_THREADS, sender=sigterm_handler)
     if USING_THREADPOOL: data_threadpool.shutdown(wait=False, cancel_futures=True)
+    io_workers.shutdown(wait=False, cancel_futures=True)
     session.close()
     if API_KEY: API_session.close()
+    if json_watcher is not None: json_watcher.close()
+    if aircraft_stream is not None: aircraft_stream.close()
+    if snapshot_recorder is not None:
+        snapshot_recorder.close()
+        main_logger.info(f"Recorded {snapshot_recorder.snapshots} snapshot(s) to \'{RECORD_FILE}\'")
+    if snapshot_player is not None: snapshot_player.close()
     # final cleanup
     flyby_stats()
+    write_warm_start()
     if DATABASE_CONNECTED: db.close()
     if API_cache_present: api_cache.close()
     if is_posix:
@@ -1196,9 +1349,7 @@ def register_signal_handler(loop, handler, signal, sender) -> None:
 
 def schedule_thread() -> None:
     """ Our schedule runner """
-    while True:
-        main_scheduler.run_pending()
-        time.sleep(1)
+    main_scheduler.run_forever()
 
 def cls() -> None:
     """ Clear the console when using a terminal """
@@ -1409,7 +1560,7 @@ def freeze_frame_packet(packet: dict, show_distance: bool) -> None:
                     f" | RSSI: {packet['RSSI']} dBFS ({packet['Source']})"
                     )
 
-def extract_API_results(API_results: list, ID: str, no_trigger=True) -> dict | None:
+def extract_API_results(API_results: tuple, ID: str, no_trigger=True) -> dict | None:
     """ Extract the API result corresponding to the given `ID` and with a
     timestamp no older than `FLYBY_STALENESS`.
     Returns `None` if no match, encounters some kind of error, or `ID`
@@ -1418,28 +1569,20 @@ def extract_API_results(API_results: list, ID: str, no_trigger=True) -> dict | N
     if not ID:
         return None
     reference_time = time.monotonic()
-    try:
-        for result_ in reversed(API_results):
-            if result_ is not None and ID == result_['ID']:
-                if (reference_time - result_['APIAccessed'] < (FLYBY_STALENESS * 60)):
-                    return result_
-                else: # don't use stale API results
-                    # force the API fetcher to refresh the result
-                    # see the "Thread Signaling Layout" docstring on how this is handled
-                    if not api_limiter_reached() and not no_trigger:
-                        dispatcher.send(message='', signal=FORCE_REFRESH_API, sender=extract_API_results)
-                        main_logger.debug("Encountered stale API result for "
-                                    f"\'{ID}\', triggering API fetcher.")
-                    return None
-            elif result_ is None:
+    for result_ in reversed(API_results):
+        if result_ is None:
+            return None
+        if ID == result_['ID']:
+            if (reference_time - result_['APIAccessed'] < (FLYBY_STALENESS * 60)):
+                return result_
+            else: # don't use stale API results
+                # force the API fetcher to refresh the result
+                # see the "Thread Signaling Layout" docstring on how this is handled
+                if not api_limiter_reached() and not no_trigger:
+                    dispatcher.send(message='', signal=FORCE_REFRESH_API, sender=extract_API_results)
+                    main_logger.debug("Encountered stale API result for "
+                                f"\'{ID}\', triggering API fetcher.")
                 return None
-    except Exception as e:
-        # very rare times the deque mutates during iteration and throws a RuntimeError.
-        # Don't want to bother with locks and stuff so we just try again when this is run
-        # at next loop
-        if VERBOSE_MODE:
-            main_logger.exception(f"{e}")
-        return None
     return None
 
 def clock_center_cycler() -> None:
@@ -1528,6 +1671,7 @@ def probe1090() -> tuple[str | None, str | None]:
             if Path(json_1090, "aircraft.json").is_file():
                 USING_FILESYSTEM = True
                 main_logger.info("A local working dump1090 instance was found running on this system.")
+                probe_bincraft(json_1090, True)
                 return json_1090 + '/aircraft.json', json_1090
         main_logger.debug("No local running instance of dump1090 present on the system, falling back to using the network.")
 
@@ -1546,11 +1690,57 @@ def probe1090() -> tuple[str | None, str | None]:
         try:
             test1 = requests.get(f"{json_1090}/data/aircraft.json", headers=USER_AGENT, timeout=0.5)
             test1.raise_for_status()
+            probe_bincraft(json_1090 + '/data', False)
             return json_1090 + '/data/aircraft.json', json_1090
         except Exception:
             continue
     return None, None
 
+def probe_bincraft(location: str, is_local: bool) -> None:
+    """ Check if readsb is also writing binCraft data next to the json at `location` (a directory or base URL)
+    and if it decodes to the same thing as the json. If so, `DUMP1090_BINCRAFT` is set and it will be used instead.
+    Locally, the uncompressed file is preferred (nothing to transfer); over the network, the zstd version is preferred.
+    binCraft is only worth it over the network (it's a fraction of the size) or when orjson isn't available
+    (decoding it is faster than the standard json module, but not orjson), and not when the json has something
+    binCraft leaves out that we need (see `utilities/bincraft.py`). """
+    global DUMP1090_BINCRAFT
+    DUMP1090_BINCRAFT = None
+    if is_local and ORJSON_IMPORTED:
+        main_logger.debug("Not checking for binCraft data; reading the local json with orjson is just as fast.")
+        return
+    # UAT aircraft are only marked as such in the json
+    required = ['uat_version']
+    if not DATABASE_FILE.exists():
+        # without our own database, the aircraft details come from readsb's
+        required.extend(('desc', 'ownOp', 'year'))
+    candidates = ["aircraft.binCraft.zst", "aircraft.binCraft"]
+    if is_local:
+        candidates.reverse()
+    if not bincraft.ZSTD_IMPORTED:
+        candidates.remove("aircraft.binCraft.zst")
+
+    def fetch(name: str) -> bytes:
+        if is_local:
+            with open(Path(location, name), 'rb') as f:
+                return f.read()
+        req = requests.get(f"{location}/{name}", headers=USER_AGENT, timeout=0.5)
+        req.raise_for_status()
+        return req.content
+
+    for candidate in candidates:
+        try:
+            bincraft_data = bincraft.decode(fetch(candidate), compressed=candidate.endswith('.zst'))
+            json_data = json.loads(fetch("aircraft.json"))
+        except Exception:
+            continue
+        if not bincraft.matches_json(bincraft_data, json_data, required):
+            main_logger.info(f"Found \'{candidate}\' but it's missing data the json has or doesn't match it. "
+                             "Using the json instead.")
+            return
+        DUMP1090_BINCRAFT = f"{location}/{candidate}"
+        main_logger.info(f"readsb binCraft data is available, using \'{candidate}\' instead of the json.")
+        return
+
 def probe978() -> str | None:
     """ Check if dump978 exists and returns its `URL` or None if not found.
     Will also set `USING_FILESYSTEM_978` when it detects a local dump978 setup. """
@@ -1661,7 +1851,7 @@ def dump978_check() -> None:
 def read_1090_config() -> None:
     """ Gets us our location (if it's configured) and what ADS-B decoder we're attached to. """
     global rlat, rlon, dump1090_receiver_version, is_readsb, LOCATION_IS_SET
-    if not DUMP1090_IS_AVAILABLE: return
+    if not DUMP1090_IS_AVAILABLE or snapshot_player is not None: return
     try:
         if USING_FILESYSTEM:
             with open(Path(URL, "receiver.json"), 'rb') as receiver_file:
@@ -1692,11 +1882,14 @@ def read_1090_config() -> None:
             if receiver['lat'] != rlat_last or receiver['lon'] != rlon_last:
                 rlat = float(receiver['lat'])
                 rlon = float(receiver['lon'])
+                build_location_boxes()
+                aircraft_state.clear() # cached distances are no longer valid
                 main_logger.info("Location updated.")
                 main_logger.debug(f">>> ({rlat}, {rlon})")
         else:
             rlat = rlon = None
             LOCATION_IS_SET = False
+            build_location_boxes()
             main_logger.warning("Location has not been set! "
                                 "This program will not be able to determine any nearby aircraft or calculate range!")
             main_logger.warning(">>> Please set location in dump1090 to disable this message.")
@@ -1704,6 +1897,42 @@ def read_1090_config() -> None:
     except Exception:
         main_logger.error("Cannot load receiver config.")
 
+def build_location_boxes() -> None:
+    """ Work out `location_boxes` for the current location, `RANGE`, and `BEYOND_LOS_LIMIT`.
+    An aircraft outside of the first box is guaranteed to be farther than `RANGE`, and one inside of the second box
+    is guaranteed to be closer than `BEYOND_LOS_LIMIT`, so for anything between the two there's no need to know
+    exactly how far away it is. Needs to be run again whenever the location changes. """
+    global location_boxes
+    if rlat is None or rlon is None:
+        location_boxes = None
+        return
+    # work in angles on the same sphere `greatcircle()` uses; these match how the distances are compared in `dump1090_loop()`
+    range_angle = min((RANGE / distance_multiplier) / 3440, math.pi)
+    los_angle = min((BEYOND_LOS_LIMIT / (distance_multiplier ** 2)) / 3440, math.pi / 2)
+    lat0 = math.radians(abs(rlat))
+
+    # outside: anything this far off in latitude is beyond range, and anything within that band of latitudes
+    # is at least asin(cos(lat) * sin(delta lon)) away (its distance to our meridian)
+    range_lat = range_angle * 1.001
+    poleward = lat0 + range_lat
+    if poleward >= math.pi / 2 or math.sin(range_angle) >= math.cos(poleward):
+        range_lon = math.pi # near the poles or a huge range; only use the latitude check
+    else:
+        range_lon = math.asin(math.sin(range_angle) / math.cos(poleward)) * 1.001
+
+    # inside: cos(distance) = cos(delta lat) - cos(lat0) * cos(lat) * (1 - cos(delta lon)), so as long as
+    # that stays above cos(los_angle) at the corners of the box, everything inside is within the limit
+    los_lat = los_angle / math.sqrt(2)
+    equatorward = max(lat0 - los_lat, 0)
+    margin = (math.cos(los_lat) - math.cos(los_angle)) / (math.cos(lat0) * math.cos(equatorward))
+    los_lon = math.acos(max(1 - margin, -1)) * 0.999
+    location_boxes = (
+        math.degrees(range_lat),
+        math.degrees(range_lon),
+        math.degrees(los_lat) * 0.999,
+        math.degrees(los_lon),
+    )
+
 def probe_API() -> tuple[int | None, float | None]:
     """ Checks if the provided API Key is valid, and if it is, pulls stats from the last 30 days.
     This specific query doesn't use API credits according to the API reference. It does however increment
@@ -1751,8 +1980,8 @@ def configuration_check() -> None:
     global CLOCK_CENTER_ROW, CLOCK_CENTER_ENABLED, CLOCK_CENTER_ROW_2ROWS
     global LED_PWM_BITS, SCROLLING_SPEED
     global UNITS_WX, OPENWEATHER_API_KEY
-    global IGNORE_AIRCRAFT_ICAOS
-    global database_lookup_cache, focus_plane_api_results, plane_latch_times
+    global IGNORE_AIRCRAFT_ICAOS, DUMP1090_STREAM
+    global focus_plane_api_results, plane_latch_times
 
     def switchtime_calc(num: float) -> tuple[int]:
         """ Given an input site radius, outputs a tuple
@@ -1935,12 +2164,13 @@ def configuration_check() -> None:
 
     # adjust our caches
     if NOFILTER_MODE:
-        database_lookup_cache = deque([{}] * 10000, maxlen=10000)
-        main_logger.debug("Database lookup cache expanded to 10000 entries")
+        aircraft_cache.resize(10000)
+        operator_cache.resize(10000)
+        main_logger.debug("Aircraft and operator lookup caches expanded to 10000 entries")
     if FLYBY_STALENESS > 60:
         deque_size_hr = 500 # baseline limit, ~500 queries/hr
         deque_size = int(round(FLYBY_STALENESS / 60, 1) * deque_size_hr)
-        focus_plane_api_results = deque([None] * deque_size, maxlen=deque_size)
+        focus_plane_api_results = (None,) * deque_size
         main_logger.debug(f"API results cache sized to {deque_size} entries")
 
     if FOLLOW_THIS_AIRCRAFT:
@@ -2020,6 +2250,10 @@ def configuration_check() -> None:
     if not WRITE_STATE:
         main_logger.info("FlightGazer will not write its state to a file.")
 
+    if DUMP1090_STREAM and not isinstance(DUMP1090_STREAM, str):
+        main_logger.warning("DUMP1090_STREAM is not a string in the form of host:port. Ignoring.")
+        DUMP1090_STREAM = ''
+
     if OPENWEATHER_API_KEY and not isinstance(OPENWEATHER_API_KEY, str):
         main_logger.warning("Provided OpenWeatherMap API key is not a string. Weather data will be unavailable.")
         OPENWEATHER_API_KEY = ''
@@ -2129,6 +2363,7 @@ def read_receiver_stats() -> None:
     Needs to run on its own thread as its timing does not depend on `LOOP_INTERVAL`. """
     # inspired by https://github.com/wiedehopf/graphs1090/blob/master/dump1090.py
     if not DUMP1090_IS_AVAILABLE: return # don't start this thread if, only at startup, dump1090 is unavailable
+    if snapshot_player is not None: return # there's no receiver when replaying
     global receiver_stats
     global is_airspy
 
@@ -2323,7 +2558,7 @@ def perf_monitoring() -> None:
 def aircraft_db_checker() -> None:
     """ Function that checks the aircraft database periodically
     (assumed to be run from the scheduler) """
-    global database_ver, database_stats, database_lookup_cache
+    global database_ver, database_stats
     if DATABASE_CONNECTED:
         _ = db.connect()
         old_db_ver = database_ver
@@ -2334,9 +2569,9 @@ def aircraft_db_checker() -> None:
             database_stats[2] = db.query_errors
             database_stats[3] = db.average_speed
             database_stats[4] = db.last_access_speed
-            # totally not confusing in any way
-            database_lookup_cache.clear()
-            database_lookup.cache_clear()
+            # the only time what's been looked up before is no longer valid
+            aircraft_cache.clear()
+            aircraft_state.clear()
 
 # =========== Program Setup III ============
 # ===========( Core Functions )=============
@@ -2366,6 +2601,8 @@ def aircraft_db_checker() -> None:
     - NOFILTER_MODE is False         | set only on startup
     - api_limiter_reached() is False | can change during runtime
     - ENHANCED_READOUT is False      | can change during runtime
+    APIFetcher has no thread of its own: signals to it are queued and run
+    one at a time on `io_workers`, which the scheduled weather updates share.
 
 2 = Always runs, unless: NODISPLAY_MODE is True or DISPLAY_IS_VALID is False
     - NODISPLAY_MODE   | set only on startup
@@ -2520,6 +2757,7 @@ def runtime_accumulators_reset() -> None:
 
     # do the actual reset
     unique_planes_seen.clear()
+    flyby_index.clear()
     for i in range(len(api_hits)):
         api_hits[i] = 0
     if API_daily_limit_reached:
@@ -2645,6 +2883,7 @@ def flyby_stats() -> None:
                 estimated_api_cost = API_COST_PER_CALL * (api_hits[0] + api_hits[2])
                 for i in range(planes_seen):
                     # fill the set with filler values, we don't recall the last contents of `unique_planes_seen`
+                    # (these aren't added to `flyby_index` as they don't belong to any plane)
                     unique_planes_seen.append(
                         {
                             "ID": i+1,
@@ -2677,6 +2916,85 @@ def flyby_stats() -> None:
         except Exception:
             main_logger.error(f"Cannot write to \'{FLYBY_STATS_FILE}\'. Data for {date_now_str} has been lost.")
 
+def write_warm_start() -> None:
+    """ Save what FlightGazer has built up while running to `WARM_START_FILE` so that a restart (such as after an update)
+    can carry on instead of starting cold. See `load_warm_start()` for what's in it.
+    Run periodically by the scheduler and on shutdown. Not done when replaying a recording. """
+    if REPLAY_FILE:
+        return
+    start = time.perf_counter()
+    sections = {
+        'date': datetime.datetime.now().strftime('%Y-%m-%d'),
+        'flybys': [[entry['ID'], entry['Time'], entry['Flyby']] for entry in list(unique_planes_seen)],
+        'approach_rates': relevant_planes_approach_rate_tracking.dump(),
+        'database_version': database_ver,
+        'aircraft_cache': aircraft_cache.dump(),
+        'operators_version': operators_version,
+        'operator_cache': operator_cache.dump(),
+        'synchronizer': synchronizer_estimates,
+    }
+    try:
+        size = warm_start.save(WARM_START_FILE, sections)
+        main_logger.debug(f"Wrote warm-start snapshot ({size / 1024:.1f} KiB) "
+                          f"in {(time.perf_counter() - start) * 1000:.3f} ms")
+    except (OSError, TypeError, ValueError) as e:
+        main_logger.warning(f"Could not write warm-start snapshot to \'{WARM_START_FILE}\' ({e})")
+
+def load_warm_start() -> None:
+    """ Pick back up from the snapshot made by `write_warm_start()` if it's from the last day. Restores:
+    - today's flybys, with their actual IDs (replacing the placeholders `flyby_stats()` fills in at startup)
+    - the approach rate history
+    - the aircraft lookup cache, if the database version hasn't changed
+    - the operator lookup cache, if `operators.py` hasn't been regenerated since (needs its `GENERATED` timestamp)
+    - `synchronizer_estimates`, if the snapshot is less than an hour old and for the same dump1090 json and `LOOP_INTERVAL`
+    Must be run after the database is connected and before the main loop starts. Not done when replaying a recording. """
+    global synchronizer_estimates
+    if REPLAY_FILE:
+        return # replays always start cold so that they're repeatable
+    start = time.perf_counter()
+    try:
+        sections, age, shift = warm_start.load(WARM_START_FILE, max_age=86400)
+    except FileNotFoundError:
+        main_logger.debug("No warm-start snapshot present.")
+        return
+    except (OSError, ValueError) as e:
+        main_logger.warning(f"Could not load warm-start snapshot \'{WARM_START_FILE}\' ({e})")
+        return
+    restored = []
+    try:
+        flybys = sections.get('flybys') or []
+        if (
+            sections.get('date') == datetime.datetime.now().strftime('%Y-%m-%d')
+            and len(flybys) >= len(unique_planes_seen)
+        ):
+            entries = [{"ID": plane_id, "Time": seen + shift, "Flyby": flyby} for plane_id, seen, flyby in flybys]
+            unique_planes_seen[:] = entries
+            flyby_index.clear()
+            for entry in entries:
+                if isinstance(entry['ID'], str): # placeholders from `flyby_stats()` are numbers
+                    flyby_index[entry['ID']] = entry
+            restored.append(f"{len(entries)} flybys")
+        if (approach_rates := sections.get('approach_rates')) and not NOFILTER_MODE:
+            relevant_planes_approach_rate_tracking.restore(approach_rates, shift)
+            restored.append("approach rate history")
+        if DATABASE_CONNECTED and sections.get('database_version') == database_ver:
+            restored.append(f"{aircraft_cache.restore(sections.get('aircraft_cache') or [], shift)} cached aircraft")
+        if operators_version is not None and sections.get('operators_version') == operators_version:
+            restored.append(f"{operator_cache.restore(sections.get('operator_cache') or [], shift)} cached operators")
+        if (
+            (estimates := sections.get('synchronizer'))
+            and age < 3600
+            and estimates.get('source') == DUMP1090_JSON
+            and estimates.get('loop_interval') == LOOP_INTERVAL
+        ):
+            synchronizer_estimates = estimates
+            restored.append("json timing estimates")
+    except (KeyError, TypeError, ValueError) as e:
+        main_logger.warning(f"Warm-start snapshot \'{WARM_START_FILE}\' is malformed, "
+                            f"only partially restored. ({e})")
+    main_logger.info(f"Restored from warm-start snapshot ({timedelta_clean(age)} old) "
+                     f"in {(time.perf_counter() - start) * 1000:.1f} ms: {', '.join(restored) or 'nothing applicable'}")
+
 class PrintToConsole:
     """ Our print-to-console routine when Interactive mode is enabled (should be most of the time) """
 
@@ -2693,8 +3011,7 @@ class PrintToConsole:
     def print_to_console(self, message) -> None:
         """ Do the printing """
         if not INTERACTIVE:
-            # trigger `WriteState`
-            dispatcher.send(message='', signal=LOOP_WORK_COMPLETE, sender=PrintToConsole.print_to_console)
+            self.work_complete()
             return
         global process_time2
         print_time_start = time.perf_counter()
@@ -2825,45 +3142,45 @@ class PrintToConsole:
                 print_info.append(rst)
                 # algorithm indicators
                 if not NOFILTER_MODE:
-                    if focus_plane == aircraft['ID']:
+                    if focus_plane == aircraft.ID:
                         if not selection_override:
                             print_info.append(white_highlight)
                         else:
                             print_info.append(yellow_warning)
                     if focus_plane_ids_discard:
-                        if aircraft['ID'] in focus_plane_ids_discard:
+                        if aircraft.ID in focus_plane_ids_discard:
                             print_info.append(italic)
-                if aircraft['Distressed']:
+                if aircraft.Distressed:
                     # this overrides the above colors
                     print_info.append(red_warning)
 
-                if FOLLOW_THIS_AIRCRAFT == aircraft['ID']:
+                if FOLLOW_THIS_AIRCRAFT == aircraft.ID:
                     print_info.append("--> ")
 
                 # counter, callsign, iso, id
-                print_info.append(f"[{aircraft['Flyby']:03d}] ")
-                print_info.append(f"{aircraft['Flight']}".ljust(8))
-                print_info.append(f" ({aircraft['Country']}, ")
-                print_info.append(f"{aircraft['ID']}".ljust(6))
+                print_info.append(f"[{aircraft.Flyby:03d}] ")
+                print_info.append(f"{aircraft.Flight}".ljust(8))
+                print_info.append(f" ({aircraft.Country}, ")
+                print_info.append(f"{aircraft.ID}".ljust(6))
                 print_info.append(")")
                 # this works even in NO_FILTER mode
-                if aircraft['Distressed']:
+                if aircraft.Distressed:
                     print_info.append(" ***EMERGENCY*** ")
                 print_info.append(" | ")
 
                 # speed section
                 print_info.append("SPD: ")
                 if altitude_multiplier != 1:
-                    print_info.append(f"{aircraft['Speed']:.1f}".rjust(6))
+                    print_info.append(f"{aircraft.Speed:.1f}".rjust(6))
                 else:
-                    print_info.append(f"{aircraft['Speed']:.1f}".rjust(5))
+                    print_info.append(f"{aircraft.Speed:.1f}".rjust(5))
                 print_info.append(f"{speed_unit} @ ")
-                print_info.append(f"{aircraft['Track']:.1f}°".rjust(6))
+                print_info.append(f"{aircraft.Track:.1f}°".rjust(6))
                 print_info.append(" | ")
                 # altitude section
                 print_info.append("ALT: ")
-                alt_i = aircraft['Altitude']
-                if alt_i == 0 and aircraft['OnGround']:
+                alt_i = aircraft.Altitude
+                if alt_i == 0 and aircraft.OnGround:
                     # "ALT: 40000.0ft, "
                     # "ALT:    Ground, "
                     print_info.append(f"".rjust(len(altitude_unit) + 1))
@@ -2871,74 +3188,74 @@ class PrintToConsole:
                 else:
                     print_info.append(f"{alt_i:.1f}".rjust(7))
                     print_info.append(f"{altitude_unit}, ")
-                print_info.append(f"{aircraft['VertSpeed']:.1f}".rjust(7))
+                print_info.append(f"{aircraft.VertSpeed:.1f}".rjust(7))
                 print_info.append(f"{vert_speed_unit}, ")
-                print_info.append(f"{aircraft['Elevation']:.2f}°".rjust(6))
+                print_info.append(f"{aircraft.Elevation:.2f}°".rjust(6))
                 print_info.append(" | ")
                 # distance section
-                print_info.append(f"DIST: {aircraft['Direction']}")
-                print_info.append(f"{aircraft['Distance']:.2f}".rjust(6))
-                if aircraft['NavigationAccuracy'] and aircraft['NavigationAccuracy'] <= 3:
+                print_info.append(f"DIST: {aircraft.Direction}")
+                print_info.append(f"{aircraft.Distance:.2f}".rjust(6))
+                if aircraft.NavigationAccuracy and aircraft.NavigationAccuracy <= 3:
                     print_info.append("?")
                 print_info.append(f"{distance_unit} ")
                 print_info.append("LOS")
-                print_info.append(f"{aircraft['SlantRange']:.2f}".rjust(6))
+                print_info.append(f"{aircraft.SlantRange:.2f}".rjust(6))
                 print_info.append(f"{distance_unit} ")
                 # handle very rare edge case when there's no position data (occurs in NO_FILTER mode)
-                if aircraft['Latitude'] and aircraft['Longitude']:
+                if aircraft.Latitude and aircraft.Longitude:
                     print_info.append(
-                        (f"({aircraft['Latitude']:.3f}, "
-                        f"{aircraft['Longitude']:.3f})").ljust(16)
+                        (f"({aircraft.Latitude:.3f}, "
+                        f"{aircraft.Longitude:.3f})").ljust(16)
                     )
                 else:
                     print_info.append("None".ljust(16))
                 print_info.append(" | ")
                 # last section
                 print_info.append("RSSI: ")
-                print_info.append(f"{aircraft['RSSI']}".rjust(5))
+                print_info.append(f"{aircraft.RSSI}".rjust(5))
                 print_info.append("dBFS")
-                if aircraft['Source'] == 'UAT':
+                if aircraft.Source == 'UAT':
                     print_info.append(" (UAT)")
                 if VERBOSE_MODE:
                     print_info.append(" | AGE: ")
-                    print_info.append(f"{aircraft['Staleness']:.1f}".rjust(4))
+                    print_info.append(f"{aircraft.Staleness:.1f}".rjust(4))
                     print_info.append("s")
                     if not NOFILTER_MODE: # print info the selection algorithm uses
                         print_info.append(" | A-RATE: ")
-                        print_info.append(f"{aircraft['ApproachRate']:.3f}".rjust(8))
+                        print_info.append(f"{aircraft.ApproachRate:.3f}".rjust(8))
                         print_info.append(f"{speed_unit}")
                         print_info.append(" | NEXT POS: ")
-                        if aircraft['FutureLatitude'] and aircraft['FutureLongitude']: # these can be None
-                            print_info.append((f"({aircraft['FutureLatitude']:.6f}, "
-                                               f"{aircraft['FutureLongitude']:.6f}) ").rjust(25))
+                        if aircraft.FutureLatitude and aircraft.FutureLongitude: # these can be None
+                            print_info.append((f"({aircraft.FutureLatitude:.6f}, "
+                                               f"{aircraft.FutureLongitude:.6f}) ").rjust(25))
                             print_info.append("- ")
-                            print_info.append(f"{aircraft['FutureDistance']:.4f}".rjust(7))
+                            print_info.append(f"{aircraft.FutureDistance:.4f}".rjust(7))
                             print_info.append(f"{distance_unit}")
                         else:
                             print_info.append(" < Could not be calculated >")
-                    print_info.append(f" | PRI: {aircraft['Priority']:02d}")
-                    if aircraft['Registration'] is not None:
+                    print_info.append(f" | PRI: {aircraft.Priority:02d}")
+                    if aircraft.Registration is not None:
                         # longest registrations are from Panama & Laos, at 10 char
-                        print_info.append(f" | REG: {aircraft['Registration'].ljust(10)}")
+                        print_info.append(f" | REG: {aircraft.Registration.ljust(10)}")
                     else:
                         print_info.append(" | REG: Unknown   ")
-                    print_info.append(f" | SQWK: {aircraft['Squawk']}")
+                    print_info.append(f" | SQWK: {aircraft.Squawk}")
                 # append operator info and aircraft type
-                if aircraft['Operator']:
-                    print_info.append(f" | {aircraft['Operator']}")
-                    if aircraft['OperatorAKA']:
-                        print_info.append(f" (a.k.a. \'{aircraft['OperatorAKA']}\')")
-                    if aircraft['Telephony']:
-                        print_info.append(f" - \"{aircraft['Telephony']}\"")
-                    if aircraft['TrackingFlag'] != "None":
-                        print_info.append(f" ({aircraft['TrackingFlag']} aircraft)")
+                if aircraft.Operator:
+                    print_info.append(f" | {aircraft.Operator}")
+                    if aircraft.OperatorAKA:
+                        print_info.append(f" (a.k.a. \'{aircraft.OperatorAKA}\')")
+                    if aircraft.Telephony:
+                        print_info.append(f" - \"{aircraft.Telephony}\"")
+                    if aircraft.TrackingFlag != "None":
+                        print_info.append(f" ({aircraft.TrackingFlag} aircraft)")
                 else:
-                    if aircraft['Owner']:
-                        print_info.append(f" | {aircraft['Owner']}")
-                        if aircraft['TrackingFlag'] != "None":
-                            print_info.append(f" ({aircraft['TrackingFlag']} aircraft)")
+                    if aircraft.Owner:
+                        print_info.append(f" | {aircraft.Owner}")
+                        if aircraft.TrackingFlag != "None":
+                            print_info.append(f" ({aircraft.TrackingFlag} aircraft)")
                     else:
-                        match aircraft['TrackingFlag']:
+                        match aircraft.TrackingFlag:
                             case "None":
                                 print_info.append(" | Private/Unknown")
                             case "LADD":
@@ -2947,18 +3264,18 @@ class PrintToConsole:
                                 print_info.append(" | Military aircraft")
                             case _: # note, PIA aircraft are not handled here because they always have an Operator (callsign)
                                 print_info.append(" | Other kind of aircraft")
-                if aircraft['AircraftDesc']:
-                    print_info.append(f" | {aircraft['AircraftDesc']} (Type: {aircraft['ICAOType']}")
-                    if aircraft['CategoryDesc'] != 'None':
-                        print_info.append(f", {aircraft['CategoryDesc']})")
+                if aircraft.AircraftDesc:
+                    print_info.append(f" | {aircraft.AircraftDesc} (Type: {aircraft.ICAOType}")
+                    if aircraft.CategoryDesc != 'None':
+                        print_info.append(f", {aircraft.CategoryDesc})")
                     else:
                         print_info.append(")")
-                elif not aircraft['AircraftDesc'] and aircraft['ICAOType'] != "None":
-                    print_info.append(f" | Aircraft Type: {aircraft['ICAOType']}")
-                    if aircraft['CategoryDesc'] != 'None':
-                        print_info.append(f" ({aircraft['CategoryDesc']})")
-                elif aircraft['CategoryDesc'] != 'None':
-                    print_info.append(f" | Aircraft Type: {aircraft['CategoryDesc']}")
+                elif not aircraft.AircraftDesc and aircraft.ICAOType != "None":
+                    print_info.append(f" | Aircraft Type: {aircraft.ICAOType}")
+                    if aircraft.CategoryDesc != 'None':
+                        print_info.append(f" ({aircraft.CategoryDesc})")
+                elif aircraft.CategoryDesc != 'None':
+                    print_info.append(f" | Aircraft Type: {aircraft.CategoryDesc}")
 
                 # finally, print it all
                 print_info.append(rst)
@@ -3172,7 +3489,8 @@ class PrintToConsole:
                 verbose_stats.append(f"Last console print {process_time2[0]:.3f} ms | ")
             verbose_stats.append(f"Display formatting {process_time2[1]:.3f} ms | ")
             verbose_stats.append(f"json parsing {process_time2[2]:.3f} ms | ")
-            verbose_stats.append(f"Filtering+algorithm {process_time[1]:.3f} ms")
+            verbose_stats.append(f"Filtering+algorithm {process_time[1]:.3f} ms | ")
+            verbose_stats.append(f"Loop to output {tick_latency:.3f} ms")
             print("".join(verbose_stats))
 
         # process info line
@@ -3227,6 +3545,7 @@ class PrintToConsole:
                 f"Total queries: {database_stats[0]}, empty results: {database_stats[1]},"
                 f" errors: {database_stats[2]} | Retrieval times:"
                 f" {database_stats[3]:.3f} ms avg, {database_stats[4]:.3f} ms last"
+                f" | Cache: {len(aircraft_cache)} aircraft, {aircraft_cache.stats()['hit_rate']:.1%} hit rate"
             )
 
         # verbose stats line 5 (API results cache)
@@ -3258,12 +3577,16 @@ class PrintToConsole:
                   f"Closing this window will uncleanly terminate FlightGazer.{rst}", flush=True)
 
         process_time2[0] = round((time.perf_counter() - print_time_start)*1000, 3)
+        self.work_complete()
+
+    def work_complete(self) -> None:
+        """ The end of the work chain for this snapshot; note how long it took and trigger `WriteState` """
+        global tick_latency
+        if loop_snapshot.started:
+            tick_latency = round((time.perf_counter() - loop_snapshot.started) * 1000, 3)
         dispatcher.send(message='', signal=LOOP_WORK_COMPLETE, sender=PrintToConsole.print_to_console)
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
@@ -3276,51 +3599,29 @@ def main_loop_generator() -> None:
     Includes all other sub-functions necessary to retrieve, parse, filter, and track the data. """
 
     def flyby_tracker(input_ID: str) -> None:
-        """ Adds given plane ID to `unique_planes_seen` list. """
-        global unique_planes_seen
-        def add_entry() -> None:
-            unique_planes_seen.append(
-                {
-                "ID": input_ID,
-                "Time": time.monotonic(),
-                "Flyby": len(unique_planes_seen) + 1
-                }
-            )
-        stale_age = FLYBY_STALENESS * 60 # seconds
+        """ Adds given plane ID to `unique_planes_seen` list (and `flyby_index`)
+        if we haven't seen it within `FLYBY_STALENESS`. """
         time_now = time.monotonic()
-
-        # special case when there aren't any entries yet
-        if len(unique_planes_seen) == 0:
-            add_entry()
-            return
-
-        for entry in reversed(unique_planes_seen):
-            # search backwards through list
-            if entry['ID'] == input_ID:
-                if (time_now - entry['Time']) < stale_age:
-                    # Programmer's note: if you want to update the
-                    # timestamp for this flyby you'll need to update the
-                    # dict at the list index using this:
-                    # def enumerate_reversed(iter):
-                    #     for index in range(len(iter) -1, -1, -1):
-                    #         yield (index, iter[index])
-                    # and do:
-                    # for index, entry in enumerate_reversed(unique_planes_seen):
-                    #   unique_planes_seen[index]['Time'] = time.monotonic()
-                    #
-                    # However, this is 2-3x as slow.
-                    return # if we recently have seen this plane
-                else:
-                    add_entry()
-                    return
-        # finally, if we don't find the entry, add a new one
-        add_entry()
+        # `flyby_index` always points to the most recent entry for this plane
+        if (
+            (entry := flyby_index.get(input_ID)) is not None
+            and (time_now - entry['Time']) < FLYBY_STALENESS * 60
+        ):
+            # Programmer's note: if you want to update the timestamp for this flyby,
+            # `entry['Time'] = time_now` is all that's needed since it's the same dict as the one in the list.
+            return # if we recently have seen this plane
+        entry = {
+            "ID": input_ID,
+            "Time": time_now,
+            "Flyby": len(unique_planes_seen) + 1
+        }
+        unique_planes_seen.append(entry)
+        flyby_index[input_ID] = entry
 
     def flyby_extractor(input_ID: str) -> int:
         """ Find the "flyby" number associated with a plane's ID. """
-        for entry in reversed(unique_planes_seen):
-            if entry['ID'] == input_ID:
-                return entry['Flyby']
+        if (entry := flyby_index.get(input_ID)) is not None:
+            return entry['Flyby']
         return 0
 
     def relative_direction(**kwargs) -> tuple[str, float]:
@@ -3422,6 +3723,121 @@ def main_loop_generator() -> None:
         lon1_deg = (math.degrees(lon1) + 540) % 360 - 180  # normalize
         return lat1_deg, lon1_deg
 
+    def outside_range(lat: float, lon: float) -> bool:
+        """ True if the position is definitely farther than `RANGE` but definitely closer than `BEYOND_LOS_LIMIT`,
+        going by `location_boxes`. Much cheaper than `greatcircle()`. """
+        range_lat, range_lon, los_lat, los_lon = location_boxes
+        d_lat = abs(lat - rlat)
+        d_lon = abs(lon - rlon)
+        if d_lon > 180:
+            d_lon = 360 - d_lon
+        return (d_lat > range_lat or d_lon > range_lon) and d_lat < los_lat and d_lon < los_lon
+
+    def farthest_distances(positions: list[tuple[float, float]]) -> list[float]:
+        """ For positions we skipped the distance math on, we still need to know the farthest one for the `Range` stat.
+        Rank them by a flat-earth estimate, then only calculate the real distance for the ones that could be the farthest. """
+        estimates = []
+        for lat, lon in positions:
+            d_lon = abs(lon - rlon)
+            if d_lon > 180:
+                d_lon = 360 - d_lon
+            d_lon *= math.cos((lat + rlat) * math.pi / 360)
+            estimates.append((lat - rlat) ** 2 + d_lon ** 2)
+        # the estimate is well within 5% of the real distance at these scales (0.95^2 ~= 0.9)
+        cutoff = max(estimates) * 0.9
+        return [
+            greatcircle(rlat, rlon, lat, lon)
+            for (lat, lon), estimate in zip(positions, estimates)
+            if estimate >= cutoff
+        ]
+
+    AIRCRAFT_STATE_TTL: int = 600
+    """ Seconds an aircraft can go without being relevant before its entry in `aircraft_state` is dropped. """
+    aircraft_state_pruned: float = 0.
+
+    def new_aircraft_state(hex_: str) -> dict:
+        """ Look up everything about a plane that doesn't change while it's in view. See `aircraft_state`. """
+        return {
+            'Seen': 0.,
+            'Country': getICAO(hex_).upper(),
+            'Registration': reg_lookup(hex_),
+            'Database': None, # filled in by `dump1090_loop()`, which looks these up for all new planes at once
+            'Callsign': None,
+            'Operator': (None, None, None), # (Operator, Telephony, OperatorAKA)
+            'Position': None,
+            'Distance': 0.,
+            'GeometryKey': None,
+            'Geometry': None, # (Direction, DirectionDegrees, Elevation, SlantRange)
+        }
+
+    def prune_aircraft_state(time_now: float) -> None:
+        """ Drop planes from `aircraft_state` that haven't been relevant for `AIRCRAFT_STATE_TTL` seconds. """
+        nonlocal aircraft_state_pruned
+        aircraft_state_pruned = time_now
+        # other threads may clear `aircraft_state`, so work off of a copy
+        for hex_, state in list(aircraft_state.items()):
+            if time_now - state['Seen'] > AIRCRAFT_STATE_TTL:
+                aircraft_state.pop(hex_, None)
+
+    BATCH_MIN_AIRCRAFT: int = 100
+    """ Snapshots with fewer aircraft than this always use the scalar math. Below this, NumPy's
+    per-call overhead outweighs what it saves (the crossover is around 40-100 aircraft). """
+    batch_geometry_verified: bool = False
+
+    def batch_distances_and_bearings(aircraft: list[dict]) -> tuple[list[float], list[float]]:
+        """ Unrounded distance and direction (in degrees) from our location to every aircraft in the snapshot
+        in one go. Aircraft without a valid position get NaN. Requires `LOCATION_IS_SET`. """
+        lat, lon = batch_geometry.positions(aircraft)
+        return (
+            batch_geometry.greatcircle(rlat, rlon, lat, lon, distance_multiplier).tolist(),
+            batch_geometry.bearing(rlat, rlon, lat, lon).tolist(),
+        )
+
+    def batch_elevation_and_slant(packets: list[AircraftRecord] | list[dict]) -> None:
+        """ Fill in `Elevation` and `SlantRange` for all of the given loop packets in one go
+        based on their `Distance` and `Altitude`. """
+        distances, altitudes = batch_geometry.columns(packets, 'Distance', 'Altitude')
+        elevations, slants = batch_geometry.elevation_and_slant(
+            distances,
+            altitudes,
+            distance_multiplier,
+            altitude_multiplier
+        )
+        for packet, elevation, slant in zip(packets, elevations.tolist(), slants.tolist()):
+            packet['Elevation'] = round(elevation, 6)
+            packet['SlantRange'] = round(slant, 6)
+
+    def verify_batch_geometry(aircraft: list[dict], distances: list[float], bearings: list[float]) -> bool:
+        """ Check the batch results for a snapshot against the scalar functions. Returns `True` if they agree
+        (allowing for the last digit to round differently). """
+        checked = []
+        for a, distance, bearing in zip(aircraft, distances, bearings):
+            lat = a.get('lat')
+            lon = a.get('lon')
+            if lat is None or lon is None or lat == lon == 0:
+                continue
+            scalar_distance = greatcircle(rlat, rlon, lat, lon)
+            if not math.isclose(round(distance, 6), scalar_distance, abs_tol=1e-5):
+                main_logger.debug(f"Batch distance mismatch for {a.get('hex')}: {distance} vs {scalar_distance}")
+                return False
+            scalar_bearing = relative_direction(lat0=rlat, lon0=rlon, lat1=lat, lon1=lon)[1]
+            if abs((relative_direction(rdir=bearing)[1] - scalar_bearing + 180) % 360 - 180) > 0.1:
+                main_logger.debug(f"Batch direction mismatch for {a.get('hex')}: {bearing} vs {scalar_bearing}")
+                return False
+            checked.append({'Distance': scalar_distance, 'Altitude': 10000 * altitude_multiplier})
+        if checked:
+            batch_elevation_and_slant(checked)
+            for packet in checked:
+                scalar_elevation, scalar_slant = elevation_and_slant(packet['Distance'], packet['Altitude'])
+                if (
+                    not math.isclose(packet['Elevation'], scalar_elevation, abs_tol=1e-5)
+                    or not math.isclose(packet['SlantRange'], scalar_slant, abs_tol=1e-5)
+                ):
+                    main_logger.debug(f"Batch elevation/slant mismatch at {packet['Distance']}: "
+                                      f"{packet['Elevation']}, {packet['SlantRange']} vs {scalar_elevation}, {scalar_slant}")
+                    return False
+        return True
+
     priority_lookup: dict = { # this is ordered based on the readsb docs
     'None': 0, # this is for compatibility reasons as not all dump1090 decoders embed a 'type'
     'adsb_icao': 1,
@@ -3464,17 +3880,44 @@ def main_loop_generator() -> None:
     'C0': 'Vehicle or Ground Installation (Unspecified)'
     }
 
+    last_snapshots: dict = {}
+    """ The last raw json we got from each source, alongside its parsed aircraft list, timestamp, and
+    HTTP validators (for conditional requests when polling over the network) so that we can skip
+    reparsing a json that hasn't been rewritten yet.
+    `last_snapshots` = {`source`: (raw bytes, aircraft list, 'now' timestamp, {validator headers})} """
+
     def dump1090_heartbeat() -> list | None:
         """ Checks if dump1090 service is up and returns the parsed json file(s) as a list of nested dictionaries.
         If service is down/times out, returns None. Returned list can be empty (still valid). Most of the processing time occurs here.
         This function is also the most vital for FlightGazer's normal operation (hence, "heartbeat"). """
         if not DUMP1090_IS_AVAILABLE: return None
-        global process_time, process_time2, runtime_sizes
+        global process_time, process_time2, runtime_sizes, replay_start
+
+        def peek_timestamp(raw: bytes) -> float | None:
+            """ Grab the 'now' timestamp from the start of a raw json without deserializing the whole thing
+            (dump1090 and its derivatives always write this key first). Returns `None` if it can't be found. """
+            head = raw[:64]
+            if (key := head.find(b'"now"')) == -1:
+                return None
+            try:
+                return float(head[head.index(b':', key) + 1:head.index(b',', key)])
+            except ValueError:
+                return None
 
         def get_data(source: str, is_using_local: bool) -> tuple[list, float, float, float, float]:
             """ Get our json, returns a tuple of: all aircraft, response time (ms), json deserializing time (ms)
-            file size (bytes), and Unix timestamp inside the json """
+            file size (bytes), and Unix timestamp inside the json.
+            If the json hasn't changed since the last time we got it, the last parsed result is reused.
+            If `source` is readsb's binCraft data, it's decoded into the same form as the json. """
+            global unchanged_snapshots, DUMP1090_BINCRAFT
+            is_bincraft = source == DUMP1090_BINCRAFT
+            if not is_bincraft:
+                record_kind = 'json'
+            else:
+                record_kind = 'bincraft.zst' if source.endswith('.zst') else 'bincraft'
             load_start = time.perf_counter()
+            last_snapshot = last_snapshots.get(source)
+            validators = {}
             if is_using_local:
                 try:
                     with open(Path(source), 'rb') as _data:
@@ -3483,35 +3926,121 @@ def main_loop_generator() -> None:
                         s = _data.read()
                         load_end = round((time.perf_counter() - load_start) * 1000, 3)
                         filesize = len(s)
-                    json_parse = time.perf_counter()
-                    if ORJSON_IMPORTED:
-                        aircraft_data_tmp = orjson.loads(s)
-                    else:
-                        aircraft_data_tmp = json.loads(s)
                 except FileNotFoundError as e: # case when the dump1090 service is down or being updated
                     main_logger.debug(f"{e}")
                     raise
             else:
-                _req = session.get(source, headers=USER_AGENT, timeout=LOOP_INTERVAL * 1.9)
+                request_headers = USER_AGENT
+                if last_snapshot is not None and last_snapshot[3]:
+                    # only have the server send the json if it changed since we last got it
+                    request_headers = USER_AGENT | last_snapshot[3]
+                _req = session.get(source, headers=request_headers, timeout=LOOP_INTERVAL * 1.9)
                 load_end = round((time.perf_counter() - load_start) * 1000, 3)
                 _req.raise_for_status()
-                filesize = len(_req.content)
-                json_parse = time.perf_counter()
-                if ORJSON_IMPORTED:
-                    aircraft_data_tmp = orjson.loads(_req.content)
-                else:
-                    aircraft_data_tmp = json.loads(_req.content)
+                s = _req.content
+                filesize = len(s)
+                if _req.status_code == 304 and last_snapshot is not None:
+                    unchanged_snapshots += 1
+                    if snapshot_recorder is not None and source != DUMP978_JSON:
+                        snapshot_recorder.write(record_kind, last_snapshot[0])
+                    return last_snapshot[1].copy(), load_end, 0., filesize, last_snapshot[2]
+                if (etag := _req.headers.get('ETag')):
+                    validators['If-None-Match'] = etag
+                if (last_modified := _req.headers.get('Last-Modified')):
+                    validators['If-Modified-Since'] = last_modified
+            # only record what's been parsed successfully, so that a replay can always parse it too
+            record = snapshot_recorder is not None and source != DUMP978_JSON
+            json_parse = time.perf_counter()
+            # if dump1090 hasn't written a new json since last time (or we're polling faster than it writes),
+            # don't bother parsing it again. Both checks are orders of magnitude faster than deserializing.
+            if last_snapshot is not None and (
+                last_snapshot[0] == s
+                or (last_snapshot[2] and not is_bincraft and peek_timestamp(s) == last_snapshot[2])
+            ):
+                unchanged_snapshots += 1
+                json_end = round((time.perf_counter() - json_parse) * 1000, 3)
+                if record:
+                    snapshot_recorder.write(record_kind, s)
+                # hand out a copy so that extending it with dump978 data doesn't touch what we hold on to
+                return last_snapshot[1].copy(), load_end, json_end, filesize, last_snapshot[2]
+            if is_bincraft:
+                try:
+                    aircraft_data_tmp = bincraft.decode(s, compressed=source.endswith('.zst'))
+                except ValueError as e:
+                    main_logger.warning(f"Could not decode {dump1090}\'s binCraft data ({e}). Switching back to the json.")
+                    DUMP1090_BINCRAFT = None
+                    return get_data(DUMP1090_JSON, is_using_local)
+            elif ORJSON_IMPORTED:
+                aircraft_data_tmp = orjson.loads(s)
+            else:
+                aircraft_data_tmp = json.loads(s)
             json_end = round((time.perf_counter() - json_parse) * 1000, 3)
-            return aircraft_data_tmp.get('aircraft', []), load_end, json_end, filesize, aircraft_data_tmp.get('now', 0)
+            if record:
+                snapshot_recorder.write(record_kind, s)
+            last_snapshots[source] = (
+                s,
+                aircraft_data_tmp.get('aircraft', []),
+                aircraft_data_tmp.get('now', 0),
+                validators
+            )
+            return last_snapshots[source][1].copy(), load_end, json_end, filesize, last_snapshots[source][2]
 
         try:
             aircraft_data = []
-            if not USING_THREADPOOL: # basic dump1090 handling, no threadpool overhead
+            if replay_frames is not None:
+                # benchmark mode: the next recorded snapshot stands in for dump1090
+                load_start = time.perf_counter()
+                if not replay_start:
+                    replay_start = load_start
+                while True:
+                    if (frame := next(replay_frames, None)) is None:
+                        return None
+                    recorded_at, kind, s = frame
+                    process_time[0] = round((time.perf_counter() - load_start) * 1000, 3)
+                    json_parse = time.perf_counter()
+                    if kind == 'json':
+                        aircraft_data_tmp = orjson.loads(s) if ORJSON_IMPORTED else json.loads(s)
+                        break
+                    try:
+                        aircraft_data_tmp = bincraft.decode(s, compressed=kind == 'bincraft.zst')
+                        break
+                    except ValueError as e: # recordings made before bad binCraft data was left out of them
+                        main_logger.warning(f"Skipping a recorded binCraft snapshot that can't be decoded ({e})")
+                        load_start = time.perf_counter()
+                aircraft_data = aircraft_data_tmp.get('aircraft', [])
+                process_time2[2] = round((time.perf_counter() - json_parse) * 1000, 3)
+                runtime_sizes[0] = len(s)
+                runtime_sizes[1] += runtime_sizes[0]
+                # the data is as old as it was when it was recorded, not as old as the recording
+                dump1090_json_age[0] = recorded_at - aircraft_data_tmp.get('now', recorded_at)
+            elif aircraft_stream is not None:
+                # the aircraft table is kept up to date in the background; there's nothing to fetch or parse
+                if not aircraft_stream.connected:
+                    raise ConnectionError("Aircraft stream is disconnected.")
+                snapshot_start = time.perf_counter()
+                stream_snapshot = aircraft_stream.snapshot()
+                aircraft_data = stream_snapshot['aircraft']
+                process_time[0] = 0.
+                process_time2[2] = round((time.perf_counter() - snapshot_start) * 1000, 3)
+                if snapshot_recorder is not None:
+                    snapshot_recorder.write(
+                        'json',
+                        orjson.dumps(stream_snapshot) if ORJSON_IMPORTED else json.dumps(stream_snapshot).encode()
+                    )
+                runtime_sizes[0] = aircraft_stream.snapshot_bytes
+                runtime_sizes[1] += runtime_sizes[0]
+                dump1090_json_age[0] = process_time2[2] / 1000
+                if DUMP978_JSON:
+                    (aircraft_data_978, _, _, filesize_978, timestamp_978) = get_data(DUMP978_JSON, USING_FILESYSTEM_978)
+                    runtime_sizes[1] += filesize_978
+                    dump1090_json_age[1] = time.time() - timestamp_978 if timestamp_978 != 0 else 0.
+                    aircraft_data.extend(aircraft_data_978)
+            elif not USING_THREADPOOL: # basic dump1090 handling, no threadpool overhead
                 (aircraft_data,
                  process_time[0],
                  process_time2[2],
                  runtime_sizes[0],
-                 timestamp) = get_data(DUMP1090_JSON, USING_FILESYSTEM)
+                 timestamp) = get_data(DUMP1090_BINCRAFT or DUMP1090_JSON, USING_FILESYSTEM)
                 runtime_sizes[1] += runtime_sizes[0]
                 dump1090_json_age[0] = (
                     time.time() - timestamp
@@ -3519,7 +4048,7 @@ def main_loop_generator() -> None:
                     else time.time() - ((process_time[0] + process_time2[2]) / 1000)
                 )
             else:
-                dump1090wait = data_threadpool.submit(get_data, DUMP1090_JSON, USING_FILESYSTEM)
+                dump1090wait = data_threadpool.submit(get_data, DUMP1090_BINCRAFT or DUMP1090_JSON, USING_FILESYSTEM)
                 dump978wait = data_threadpool.submit(get_data, DUMP978_JSON, USING_FILESYSTEM_978)
                 dump1090_response = None
                 dump978_response = None
@@ -3580,7 +4109,7 @@ def main_loop_generator() -> None:
         - dictionary: general stats to be updated per loop.
             - Tracking = total planes being tracked at current time
             - Range = maximum range of tracked planes from your location (in selected units)
-        - list: list of nested dictionaries that describes each plane found within `HEIGHT_LIMIT` and `RANGE` and updates per loop.
+        - list: list of records that describes each plane found within `HEIGHT_LIMIT` and `RANGE` and updates per loop.
         If no planes are found or location is not set, this will return an empty list. With `NOFILTER_MODE` enabled, this is every plane
         detected by the receiver(s).
             - ID: ICAO hex of aircraft
@@ -3621,9 +4150,8 @@ def main_loop_generator() -> None:
             - Staleness: Age of the position data of the plane, in seconds
             - Timestamp: Timestamp of this data packet
         """
-        """ **NOTE** In a future release, this may be replaced by a dataclass object for maintainablity.
-        This will require a significant rewrite with many other parts of this script within a single update.
-        This comment should remain here until it is decided to move along with this direction or scrapping the idea. """
+        """ Each plane is an `AircraftRecord` (see `utilities/aircraft_record.py`) with the keys above as its fields.
+        Records can still be read like dicts, but attribute access (`plane.ID`) is the faster way in loops that run per plane. """
         # refer to https://github.com/wiedehopf/readsb/blob/dev/README-json.md on relevant json keys
         # auxiliary info: https://github.com/sdr-enthusiasts/docker-adsb-ultrafeeder?tab=readme-ov-file#tar1090-core-configuration
 
@@ -3648,50 +4176,52 @@ def main_loop_generator() -> None:
                     continue
             return list(seen.values())
 
-        def data_arbitrator(loop_packet_dict: dict, database_result: dict) -> dict:
+        def data_arbitrator(loop_packet: AircraftRecord, database_result: dict) -> AircraftRecord:
             """ Compares the data from database to the current data of the loop's data and
-            updates values to the database's result if applicable. Returns the loop data dictionary with these values.
+            updates values to the database's result if applicable. Returns the loop packet with these values.
             This assumes the database data is the most accurate available. """
             if database_result['reg']:
-                loop_packet_dict['Registration'] = database_result['reg']
+                loop_packet.Registration = database_result['reg']
             # eliminate false positive result when an aircraft has a callsign that corresponds to an airline
             # see: comments in `operator_lookup()`
-            if loop_packet_dict['Flight'] == database_result['reg'].replace("-", ""):
-                loop_packet_dict['Operator'] = None
-                loop_packet_dict['Telephony'] = None
+            if loop_packet.Flight == database_result['reg'].replace("-", ""):
+                loop_packet.Operator = None
+                loop_packet.Telephony = None
             # if callsign fell back to the ICAO hex, try to replace it with the registration
-            if ((loop_packet_dict['Flight'] == database_result['icao'].lower())
+            if ((loop_packet.Flight == database_result['icao'].lower())
                  and database_result['reg']):
-                loop_packet_dict['Flight'] = database_result['reg']
-            if loop_packet_dict['Owner'] is None and database_result['ownop']:
-                loop_packet_dict['Owner'] = database_result['ownop']
-            if loop_packet_dict['AircraftDesc'] is None and database_result['desc']:
+                loop_packet.Flight = database_result['reg']
+            if loop_packet.Owner is None and database_result['ownop']:
+                loop_packet.Owner = database_result['ownop']
+            if loop_packet.AircraftDesc is None and database_result['desc']:
                 adesc = database_result['desc']
                 ayear = database_result['year']
                 if adesc and ayear:
-                    loop_packet_dict['AircraftDesc'] = f"{ayear} {adesc}"
+                    loop_packet.AircraftDesc = f"{ayear} {adesc}"
                 else:
-                    loop_packet_dict['AircraftDesc'] = adesc
-            if loop_packet_dict['ICAOType'] == 'None' and database_result['type']:
-                    loop_packet_dict['ICAOType'] = database_result['type']
+                    loop_packet.AircraftDesc = adesc
+            if loop_packet.ICAOType == 'None' and database_result['type']:
+                    loop_packet.ICAOType = database_result['type']
             if database_result['flags'] != 0:
                 if database_result['flags'] == 1:
-                    loop_packet_dict['TrackingFlag'] = "LADD"
+                    loop_packet.TrackingFlag = "LADD"
                 elif database_result['flags'] == 10:
                     if ( # heuristic for determining if a plane is operating under PIA (the cross-checked ICAOs have '10' as their flag in the database)
-                        loop_packet_dict['ID'].startswith('a') # PIA only operates in the United States
+                        loop_packet.ID.startswith('a') # PIA only operates in the United States
                         # PIA aircraft operate under one of these companies' callsigns (DCM, FFL, FWR, XAA)
-                        and loop_packet_dict['Flight'].upper().startswith(('DCM', 'FFL', 'FWR', 'XAA'))
+                        and loop_packet.Flight.upper().startswith(('DCM', 'FFL', 'FWR', 'XAA'))
                     ):
-                        loop_packet_dict['TrackingFlag'] = "PIA"
-                        loop_packet_dict['Registration'] = None # can't tie or calculate a reg based off its ICAO
+                        loop_packet.TrackingFlag = "PIA"
+                        loop_packet.Registration = None # can't tie or calculate a reg based off its ICAO
                     else:
-                        loop_packet_dict['TrackingFlag'] = "Military"
+                        loop_packet.TrackingFlag = "Military"
                 else:
-                    loop_packet_dict['TrackingFlag'] = "Other"
+                    loop_packet.TrackingFlag = "Other"
 
-            return loop_packet_dict
+            return loop_packet
 
+        global BATCH_GEOMETRY
+        nonlocal batch_geometry_verified
         if dump1090_data is None:
             return {'Tracking': 0, 'Range': 0}, []
         total: int = 0
@@ -3718,7 +4248,26 @@ def main_loop_generator() -> None:
         else:
             dump1090data_ = dump1090_data
 
-        for a in dump1090data_:
+        # For busy snapshots (mostly NOFILTER_MODE), do the trig for every aircraft at once instead of one at a time.
+        # Elevation and slant range are deferred until after the loop so that they're also done in one go.
+        use_batch = BATCH_GEOMETRY and LOCATION_IS_SET and len(dump1090data_) >= BATCH_MIN_AIRCRAFT
+        batch_packets = []
+        database_pending = [] # (loop packet, `aircraft_state` entry) of planes we don't have database info for yet
+        # without readsb's precalculated distances, skip the trig for planes that clearly aren't in range
+        use_boxes = not use_batch and not NOFILTER_MODE and location_boxes is not None
+        skipped_positions = []
+        if use_batch:
+            batch_distances, batch_bearings = batch_distances_and_bearings(dump1090data_)
+            if not batch_geometry_verified:
+                if verify_batch_geometry(dump1090data_, batch_distances, batch_bearings):
+                    batch_geometry_verified = True
+                    main_logger.debug(f"NumPy batch geometry verified against {len(dump1090data_)} aircraft and is now in use.")
+                else:
+                    BATCH_GEOMETRY = use_batch = False
+                    main_logger.warning("NumPy batch geometry results do not match the normal calculations. "
+                                        "Falling back to the normal calculations.")
+
+        for index, a in enumerate(dump1090data_):
             # ===== get bare minimum info =====
             seen_pos = a.get('seen_pos')
             broadcast_type = a.get('type', 'None')
@@ -3755,7 +4304,24 @@ def main_loop_generator() -> None:
                 # distance for each plane on every loop.
                 # From testing, using the current layout is now up to 1.5x faster over time, as long as we're connected to readsb.
                 if distance is None:
-                    distance = greatcircle(rlat, rlon, lat, lon)
+                    if use_batch:
+                        distance = round(batch_distances[index], 6)
+                    elif (
+                        use_boxes
+                        and hex_ != FOLLOW_THIS_AIRCRAFT
+                        and squawk not in ('7500', '7600', '7700')
+                        and outside_range(lat, lon)
+                    ):
+                        # this plane can't pass any of the filters below; it only counts towards the stats
+                        skipped_positions.append((lat, lon))
+                        continue
+                    elif (
+                        (state := aircraft_state.get(hex_)) is not None
+                        and state['Position'] == (lat, lon)
+                    ):
+                        distance = state['Distance'] # hasn't moved since we last worked this out
+                    else:
+                        distance = greatcircle(rlat, rlon, lat, lon)
                 else: # don't forget to scale to the selected units if we're reading directly from readsb
                     distance = distance * distance_multiplier
             else:
@@ -3846,19 +4412,35 @@ def main_loop_generator() -> None:
                         source = 'UAT'
                     else:
                         source = 'ADS-B'
-                    if LOCATION_IS_SET:
-                        # readsb also does this calculation, try to use it first and have the fallback ready
-                        direc, direcd = relative_direction(
-                            rdir = a.get('r_dir'),
-                            lat0 = rlat,
-                            lon0 = rlon,
-                            lat1 = lat,
-                            lon1 = lon
-                        )
+                    if (state := aircraft_state.get(hex_)) is None:
+                        state = aircraft_state[hex_] = new_aircraft_state(hex_)
+                    state['Seen'] = reference_time
+                    geometry_key = (lat, lon, alt)
+                    if not use_batch and state['GeometryKey'] == geometry_key:
+                        direc, direcd, elevation, slant_range_dist = state['Geometry']
                     else:
-                        direc = ""
-                        direcd = 0.
-                    elevation, slant_range_dist = elevation_and_slant(distance, alt)
+                        if LOCATION_IS_SET:
+                            # readsb also does this calculation, try to use it first and have the fallback ready
+                            if (rdir := a.get('r_dir')) is None and use_batch and lat is not None:
+                                rdir = batch_bearings[index]
+                            direc, direcd = relative_direction(
+                                rdir = rdir,
+                                lat0 = rlat,
+                                lon0 = rlon,
+                                lat1 = lat,
+                                lon1 = lon
+                            )
+                        else:
+                            direc = ""
+                            direcd = 0.
+                        if use_batch:
+                            elevation = slant_range_dist = 0. # filled in by `batch_elevation_and_slant()` after this loop
+                        else:
+                            elevation, slant_range_dist = elevation_and_slant(distance, alt)
+                            state['Position'] = (lat, lon)
+                            state['Distance'] = distance
+                            state['GeometryKey'] = geometry_key
+                            state['Geometry'] = (direc, direcd, elevation, slant_range_dist)
                     if abs(determined_time_offset) > 5 or USING_FILESYSTEM:
                         dt = 0
                     else:
@@ -3893,12 +4475,12 @@ def main_loop_generator() -> None:
                     else:
                         futdis = None
                     emitter = category_description.get(a.get('category'), "None")
-                    iso_code = getICAO(hex_).upper()
+                    iso_code = state['Country']
                     # Grab some stuff from readsb-generated jsons if we're not using
                     # our own database
                     if not DATABASE_CONNECTED:
                         if (registration := a.get('r')) is None:
-                            registration = reg_lookup(hex_)
+                            registration = state['Registration']
                         owner = a.get('ownOp')
                         adesc = a.get('desc')
                         atype = a.get('t')
@@ -3910,20 +4492,20 @@ def main_loop_generator() -> None:
                     else:
                         owner = adesc = ayear = None
                         atype = "None"
-                        registration = reg_lookup(hex_)
-
-                    # see if we can lookup who runs this plane
-                    if (operator_result := operator_lookup(flight)) is not None:
-                        if not (operator := operator_result['Company']):
-                            operator = None
-                        if not (telephony := operator_result['Telephony']):
-                            telephony = None
-                        if not (op_friend := operator_result['FriendlyName']):
-                            op_friend = None
-                    else:
-                        operator = None
-                        telephony = None
-                        op_friend = None
+                        registration = state['Registration']
+
+                    # see if we can lookup who runs this plane (only needed again if the callsign changes)
+                    if flight != state['Callsign']:
+                        state['Callsign'] = flight
+                        if (operator_result := operator_lookup(flight)) is not None:
+                            state['Operator'] = (
+                                operator_result['Company'] or None,
+                                operator_result['Telephony'] or None,
+                                operator_result['FriendlyName'] or None,
+                            )
+                        else:
+                            state['Operator'] = (None, None, None)
+                    operator, telephony, op_friend = state['Operator']
                     if (
                         flight is None
                         or flight == "        " # when dump1090 reports an empty callsign, it's 8 spaces
@@ -3945,59 +4527,71 @@ def main_loop_generator() -> None:
                     else: # do not append really far planes when operating normally
                         flyby = 0
 
-                    loop_packet = {
-                        "ID": hex_,
-                        "Flight": flight,
-                        "Country": iso_code,
-                        "Altitude": alt,
-                        "Speed": gs,
-                        "Distance": distance,
-                        "Direction": direc,
-                        "DirectionDegrees": direcd,
-                        "Latitude": lat,
-                        "Longitude": lon,
-                        "Track": track,
-                        "VertSpeed": vs,
-                        "RSSI": rssi,
-                        "Elevation": elevation,
-                        "SlantRange": slant_range_dist,
-                        "Operator": operator,
-                        "Telephony": telephony,
-                        "OperatorAKA": op_friend,
-                        "Owner": owner,
-                        "AircraftDesc": adesc,
-                        "ICAOType": atype,
-                        "CategoryDesc": emitter,
-                        "TrackingFlag": "None",
-                        "Registration": registration,
-                        "Squawk": squawk,
-                        "Priority": priority_value,
-                        "Source": source,
-                        "OnGround": is_on_ground,
-                        "Distressed": is_distressed,
-                        "NavigationAccuracy": nac_p,
-                        "ApproachRate": 0.0, # this is not calculated in this loop, check below
-                        "FutureLatitude": futlat,
-                        "FutureLongitude": futlon,
-                        "FutureDistance": futdis,
-                        "Flyby": flyby,
-                        "Staleness": round(true_data_age, 3),
-                        "Timestamp": time.monotonic() if not NOFILTER_MODE else reference_time,
-                    }
+                    loop_packet = AircraftRecord(
+                        ID=hex_,
+                        Flight=flight,
+                        Country=iso_code,
+                        Altitude=alt,
+                        Speed=gs,
+                        Distance=distance,
+                        Direction=direc,
+                        DirectionDegrees=direcd,
+                        Latitude=lat,
+                        Longitude=lon,
+                        Track=track,
+                        VertSpeed=vs,
+                        RSSI=rssi,
+                        Elevation=elevation,
+                        SlantRange=slant_range_dist,
+                        Operator=operator,
+                        Telephony=telephony,
+                        OperatorAKA=op_friend,
+                        Owner=owner,
+                        AircraftDesc=adesc,
+                        ICAOType=atype,
+                        CategoryDesc=emitter,
+                        TrackingFlag="None",
+                        Registration=registration,
+                        Squawk=squawk,
+                        Priority=priority_value,
+                        Source=source,
+                        OnGround=is_on_ground,
+                        Distressed=is_distressed,
+                        NavigationAccuracy=nac_p,
+                        ApproachRate=0.0, # this is not calculated in this loop, check below
+                        FutureLatitude=futlat,
+                        FutureLongitude=futlon,
+                        FutureDistance=futdis,
+                        Flyby=flyby,
+                        Staleness=round(true_data_age, 3),
+                        Timestamp=time.monotonic() if not NOFILTER_MODE else reference_time,
+                    )
+                    if use_batch:
+                        batch_packets.append(loop_packet)
 
                     if DATABASE_CONNECTED:
-                        database_data = database_lookup(hex_)
-                        if (not NOFILTER_MODE and not really_far) or NOFILTER_MODE:
-                            planes.append(data_arbitrator(loop_packet, database_data))
-                        if really_far:
-                            farplanes.append(data_arbitrator(loop_packet, database_data))
-                    else:
-                        if (not NOFILTER_MODE and not really_far) or NOFILTER_MODE:
-                            planes.append(loop_packet)
-                        if really_far:
-                            farplanes.append(loop_packet)
+                        if state['Database'] is None:
+                            database_pending.append((loop_packet, state)) # looked up after this loop
+                        else:
+                            data_arbitrator(loop_packet, state['Database'])
+                    if (not NOFILTER_MODE and not really_far) or NOFILTER_MODE:
+                        planes.append(loop_packet)
+                    if really_far:
+                        farplanes.append(loop_packet)
         # end of the main loop
-        planes.sort(key=lambda x: x['ID'])
+        if database_pending:
+            # `data_arbitrator()` updates the packets in place, so they can be finished up after they're in the lists
+            database_results = database_lookup_many([loop_packet.ID for loop_packet, _ in database_pending])
+            for loop_packet, state in database_pending:
+                state['Database'] = database_results[loop_packet.ID]
+                data_arbitrator(loop_packet, state['Database'])
+        if batch_packets:
+            batch_elevation_and_slant(batch_packets)
+        if skipped_positions:
+            ranges.extend(farthest_distances(skipped_positions))
+        if reference_time - aircraft_state_pruned > 60:
+            prune_aircraft_state(reference_time)
+        planes.sort(key=lambda x: x.ID)
 
         if farplanes:
             dispatcher.send(message=farplanes, signal=REALLY_FAR_PLANE, sender=main_loop_generator)
@@ -4007,40 +4601,7 @@ def main_loop_generator() -> None:
         if not NOFILTER_MODE:
             # calculate approach rate for each plane based on previous data
             for plane in planes:
-                try:
-                    approach_rate_history = []
-                    # note: higher indices indicate older data
-                    sl_history = []
-                    ts_history = []
-                    for entry in relevant_planes_approach_rate_tracking:
-                        for planeid in entry:
-                            if planeid['ID'] == plane['ID']:
-                                sl_history.append(planeid['SlantRange'])
-                                ts_history.append(planeid['Timestamp'])
-                                continue
-
-                    if len(sl_history) <= 1 or len(ts_history) <= 1:
-                        plane['ApproachRate'] == 0.0
-                        continue
-
-                    for i in range(len(sl_history) - 1):
-                        approach_rate_interval = (
-                            (sl_history[i + 1] - sl_history[i]) * 3600 /
-                            (ts_history[i] - ts_history[i + 1])
-                        )
-                        approach_rate_history.append(approach_rate_interval)
-
-                    if len(approach_rate_history) > 0:
-                        plane['ApproachRate'] = round(
-                            sum(approach_rate_history) / len(approach_rate_history), 3
-                        )
-                    else:
-                        plane['ApproachRate'] = 0.0
-
-                except (KeyError, IndexError): # shouldn't happen, but just in case
-                    main_logger.debug("KeyError or IndexError in approach rate calculation")
-                    plane['ApproachRate'] = 0.0
-                    break
+                plane.ApproachRate = relevant_planes_approach_rate_tracking.approach_rate(plane.ID)
 
         if not ranges:
             max_range = 0
@@ -4055,7 +4616,7 @@ def main_loop_generator() -> None:
         """ Do the loop """
         global general_stats, relevant_planes, unique_planes_seen
         global process_time, dump1090_failures, process_time2, runtime_sizes
-        global active_plane_display
+        global active_plane_display, loop_snapshot
         sequential_failures = 0 # if we don't get processed data, this increments and we can tell the data poller is in a bad state
         failures_delta = 0 # handle a mix of sequentual failures and normal failures
         sporadic_suppress = 0 # delay actually triggering the timeout
@@ -4064,13 +4625,16 @@ def main_loop_generator() -> None:
             try:
                 loop_start = time.perf_counter()
                 dump1090_data = dump1090_heartbeat()
+                if replay_frames is not None and dump1090_data is None:
+                    replay_report() # end of the recording
+                    return
                 if not DUMP1090_IS_AVAILABLE:
                     process_time[0] = 0. # doesn't make sense for there to be a process time in this case
                     process_time2[2] = 0.
                     runtime_sizes[0] = 0
                 if dump1090_data is None:
                     general_stats = {'Tracking': 0, 'Range': 0.}
-                    relevant_planes.clear()
+                    relevant_planes = []
                     relevant_planes_approach_rate_tracking.clear()
                     runtime_sizes[0] = 0
                     if DUMP1090_IS_AVAILABLE: raise TimeoutError
@@ -4078,16 +4642,7 @@ def main_loop_generator() -> None:
                 if DUMP1090_IS_AVAILABLE:
                     if not NOFILTER_MODE and relevant_planes:
                         # store pertinent data needed for the selection algorithm before we get new data
-                        last_data = []
-                        for plane in relevant_planes:
-                            last_data.append(
-                                {
-                                    'ID': plane.get('ID'),
-                                    'SlantRange': plane.get('SlantRange'),
-                                    'Timestamp': plane.get('Timestamp')
-                                }
-                            )
-                        relevant_planes_approach_rate_tracking.appendleft(last_data)
+                        relevant_planes_approach_rate_tracking.record(relevant_planes)
                     else:
                         relevant_planes_approach_rate_tracking.clear()
                     general_stats, relevant_planes = dump1090_loop(dump1090_data)
@@ -4180,10 +4735,33 @@ def main_loop_generator() -> None:
                 continue
 
             else:
+                if replay_frames is not None:
+                    filter_time = process_time[1]
+                    replay_work_done.clear()
+
                 # Wake up `AirplaneParser` to continue the work chain
                 # This also signals to `synchronizer` that this loop processing was successful
+                loop_snapshot = publish_snapshot(loop_snapshot, loop_start, general_stats, relevant_planes)
                 dispatcher.send(message='', signal=DATA_UPDATED, sender=main_loop_generator)
 
+                if replay_frames is not None:
+                    # move on to the next snapshot as soon as everything downstream is done with this one
+                    replay_work_done.wait(10)
+                    replay_sample(loop_start, filter_time)
+                    continue
+
+                if json_watcher is not None:
+                    # Let dump1090 tell us when there's new data instead of guessing when it'll be written.
+                    # Hold off for most of the loop interval so that we don't process more often than we used to
+                    # (dump1090 usually writes every second), forget any writes that happened in the meantime,
+                    # then pick up the very next write. If dump1090 stalls, we carry on at the normal interval.
+                    holdoff = (LOOP_INTERVAL * 0.75) - (time.perf_counter() - loop_start)
+                    if holdoff > 0:
+                        time.sleep(holdoff)
+                    json_watcher.clear()
+                    json_watcher.wait(LOOP_INTERVAL - (time.perf_counter() - loop_start))
+                    continue
+
                 """ Our main loop polling time with adjustment based on how long it took to do the work
                 in order to reduce drift; all other threads that are dependent on this data
                 work in lockstep with this sleep interval, making this our orchestrator/internal tick generator. """
@@ -4213,6 +4791,9 @@ class AirplaneParser:
         self._plane_counts = deque(maxlen=int(1800 / LOOP_INTERVAL)) # track current plane count, per loop, up to 30 minutes
         self._active_loop_count = deque(maxlen=50) # duration of this algorithm's activity, per instance
         self._range_too_large = False
+        self.prioritizer = Prioritizer()
+        """ Scores the planes when a new focus plane is needed; by default on line-of-sight distance and approach rate
+        (see `utilities/prioritizer.py`) """
         self._PIA_latch = False
         self._distressed_latch = False # latches until there are no more planes to track
         self.timetolive_dict: dict = {}
@@ -4226,13 +4807,13 @@ class AirplaneParser:
         """ Fear the mutation of all these globals! """
         global focus_plane, focus_plane_stats, focus_plane_iter
         global focus_plane_ids_scratch, focus_plane_ids_discard, FOLLOW_THIS_AIRCRAFT_SPOTTED
-        global process_time, selection_events, selection_override
+        global process_time, selection_events, selection_override, plane_selection_time
         global high_priority_events, plane_load, range_too_large, tracking_distress_call
         global algorithm_daily_runtime
         global focus_plane_infocus, focus_plane_TTL
         start_time = time.perf_counter()
-        relevant_planes_local_copy = relevant_planes.copy()
-        plane_count = len(relevant_planes_local_copy)
+        planes = loop_snapshot.planes
+        plane_count = len(planes)
         get_plane_list: list = []
         """ List of all plane ID's in this loop """
         focus_plane_i: str = ""
@@ -4254,57 +4835,11 @@ class AirplaneParser:
             There was a huge docstring here, it now lives in the docstring-compendium file in the docs folder of this project. """
             global focus_plane_ids_discard, focus_plane_ids_scratch
             def prioritizer(available_ids: list | set) -> str:
-                """ Select based on a weighted score derived from closest line-of-sight and approach rate.
+                """ Select the best scoring plane we haven't already seen (see `self.prioritizer`).
                 `available_ids` is only used as a fallback when this cannot pick a plane. """
-                hexes = []
-                approach_rates = []
-                LOS_vals = []
-                weighted_vals = []
-                # make sure these two add to 1
-                LOS_weight = 0.6
-                appr_weight = 0.4
-                for entry in relevant_planes_local_copy:
-                    hexes.append(entry['ID'])
-                    approach_rates.append(entry['ApproachRate'])
-                    LOS_vals.append(entry['SlantRange'])
-                appr_max = max(approach_rates)
-                appr_min = min(approach_rates)
-                appr_rng = appr_max - appr_min
-                LOS_max = max(LOS_vals)
-                LOS_min = min(LOS_vals)
-                LOS_rng = LOS_max - LOS_min
-                for i, val in enumerate(approach_rates):
-                    if appr_rng > 0:
-                        # scales between -1 and 1 to influence the selector at the end
-                        # to avoid negative approach rates.
-                        # "fixes" the case when the scratchpad is cleared and we start
-                        # selecting planes again and the selector algorithm picks a plane that's
-                        # just about to leave the area not dropped by the position estimator culling
-                        approach_rates[i] = (-1 + (2 * (val - appr_min) / appr_rng)) * appr_weight
-                    else:
-                        approach_rates[i] = 0
-                for i, val in enumerate(LOS_vals):
-                    if LOS_rng > 0:
-                        # closer to the site has a higher priority, so we invert this
-                        LOS_vals[i] = (1 - ((val - LOS_min) / LOS_rng)) * LOS_weight
-                    else:
-                        LOS_vals[i] = 0
-                for i, val in enumerate(LOS_vals):
-                    try:
-                        weighted_vals.append(round(val + approach_rates[i], 3))
-                    except IndexError:
-                        weighted_vals.append(val)
-                # range for weighted values = [-`appr_weight`, 1]
-                w = dict(zip(hexes, weighted_vals))
-                weights = dict(sorted(w.items(), key=lambda x: x[1], reverse=True))
-
-                for plane, weight in weights.items():
-                    if (
-                        plane != focus_plane_i # don't pick the previous plane
-                        and plane not in focus_plane_ids_discard # don't pick anything we've already seen
-                    ):
-                        # main_logger.debug(f'Picked {plane} | weights: {weights}')
-                        return plane # first result that works
+                focus_plane_ = self.prioritizer.best(planes, exclude=focus_plane_ids_discard | {focus_plane_i})
+                if focus_plane_ is not None:
+                    return focus_plane_
 
                 # fallback: just return a random one
                 if len(available_ids) > 0:
@@ -4313,12 +4848,12 @@ class AirplaneParser:
                     return ''
 
             focus_plane_ids_discard.add(focus_plane_i) # add previously assigned focus plane to scratchpad of planes to ignore
-            for entry in relevant_planes_local_copy:
-                if entry['FutureDistance'] and entry['FutureDistance'] > range_buffer:
-                    focus_plane_ids_discard.add(entry['ID'])
+            for entry in planes:
+                if entry.FutureDistance and entry.FutureDistance > range_buffer:
+                    focus_plane_ids_discard.add(entry.ID)
                     main_logger.debug(
-                        f"Detected aircraft \'{entry['Flight']}\' ({entry['ID']}) leaving area "
-                        f"(Est. next distance: {entry['FutureDistance']:.4f}) "
+                        f"Detected aircraft \'{entry.Flight}\' ({entry.ID}) leaving area "
+                        f"(Est. next distance: {entry.FutureDistance:.4f}) "
                         "when we needed to select a new focus plane."
                     )
             discard_list = list(focus_plane_ids_discard)
@@ -4357,25 +4892,25 @@ class AirplaneParser:
                 # our initial pre-filter
                 focus_plane_ids_scratch.clear()
                 PIA_this_poll = False
-                for entry in relevant_planes_local_copy:
-                    get_plane_list.append(entry['ID']) # current planes in this loop
-                    focus_plane_ids_scratch.add(entry['ID']) # add the above to the global set (rebuilds each loop)
+                for entry in planes:
+                    get_plane_list.append(entry.ID) # current planes in this loop
+                    focus_plane_ids_scratch.add(entry.ID) # add the above to the global set (rebuilds each loop)
                     if (
-                        0 < entry['SlantRange'] <= high_priority_dome
-                        and entry['Altitude'] != 0
+                        0 < entry.SlantRange <= high_priority_dome
+                        and entry.Altitude != 0
                     ): # there is a plane inside this dome
                         override_plane = True # no need for an else statement, `override_plane` is reset to False every loop
-                    if entry['ID'] == FOLLOW_THIS_AIRCRAFT:
+                    if entry.ID == FOLLOW_THIS_AIRCRAFT:
                         follow_flag = True
                         if FOLLOW_THIS_AIRCRAFT and not FOLLOW_THIS_AIRCRAFT_SPOTTED:
                             event_logger.info(f"Aircraft \'{FOLLOW_THIS_AIRCRAFT}\' first detected by FlightGazer today.")
                             freeze_frame_packet(entry, show_distance=True)
                             FOLLOW_THIS_AIRCRAFT_SPOTTED = True
-                    if entry['Distressed']:
+                    if entry.Distressed:
                         if not self._distressed_latch:
                             self._distressed_latch = True # note, this latch will only reset once there are no more planes
-                            tracking_distress_call = entry['ID']
-                            match entry['Squawk']:
+                            tracking_distress_call = entry.ID
+                            match entry.Squawk:
                                 case "7500":
                                     squawkdesc = "Aircraft Hijacking"
                                 case "7600":
@@ -4385,21 +4920,21 @@ class AirplaneParser:
                                 case _:
                                     squawkdesc = ""
                             event_logger.warning(
-                                f"Aircraft \'{entry['Flight']}\' ({tracking_distress_call}) "
+                                f"Aircraft \'{entry.Flight}\' ({tracking_distress_call}) "
                                 "has been detected by your ADS-B site and declared an emergency. "
-                                f"(Squawking {entry['Squawk']}, {squawkdesc})"
+                                f"(Squawking {entry.Squawk}, {squawkdesc})"
                             )
                             freeze_frame_packet(entry, show_distance=True)
-                    if entry['TrackingFlag'] == 'PIA' and not entry['OnGround']:
+                    if entry.TrackingFlag == 'PIA' and not entry.OnGround:
                         PIA_this_poll = True
                         if not self._PIA_latch:
                             self._PIA_latch = True
                             event_logger.info(
-                                f"Very rare event! Tracking PIA aircraft \'{entry['Flight']}\' "
-                                f"(ID: {entry['ID']}, aircraft type: {entry['CategoryDesc']})"
+                                f"Very rare event! Tracking PIA aircraft \'{entry.Flight}\' "
+                                f"(ID: {entry.ID}, aircraft type: {entry.CategoryDesc})"
                             )
                     # update the TTL dict for any new planes (important)
-                    _ = self.timetolive_dict.setdefault(entry['ID'], [0, 0])
+                    _ = self.timetolive_dict.setdefault(entry.ID, [0, 0])
 
                 if not PIA_this_poll and self._PIA_latch:
                     self._PIA_latch = False
@@ -4419,10 +4954,10 @@ class AirplaneParser:
                     # leave the area (essentially a tangential trajectory at our RANGE edge), we don't bother tracking
                     # it whatsoever and save the effort of polling the API and switching to the aircraft display for a few seconds.
                     # The result is still shown in the Interactive display, however.
-                    for entry in relevant_planes_local_copy:
+                    for entry in planes:
                         # get the first plane that will for certain remain in the area
-                        if entry['FutureDistance'] and entry['FutureDistance'] < range_buffer:
-                            focus_plane = entry['ID']
+                        if entry.FutureDistance and entry.FutureDistance < range_buffer:
+                            focus_plane = entry.ID
                             update_ttl(focus_plane)
                             break
                     else:
@@ -4451,11 +4986,8 @@ class AirplaneParser:
                                 update_ttl(focus_plane)
 
                     else:
-                        relevant_planes_local_copy.sort(key=lambda x: x['SlantRange'], reverse=False) # sort by slant range
-                        for plane in relevant_planes_local_copy:
-                            focus_plane = plane['ID'] # pick the first one
-                            update_ttl(focus_plane)
-                            break
+                        focus_plane = min(planes, key=lambda x: x.SlantRange).ID # pick the closest one
+                        update_ttl(focus_plane)
 
                 # finally, extract the plane stats to `focus_plane_stats` for use elsewhere
                 # and update the infocus time
@@ -4465,8 +4997,8 @@ class AirplaneParser:
                     focus_plane_infocus = focus_plane_times[0]
                     focus_plane_TTL = focus_plane_times[1]
                     self.timetolive_dict[f'{focus_plane}'] = focus_plane_times
-                    for entry in relevant_planes_local_copy: # find our focus plane in `relevant_planes`
-                        if entry and focus_plane == entry.get('ID', ''):
+                    for entry in planes: # find our focus plane in `relevant_planes`
+                        if focus_plane == entry.ID:
                             focus_plane_stats = entry
                             selection_override = override_plane
                             break
@@ -4474,10 +5006,10 @@ class AirplaneParser:
                         main_logger.error("Failed to extract aircraft info!")
                 else:
                     if plane_count == 1:
-                        entry = relevant_planes_local_copy[0]
-                        main_logger.debug(f"No plane available to select. \'{entry['Flight']}\' ({entry['ID']}) did not meet any valid criteria.")
-                        main_logger.debug(f"POS: {entry['Distance']}, Est POS: {entry['FutureDistance']}, SPD: {entry['Speed']}, "
-                                          f"TRK: {entry['Track']}, A-RATE: {entry['ApproachRate']}, ALT: {entry['Altitude']}")
+                        entry = planes[0]
+                        main_logger.debug(f"No plane available to select. \'{entry.Flight}\' ({entry.ID}) did not meet any valid criteria.")
+                        main_logger.debug(f"POS: {entry.Distance}, Est POS: {entry.FutureDistance}, SPD: {entry.Speed}, "
+                                          f"TRK: {entry.Track}, A-RATE: {entry.ApproachRate}, ALT: {entry.Altitude}")
                     else:
                         main_logger.debug(f"No plane available to select ({plane_count} did not meet any valid criteria)")
                 self._last_plane_count = plane_count
@@ -4485,11 +5017,11 @@ class AirplaneParser:
                     if not override_init:
                         if VERBOSE_MODE:
                             main_logger.debug("High-priority aircraft flyby triggered by"
-                                            f" \'{focus_plane_stats['Flight']}\' ({focus_plane})")
+                                            f" \'{focus_plane_stats.Flight}\' ({focus_plane})")
                             high_priority_events += 1
                         elif not VERBOSE_MODE and plane_count > 1:
                             main_logger.info("High-priority aircraft override triggered by"
-                                            f" \'{focus_plane_stats['Flight']}\' ({focus_plane})")
+                                            f" \'{focus_plane_stats.Flight}\' ({focus_plane})")
                             high_priority_events += 1
                     else:
                         main_logger.debug("High-priority aircraft override event completed.")
@@ -4551,14 +5083,12 @@ class AirplaneParser:
                     self._PIA_latch = False
                     focus_plane = ""
                     focus_plane_iter = 0
-                    focus_plane_stats.clear()
+                    focus_plane_stats = {} # it's one of the published planes; don't clear it in place
                     focus_plane_infocus = 0
                     focus_plane_TTL = 0
                     focus_plane_ids_scratch.clear()
                     focus_plane_ids_discard.clear()
                     selection_override = False
-                    operator_lookup.cache_clear()
-                    database_lookup.cache_clear()
                     self.timetolive_dict.clear()
 
                     self._last_plane_count = 0
@@ -4567,32 +5097,58 @@ class AirplaneParser:
                         tracking_distress_call = ''
                     self._distressed_latch = False # always reset once there are no more planes
 
-        process_time[1] = round(process_time[1] + (time.perf_counter() - start_time)*1000, 3)
+        plane_selection_time = round((time.perf_counter() - start_time)*1000, 3)
+        process_time[1] = round(process_time[1] + plane_selection_time, 3)
 
         # this triggers the DisplayFeeder and PrintToConsole
         dispatcher.send(message='', signal=PLANE_SELECTOR_DONE, sender=AirplaneParser.plane_selector)
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
         self.loop.stop()
 
 class APIFetcher:
-    """ Gets us plane information via the FlightAware API. """
+    """ Gets us plane information via the FlightAware API. Doesn't have a thread of its own; requests are queued up
+    in the order they come in and looked up one at a time on `io_workers`. """
     def __init__(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        register_signal_handler(self.loop, self.get_API_results, signal=PLANE_SELECTED, sender=AirplaneParser.plane_selector)
-        register_signal_handler(self.loop, self.get_API_results, signal=FORCE_REFRESH_API, sender=extract_API_results)
-        register_signal_handler(self.loop, self.get_API_results, signal=FORCE_REFRESH_API, sender=API_Scheduler)
-        register_signal_handler(self.loop, self.end_thread, signal=END_THREADS, sender=sigterm_handler)
+        self._requests = deque(maxlen=4)
+        """ Requests waiting to be looked up. Every lookup is for whatever the focus plane is when it runs,
+        so if this fills up, dropping the oldest request loses nothing. """
+        self._requests_lock = threading.Lock()
+        self._working: bool = False
+        """ True while there's a job on `io_workers` going through `_requests` """
+        dispatcher.connect(self.request, signal=PLANE_SELECTED, sender=AirplaneParser.plane_selector, weak=False)
+        dispatcher.connect(self.request, signal=FORCE_REFRESH_API, sender=extract_API_results, weak=False)
+        dispatcher.connect(self.request, signal=FORCE_REFRESH_API, sender=API_Scheduler, weak=False)
         self._error_tracking: int = 0
         self._error_spam_limit = 50
-        self.run_loop()
+
+    def request(self, message) -> None:
+        """ Queue up a call to `get_API_results()`. Returns right away. """
+        with self._requests_lock:
+            self._requests.append(message)
+            if self._working:
+                return
+            self._working = True
+        try:
+            io_workers.submit(self._work)
+        except RuntimeError: # shutting down
+            self._working = False
+
+    def _work(self) -> None:
+        """ Go through `_requests` until there aren't any left. """
+        while True:
+            with self._requests_lock:
+                if not self._requests:
+                    self._working = False
+                    return
+                message = self._requests.popleft()
+            try:
+                self.get_API_results(message)
+            except Exception:
+                main_logger.exception("API fetcher caught an exception.")
 
     def get_API_results(self, message):
         """ The real meat and potatoes for this class. Will append a dict to `focus_plane_api_results`
@@ -4635,7 +5191,7 @@ class APIFetcher:
             or api_limiter_reached()
         ):
             return
-        focus_plane_stats_now = focus_plane_stats.copy()
+        focus_plane_stats_now = focus_plane_stats # swapped out (never changed in place) by `plane_selector()`
         # get us our dates to narrow down how many results the API will give us
         date_now = datetime.datetime.now()
         time_delta_yesterday = date_now - datetime.timedelta(days=1)
@@ -4679,22 +5235,18 @@ class APIFetcher:
         # check if we already have results
         reference_time = time.monotonic()
         for result in reversed(focus_plane_api_results):
-            try:
+            if result is None:
+                break
+            if focus_plane == result['ID']: # cache hit...
                 access_time_delta = reference_time - result['APIAccessed']
-                last_status = result['Status']
-                if result is not None and focus_plane == result['ID']: # cache hit...
-                    if access_time_delta < stale_age and last_status <= 1:
-                        api_hits[3] += 1
-                        return # no need to query the API, API result is still valid
-                    elif access_time_delta < 300 and last_status >= 2:
-                        api_hits[3] += 1
-                        return # only try to poll the API again after 5 minutes
-                    else: # API result is stale, continue on
-                        break
-                elif result is None:
+                if access_time_delta < stale_age and result['Status'] <= 1:
+                    api_hits[3] += 1
+                    return # no need to query the API, API result is still valid
+                elif access_time_delta < 300 and result['Status'] >= 2:
+                    api_hits[3] += 1
+                    return # only try to poll the API again after 5 minutes
+                else: # API result is stale, continue on
                     break
-            except Exception: # if we bump into something else
-                break
 
         # our API call limiters
         if API_DAILY_LIMIT is not None and (api_hits[0] + api_hits[2]) >= API_DAILY_LIMIT:
@@ -5066,22 +5618,13 @@ class APIFetcher:
         }
 
         estimated_api_cost = API_COST_PER_CALL * (api_hits[0] + api_hits[2])
-        focus_plane_api_results.append(api_results)
+        focus_plane_api_results = focus_plane_api_results[1:] + (api_results,)
 
         if API_cache_present and API_status == 0 and not is_diverted:
             api_cache.append(api_results)
             api_db_performance[2] = api_cache.errors
             api_db_performance[5] = api_cache.commits
 
-    def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
-        self.loop.run_forever()
-
-    def end_thread(self, message):
-        self.loop.stop()
-
 class DisplayFeeder:
     """ Parses our global variables for our display driver. The display itself should be dumb; we do the processing here
     much like how `print_to_console()` displays its data. Additionally, the `ENHANCED_READOUT_AS_FALLBACK` mode is handled here. """
@@ -5304,9 +5847,10 @@ class DisplayFeeder:
 
         # active_stats
         active_stats = {}
-        if focus_plane and focus_plane_stats:
-            flight_name = f"{focus_plane_stats['Flight']}"
-            if focus_plane_stats['Distressed']:
+        plane = focus_plane_stats # swapped out (never changed in place) by `plane_selector()`
+        if focus_plane and plane:
+            flight_name = f"{plane.Flight}"
+            if plane.Distressed:
                 flight_name = "!" + flight_name
             if focus_plane == FOLLOW_THIS_AIRCRAFT:
                 flight_name = flight_name + "*"
@@ -5316,10 +5860,10 @@ class DisplayFeeder:
                     flight_name = flight_name[:7] + "*."
                 else:
                     flight_name = flight_name[:8] + "."
-            iso = f"{focus_plane_stats['Country']}"
+            iso = f"{plane.Country}"
             # speed readout is limited to 4 characters;
             # if speed >= 100, truncate to just the integers
-            s_now = focus_plane_stats['Speed']
+            s_now = plane.Speed
             if s_now >= 99.5 or s_now == 0:
                 gs = f"{s_now:.0f}"
             elif 0 < s_now < 99.5:
@@ -5327,15 +5871,15 @@ class DisplayFeeder:
             else:
                 gs = "0"
             # do some checking for the altitude when an aircraft is on the ground
-            alt_i = focus_plane_stats['Altitude']
-            if alt_i == 0 and focus_plane_stats['OnGround']:
+            alt_i = plane.Altitude
+            if alt_i == 0 and plane.OnGround:
                 alt = "GRND"
             else:
                 alt = f"{alt_i:.0f}"
             # distance readout is limited to 5 characters (2 direction, 3 value);
             # if distance >= 10, just get us the integers
             if LOCATION_IS_SET:
-                d_now = focus_plane_stats['Distance']
+                d_now = plane.Distance
                 if 0 <= d_now < 0.095:
                     dist = f"{d_now:.2f}"[1:] # no leading zero
                 elif 0.095 <= d_now < 9.95:
@@ -5345,15 +5889,15 @@ class DisplayFeeder:
                 elif d_now >= 999.5:
                     dist = "999"
                 else: dist = "0"
-                distance = focus_plane_stats['Direction'] + dist
+                distance = plane.Direction + dist
             else:
                 distance = "-----"
             # do our coordinate formatting
-            if (lat_i := focus_plane_stats['Latitude']) >= 0:
+            if (lat_i := plane.Latitude) >= 0:
                 lat_str = "N"
             elif lat_i < 0:
                 lat_str = "S"
-            if (lon_i := focus_plane_stats['Longitude']) >= 0:
+            if (lon_i := plane.Longitude) >= 0:
                 lon_str = "E"
             elif lon_i < 0:
                 lon_str = "W"
@@ -5361,19 +5905,19 @@ class DisplayFeeder:
             lon = f"{abs(lon_i):.3f}{lon_str}"
             # track indicator
             trkstr = ['T']
-            trkstr.append(track_arrow(focus_plane_stats['Track']))
-            trkstr.append(f"{focus_plane_stats['Track']:.0f}")
+            trkstr.append(track_arrow(plane.Track))
+            trkstr.append(f"{plane.Track:.0f}")
             trkstr.append("°")
             track = "".join(trkstr)
             # vertical speed is an interesting one; we are limited to 6 characters:
             # 1 for indicator, 1 for sign, and 4 for values
             if altitude_multiplier == 1:
-                vs_i = int(round(focus_plane_stats['VertSpeed'], 0))
+                vs_i = int(round(plane.VertSpeed, 0))
                 vs_str = f"{vs_i}"
                 if abs(vs_i) >= 10000:
                     vs_str = f"{(vs_i / 1000):.1f}"
             else: # m/s; do something similar like how we display Range
-                vs_i = round(focus_plane_stats['VertSpeed'], 1)
+                vs_i = round(plane.VertSpeed, 1)
                 if abs(vs_i) >= 100: # covers even the case of supersonic fully vertical ascent
                     vs_str = f"{vs_i:.0f}"
                 else:
@@ -5383,7 +5927,7 @@ class DisplayFeeder:
             elif vs_i == 0:
                 vs_str = " " + vs_str
             vs = "V" + vs_str
-            rssi = f"{focus_plane_stats['RSSI']}"
+            rssi = f"{plane.RSSI}"
 
             # Get us our API results from focus_plane_api_results
             # If there's no matching API result, we just use the below initialized values
@@ -5398,7 +5942,7 @@ class DisplayFeeder:
             API_status = 0
             # don't use API results if the plane is on the ground or
             # we hit any of the API limiters
-            if not focus_plane_stats['OnGround'] or not api_limiter_reached():
+            if not plane.OnGround or not api_limiter_reached():
                 if api_results_waiting:
                     result = extract_API_results(focus_plane_api_results, focus_plane, no_trigger=True)
                 else:
@@ -5452,8 +5996,8 @@ class DisplayFeeder:
 
             ext_detail_reg_mismatch = False
             # used for determining if we should append the registration to the description string
-            if focus_plane_stats['Registration']:
-                if focus_plane_stats['Flight'] != focus_plane_stats['Registration'].replace("-", ""):
+            if plane.Registration:
+                if plane.Flight != plane.Registration.replace("-", ""):
                     ext_detail_reg_mismatch = True
 
             # Get all the other info from the focus plane provided by the database (if available)
@@ -5467,8 +6011,8 @@ class DisplayFeeder:
             # "Aircraft type: High Vortex Large (75000-300000 lbs) (PIA aircraft) | ForeFlight"
             # "FlightAware (PIA aircraft)"
             aircraft_str_ = []
-            if focus_plane_stats['Distressed']:
-                match focus_plane_stats['Squawk']:
+            if plane.Distressed:
+                match plane.Squawk:
                     case "7500":
                         squawkdesc = "Aircraft Hijacking"
                     case "7600":
@@ -5478,50 +6022,50 @@ class DisplayFeeder:
                     case _:
                         squawkdesc = ""
                 aircraft_str_.append(f"This aircraft has declared an emergency: {squawkdesc} | ")
-            if focus_plane_stats['AircraftDesc']:
-                aircraft_str_.append(focus_plane_stats['AircraftDesc'])
+            if plane.AircraftDesc:
+                aircraft_str_.append(plane.AircraftDesc)
             else:
-                if focus_plane_stats['ICAOType'] != "None":
-                    aircraft_str_.append(f"Aircraft type: {focus_plane_stats['ICAOType']}")
-                    if focus_plane_stats['CategoryDesc'] != "None": # fallback on what ADS-B reports
-                        aircraft_str_.append(f", {focus_plane_stats['CategoryDesc']}")
+                if plane.ICAOType != "None":
+                    aircraft_str_.append(f"Aircraft type: {plane.ICAOType}")
+                    if plane.CategoryDesc != "None": # fallback on what ADS-B reports
+                        aircraft_str_.append(f", {plane.CategoryDesc}")
                 else:
-                    if focus_plane_stats['CategoryDesc'] != "None":
-                        aircraft_str_.append(f"Aircraft type: {focus_plane_stats['CategoryDesc']}")
+                    if plane.CategoryDesc != "None":
+                        aircraft_str_.append(f"Aircraft type: {plane.CategoryDesc}")
             if (part1 := "".join(aircraft_str_)): # if any of the above proved true
-                if focus_plane_stats['TrackingFlag'] != "None":
-                    aircraft_str_.append(f" ({focus_plane_stats['TrackingFlag']} aircraft)")
+                if plane.TrackingFlag != "None":
+                    aircraft_str_.append(f" ({plane.TrackingFlag} aircraft)")
                 if EXTENDED_DETAILS:
                     if ext_detail_reg_mismatch:
                         # Only append the registration if the callsign isn't already using it
-                        aircraft_str_.append(f" REG:{focus_plane_stats['Registration']}")
-                    if focus_plane_stats['Squawk']:
-                        aircraft_str_.append(f" SQWK:{focus_plane_stats['Squawk']}")
-            if focus_plane_stats['Operator']: # airline
+                        aircraft_str_.append(f" REG:{plane.Registration}")
+                    if plane.Squawk:
+                        aircraft_str_.append(f" SQWK:{plane.Squawk}")
+            if plane.Operator: # airline
                 if part1: aircraft_str_.append(" | ")
-                if focus_plane_stats['OperatorAKA']:
-                    aircraft_str_.append(f"{focus_plane_stats['OperatorAKA']}")
+                if plane.OperatorAKA:
+                    aircraft_str_.append(f"{plane.OperatorAKA}")
                 else:
-                    if len(focus_plane_stats['Operator']) <= 60:
-                        aircraft_str_.append(f"{focus_plane_stats['Operator']}")
+                    if len(plane.Operator) <= 60:
+                        aircraft_str_.append(f"{plane.Operator}")
                     else: # cut-off really long names
-                        aircraft_str_.append(f"{focus_plane_stats['Operator'][:60]}")
+                        aircraft_str_.append(f"{plane.Operator[:60]}")
                         aircraft_str_.append("...")
-                if focus_plane_stats['TrackingFlag'] != "None" and not part1:
-                    aircraft_str_.append(f" ({focus_plane_stats['TrackingFlag']} aircraft)")
+                if plane.TrackingFlag != "None" and not part1:
+                    aircraft_str_.append(f" ({plane.TrackingFlag} aircraft)")
             else: # use the owner
-                if focus_plane_stats['Owner']:
+                if plane.Owner:
                     if part1: aircraft_str_.append(" | ")
-                    if len(focus_plane_stats['Owner']) <= 60:
-                        aircraft_str_.append(f"{focus_plane_stats['Owner']}")
+                    if len(plane.Owner) <= 60:
+                        aircraft_str_.append(f"{plane.Owner}")
                     else:
-                        aircraft_str_.append(f"{focus_plane_stats['Owner'][:60]}")
+                        aircraft_str_.append(f"{plane.Owner[:60]}")
                         aircraft_str_.append("...")
-                    if focus_plane_stats['TrackingFlag'] != "None" and not part1:
-                        aircraft_str_.append(f" ({focus_plane_stats['TrackingFlag']} aircraft)")
+                    if plane.TrackingFlag != "None" and not part1:
+                        aircraft_str_.append(f" ({plane.TrackingFlag} aircraft)")
                 else: # no aircraft details nor owner/operator available
                     pass # don't do anything
-            if not aircraft_str_ and focus_plane_stats['ID'].startswith("~"):
+            if not aircraft_str_ and plane.ID.startswith("~"):
                 aircraft_str_ = ["NO ADD'L INFO (TIS-B Contact)"]
 
             # Generate more detailed journey detail/provide API error messages
@@ -5592,7 +6136,7 @@ class DisplayFeeder:
                 'VertSpeed': vs,
                 'RSSI': rssi,
                 'AircraftInfo': normalize(strip_accents(aircraft_str)),
-                'is_UAT': True if focus_plane_stats['Source'] == 'UAT' else False,
+                'is_UAT': True if plane.Source == 'UAT' else False,
             }
         # end of active stats section
 
@@ -5611,10 +6155,10 @@ class DisplayFeeder:
             process_time2[1] = 0.
 
         # special handling for when we are tracking a specific aircraft under FOLLOW_THIS_AIRCRAFT
-        if focus_plane_stats and focus_plane_stats['ID'] == FOLLOW_THIS_AIRCRAFT:
+        if plane and plane.ID == FOLLOW_THIS_AIRCRAFT:
             if (
-                focus_plane_stats['Altitude'] < HEIGHT_LIMIT
-                and focus_plane_stats['Distance'] < RANGE
+                plane.Altitude < HEIGHT_LIMIT
+                and plane.Distance < RANGE
                 and not api_limiter_reached()
             ): # if the specific aircraft is within our range and height limits
                 ENHANCED_READOUT = ENHANCED_READOUT_INIT # should be False if we are using the API successfully
@@ -5633,9 +6177,6 @@ class DisplayFeeder:
                 enhanced_readout_wait_condition.notify()
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
@@ -5660,7 +6201,7 @@ class dump1090Watchdog:
         DUMP1090_IS_AVAILABLE = False
 
         # indirectly let the other threads know that dump1090 is not available
-        relevant_planes.clear()
+        relevant_planes = []
         lockstep_corrector = 0
         dump1090_json_age = [0., 0.]
         watchdog_triggers += 1
@@ -5689,9 +6230,6 @@ class dump1090Watchdog:
         systemd_notify('STATUS=Normal operation.')
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
@@ -5805,6 +6343,10 @@ class WriteState:
         self.can_run_flag: bool = True
         # self.run_dir = CURRENT_DIR # debug on Windows and comment out the OS check block below
         self.json_file = Path(self.run_dir, "current_state.json")
+        if REPLAY_FILE:
+            # keep benchmark output away from the state file external apps read
+            self.json_file = Path(f"{REPLAY_FILE}.state.json").absolute()
+            self.run_dir = self.json_file.parent
         if (
             not WRITE_STATE
             or not is_posix
@@ -5839,6 +6381,7 @@ class WriteState:
         try:
             export_start = time.perf_counter()
             time_now = datetime.datetime.now()
+            snapshot = loop_snapshot
             FlightGazer = {
                 'start_date': STARTED_DATE.strftime("%Y-%m-%dT%H:%M:%S"),
                 'start_time': START_TIME,
@@ -5865,9 +6408,19 @@ class WriteState:
             receivers = {
                 'dump1090_is_available': DUMP1090_IS_AVAILABLE,
                 'dump1090_json': DUMP1090_JSON,
+                'dump1090_bincraft': DUMP1090_BINCRAFT,
+                'dump1090_stream': {
+                    'address': DUMP1090_STREAM,
+                    'connected': aircraft_stream.connected,
+                    'format': aircraft_stream.stream_format if aircraft_stream.stream_format else None,
+                    'messages': aircraft_stream.messages,
+                    'bad_messages': aircraft_stream.bad_messages,
+                } if aircraft_stream is not None else None,
                 'dump978_json': DUMP978_JSON,
                 'using_filesystem': USING_FILESYSTEM,
                 'using_filesystem_978': USING_FILESYSTEM_978,
+                'json_watcher': json_watcher.backend if json_watcher is not None else None,
+                'unchanged_snapshots': unchanged_snapshots,
                 'dump1090_type': dump1090 if DUMP1090_JSON is not None else None,
                 'location_is_set': LOCATION_IS_SET,
                 'response_time_ms': process_time[0],
@@ -5900,13 +6453,15 @@ class WriteState:
                                /(process_time2[2] * 1048576), 3)
                 ),
                 'filtering_and_algorithm_time_ms': process_time[1],
+                'tick_latency_ms': tick_latency,
+                'loop_sequence': snapshot.sequence,
                 'is_airspy': is_airspy,
                 'receiver_stats': receiver_stats,
             }
 
             plane_stats = {
-                'currently_tracking': general_stats['Tracking'] if general_stats else 0,
-                'current_range': general_stats['Range'] if general_stats else 0,
+                'currently_tracking': snapshot.stats['Tracking'],
+                'current_range': snapshot.stats['Range'],
                 'flybys_today': len(unique_planes_seen),
                 'last_unique_plane': unique_planes_seen[-1] if unique_planes_seen else None,
                 'aircraft_selections': selection_events,
@@ -5928,8 +6483,8 @@ class WriteState:
                 'focus_plane_ids_scratch': list(focus_plane_ids_scratch),
                 'focus_plane': focus_plane if focus_plane else None,
                 'high_priority_plane': selection_override,
-                'in_range': len(relevant_planes),
-                'relevant_planes': relevant_planes if not NOFILTER_MODE else None,
+                'in_range': len(snapshot.planes),
+                'relevant_planes': [plane.as_dict() for plane in snapshot.planes] if not NOFILTER_MODE else None,
             }
 
             api_db_stats: dict | None = None
@@ -5968,7 +6523,11 @@ class WriteState:
                 'empty_results': database_stats[1],
                 'errors': database_stats[2],
                 'average_response_times_ms': round(database_stats[3], 3),
-                'last_response_time_ms': round(database_stats[4], 3)
+                'last_response_time_ms': round(database_stats[4], 3),
+                'enrichment_cache': {
+                    'aircraft': aircraft_cache.stats(),
+                    'operators': operator_cache.stats()
+                }
             }
 
             # intermediate variables because the following as ternary setups get wild
@@ -6026,6 +6585,17 @@ class WriteState:
                 'interactive_mode': INTERACTIVE,
                 'last_console_print_time_ms': process_time2[0],
                 'last_json_export_time_ms': process_time2[3],
+                'stage_times_ms': {
+                    'fetch': process_time[0],
+                    'json_parsing': process_time2[2],
+                    'filtering': round(max(process_time[1] - plane_selection_time, 0.), 3),
+                    'plane_selection': plane_selection_time,
+                    'display_formatting': process_time2[1],
+                    'console_print': process_time2[0],
+                    'state_export': process_time2[3],
+                    'api_lookup': process_time[2],
+                    'weather': WX_API_data.get('response_time_ms') if WX_API_data else None,
+                },
                 'total_data_processed_GiB': round(runtime_sizes[1] / 1073741824, 6),
                 'total_API_data_received_MiB': round(runtime_sizes[2] / 1048576, 3),
                 'estimated_time_offset_sec': round(determined_time_offset, 6),
@@ -6090,23 +6660,56 @@ class WriteState:
             return
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
         self.loop.stop()
 
-@lru_cache(maxsize=500) # the maxsize is based on worst-case using NO_FILTER mode (roughly 500 aircraft)
+def load_operator_index() -> None:
+    """ Set up `operator_index`. Uses `OPERATORS_COMPILED_FILE` if it matches `OPERATORS_FILE`, otherwise (re)compiles it first.
+    If the compiled file can't be used, falls back to loading all of `operators.py` into a dict.
+    If a code shows up more than once, the first one wins (same as searching the tables in order). """
+    global operator_index
+    generated = operator_records.read_generated(OPERATORS_FILE)
+    if generated is not None: # older versions of operators.py can't be checked against the compiled file
+        try:
+            records = operator_records.OperatorRecords(OPERATORS_COMPILED_FILE)
+            if records.generated == generated:
+                operator_index = records
+                main_logger.debug(f"Loaded {len(records)} operators from \'{OPERATORS_COMPILED_FILE}\'.")
+                return
+            records.close()
+            main_logger.info("Operators database was updated, recompiling.")
+        except FileNotFoundError:
+            main_logger.info("Compiling operators database for faster lookups.")
+        except (OSError, ValueError) as e:
+            main_logger.warning(f"Could not read \'{OPERATORS_COMPILED_FILE}\', recompiling. ({e})")
+    try:
+        from utilities import operators as op
+    except Exception as e:
+        main_logger.error(f"Could not load operators database: {e}")
+        operator_index = {}
+        return
+    if generated is not None:
+        try:
+            operator_records.compile_tables(op, OPERATORS_COMPILED_FILE)
+            operator_index = operator_records.OperatorRecords(OPERATORS_COMPILED_FILE)
+            main_logger.debug(f"Compiled {len(operator_index)} operators to \'{OPERATORS_COMPILED_FILE}\'.")
+            return
+        except (OSError, ValueError) as e:
+            main_logger.warning(f"Could not compile operators database, using it as-is. ({e})")
+    operator_index = {}
+    for letter in operator_records.ALPHABET:
+        for entry in getattr(op, f'{letter}_TABLE', []):
+            operator_index.setdefault(entry['3Ltr'], entry)
+    main_logger.debug(f"Loaded {len(operator_index)} operators.")
+
 def operator_lookup(callsign: str) -> dict | None:
-    """ Lookup the operator of a given callsign from our database. This will try to look at the cache first
-    from `callsign_lookup_cache` and then the lookup tables from `operators.py`. If there is a match, this function will
-    store the result in the cache for faster lookup, as it's expected this function will be called for each active plane inside
-    the given RANGE and at every `LOOP_INTERVAL`. Worst case scenario is when `NO_FILTER` is enabled + very active ADS-B site (~300 planes).
-    The LRU cache is used by the main loop and management handled by `AirplaneParser`. In NO_FILTER mode the LRU cache is never cleared.
+    """ Lookup the operator of a given callsign from our database. This uses `operator_index`, which is built
+    from the lookup tables in `operators.py` the first time this is called. It's expected this function will be called
+    for each active plane inside the given RANGE whenever its callsign changes.
+    Results are kept in `operator_cache` by 3 letter code, so all the flights of the same operator share one entry.
     Dictionary keys are `3Ltr`, `Company`, `Country`, `Telephony`, and `FriendlyName`. """
-    global callsign_lookup_cache
 
     def lookup(input: str) -> dict | None:
         # pre-filtering to minimize lookups (note this shouldn't be given an ICAO hex)
@@ -6132,62 +6735,72 @@ def operator_lookup(callsign: str) -> dict | None:
         if not (test_str := input[:3].upper()).isalpha():
             return None
 
-        # check our cache first
-        if (result := dict_lookup(callsign_lookup_cache, '3Ltr', test_str)) is not None:
-            return result
-        else:
-            # the way operators.py is structured allows us to implement a trie
-            try:
-                result = dict_lookup(getattr(op, f'{test_str[0]}_TABLE'), '3Ltr', test_str)
-            except AttributeError:
-                main_logger.debug(f"Attempt to look up a non-valid input: \'{input}\' evaluated as \'{test_str}\'")
-                return None
-            if result is not None:
-                callsign_lookup_cache.appendleft(result)
+        if not test_str.isascii(): # operators.py only has A-Z
+            main_logger.debug(f"Attempt to look up a non-valid input: \'{input}\' evaluated as \'{test_str}\'")
+            return None
+        if (result := operator_cache.get(test_str)) is not CACHE_MISS:
             return result
+        if operator_index is None:
+            load_operator_index()
+        result = operator_index.get(test_str)
+        operator_cache.put(test_str, result)
+        return result
 
     return lookup(callsign)
 
-@lru_cache(maxsize=500)
+def database_default(icao: str) -> dict:
+    """ What `database_lookup()` returns when the database has nothing for `icao`. """
+    return {
+        'icao': icao.upper(),
+        'reg': '',
+        'type': '',
+        'flags': 0, # 0 basically means 'none'
+        'desc': '',
+        'year': '',
+        'ownop': ''
+    }
+
 def database_lookup(input: str) -> dict:
     """ Functions exactly like `operator_lookup` but with tweaks to handle the database output.
-    Given an input ICAO hex, looks at the `database_lookup_cache` first, then uses the database module
-    to get a result and appends the result to the cache. Always returns a valid dictionary.
-    The LRU cache is used by the main loop and managed by `AirplaneParser` and `aircraft_db_checker()`. """
-    global database_lookup_cache, database_stats
-
-    def lookup(icao: str) -> dict:
-        default = {
-            'icao': icao.upper(),
-            'reg': '',
-            'type': '',
-            'flags': 0, # 0 basically means 'none'
-            'desc': '',
-            'year': '',
-            'ownop': ''
-        }
+    Given an input ICAO hex, looks at `aircraft_cache` first, then uses the database module
+    to get a result and adds the result to the cache. Always returns a valid dictionary.
+    To look up several at once, use `database_lookup_many()`. """
+    return database_lookup_many([input])[input]
+
+def database_lookup_many(icaos: list[str]) -> dict[str, dict]:
+    """ `database_lookup()` for a batch of ICAO hexes. Anything not in `aircraft_cache` is fetched from the database
+    in as few queries as possible (see `DatabaseHandler.fetch_many()`) and added to the cache.
+    Returns a dict with a valid result for each given ICAO hex. """
+    global database_stats
+    results = {}
+    to_fetch = []
+    for icao in icaos:
         if icao.startswith('~'):
-            return default
-        if (result := dict_lookup(database_lookup_cache, 'icao', icao.upper())) is not None:
-            return result
+            results[icao] = database_default(icao)
+        elif (result := aircraft_cache.get(icao.upper())) is CACHE_MISS:
+            to_fetch.append(icao)
         else:
-            error_check_init = db.query_errors
-            result = db.fetch(icao) # note: no need to use `.upper()` as that's handled by `fetch()` internally
-            error_check = db.query_errors
-            if result is None: # always return a valid dict of the same structure
-                result = default
-            if error_check_init == error_check:
-                # database query was successful, but found nothing for the provided icao
-                # thus, it is safe to append to the cache.
-                # If the query errored out, the result from the query is meaningless
-                database_lookup_cache.appendleft(result)
-            database_stats[0] = db.queries
-            database_stats[1] = db.query_misses
-            database_stats[2] = error_check
-            database_stats[3] = db.average_speed
-            database_stats[4] = db.last_access_speed
-        return result
-    return lookup(input)
+            results[icao] = result or database_default(icao)
+    if not to_fetch:
+        return results
+
+    fetched = db.fetch_many(to_fetch) # note: no need to use `.upper()` as that's handled by `fetch_many()` internally
+    for icao in to_fetch:
+        if icao in fetched:
+            # database query was successful, even if it found nothing for the provided icao
+            # thus, it is safe to add to the cache
+            aircraft_cache.put(icao.upper(), fetched[icao])
+            result = fetched[icao] or database_default(icao) # always return a valid dict of the same structure
+        else:
+            # the query errored out, the result from the query is meaningless
+            result = database_default(icao)
+        results[icao] = result
+    database_stats[0] = db.queries
+    database_stats[1] = db.query_misses
+    database_stats[2] = db.query_errors
+    database_stats[3] = db.average_speed
+    database_stats[4] = db.last_access_speed
+    return results
 
 def API_Scheduler() -> None:
     """ Thread that compares the current time to `API_SCHEDULE`. Controls the `API_schedule_triggered` global.
@@ -6385,13 +6998,43 @@ class synchronizer():
         self.control_error = 0
         self.control_integral = 0
         self.debug_file = Path(CURRENT_DIR, f'drift_calc_{datetime.datetime.now().strftime("%Y-%m-%dT%H%M%S")}.csv')
+        self.warm_started = False
+        if synchronizer_estimates is not None:
+            # restored from the warm-start snapshot, so we already know what Phase 1 would find out
+            try:
+                for name in self.ESTIMATES:
+                    setattr(self, name, float(synchronizer_estimates[name]))
+                self.warm_started = True
+            except (KeyError, TypeError, ValueError):
+                main_logger.debug("Timing estimates from the warm-start snapshot are unusable, starting from Phase 1.")
         self.run_loop()
 
+    ESTIMATES = (
+        'max_json_age', 'min_json_age', 'est_json_refresh', 'buffer_sec', 'avg_processing',
+        'min_processing', 'est_uncorrectable', 'max_uncorrectable', 'age_target'
+    )
+    """ What Phase 1 works out (and `drift_watcher()` keeps up to date), which is kept in `synchronizer_estimates` """
+
+    def publish_estimates(self) -> None:
+        """ Update `synchronizer_estimates` with where things stand. """
+        global synchronizer_estimates
+        estimates = {name: getattr(self, name) for name in self.ESTIMATES}
+        estimates['source'] = DUMP1090_JSON
+        estimates['loop_interval'] = LOOP_INTERVAL
+        synchronizer_estimates = estimates
+
     def sync(self, message) -> None:
         """ Does what it says on the can. """
         global lockstep_corrector, determined_time_offset
         # handle case when watchdog is triggered
-        if not DUMP1090_IS_AVAILABLE:
+        # or when the main loop is already synced to the json writes by `json_watcher`
+        # or when there's no json to sync to at all (`aircraft_stream`) or we're replaying a recording
+        if (
+            not DUMP1090_IS_AVAILABLE
+            or json_watcher is not None
+            or aircraft_stream is not None
+            or snapshot_player is not None
+        ):
             lockstep_corrector = 0.
             return
 
@@ -6485,13 +7128,21 @@ class synchronizer():
                 adjust_target()
                 self.json_age_data.clear()
                 determined_time_offset = self.est_uncorrectable
+                self.publish_estimates()
                 main_logger.debug(f"Correcting target to {self.age_target:.3f}s "
                                   f"({abs(self.age_target - self.min_json_age):.3f}s from minimum)"
                                   f", time offset: {determined_time_offset:.6f}s")
 
         phase_now = self.phase_stage
         if self.phase_stage == 0 and DUMP1090_IS_AVAILABLE: # start the work
-            self.phase_stage += 1
+            if self.warm_started:
+                # go straight to approaching the target we had before
+                self.phase_stage = 2
+                determined_time_offset = self.est_uncorrectable
+                main_logger.debug(f"Skipping Phase 1 using the estimates from before the restart: target {self.age_target:.3f} sec, "
+                                  f"time offset {determined_time_offset:.3f} sec")
+            else:
+                self.phase_stage += 1
             # # ********************* CSV logging for later analysis
             # if VERBOSE_MODE:
             #     with open(self.debug_file, 'w') as stats:
@@ -6562,6 +7213,7 @@ class synchronizer():
                                         f"A time difference of {determined_time_offset:.3f} seconds was detected between these two.")
                 self.time_difference = dump1090_json_age[0] - self.age_target
                 self.phase_stage += 1
+                self.publish_estimates()
 
         if self.phase_stage != phase_now:
             if self.phase_stage == 1:
@@ -6583,9 +7235,6 @@ class synchronizer():
                 main_logger.debug("Now maintaining targeted json age and adjusting target time when necessary.")
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
@@ -6650,9 +7299,8 @@ class DistantDeterminator():
             # trigger the preemptive logging again if the max distance changes by this much
             if (farthest['Distance'] - self.last_max_distance) / distance_multiplier >= 15:
                 preempt_log_bypass = True
-            farthest.update({'Datetime': datetime.datetime.now()})
             self.last_max_distance = farthest['Distance']
-            super_far_plane = farthest
+            super_far_plane = farthest.as_dict() | {'Datetime': datetime.datetime.now()}
         # preemptive logging for a really far plane
         if (
             self.last_max_distance / distance_multiplier >= 425
@@ -6684,9 +7332,6 @@ class DistantDeterminator():
         self._detected = False
 
     def run_loop(self):
-        def keep_alive():
-            self.loop.call_later(1, keep_alive)
-        keep_alive()
         self.loop.run_forever()
 
     def end_thread(self, message):
@@ -6702,6 +7347,20 @@ class wx_API():
         self.failed_calls = 0
         self._API_session = requests.Session()
 
+    def request_update(self) -> None:
+        """ Run `get_weather()` on `io_workers` so the caller doesn't wait on the weather API. Returns right away. """
+        try:
+            io_workers.submit(self._update)
+        except RuntimeError: # shutting down
+            pass
+
+    def _update(self) -> None:
+        """ `get_weather()` for `io_workers`; logs anything it raises, as nothing reads the job's result. """
+        try:
+            self.get_weather()
+        except Exception:
+            main_logger.exception("Weather updater caught an exception.")
+
     def get_weather(self) -> bool:
         """ Get our weather information. Writes to the global `WX_API_data`.
         Returns `True` on success, `False` on any failure.
@@ -9251,27 +9910,81 @@ main_scheduler.every().hour.at(":00").do(flyby_stats)
 main_scheduler.every().day.at("23:59:58").do(flyby_stats) # get us the day's total count before reset
 main_scheduler.every().hour.do(get_ip) # in case the IP changes
 
-try:
-    if PREFER_LOCAL and not is_posix:
-        main_logger.info("PREFER_LOCAL is enabled but this is not a posix system. Falling back to using the network.")
-    if NO_DUMP978_SEARCH:
-        main_logger.info("Searching for dump1090...")
-        dump1090_check()
+if REPLAY_FILE:
+    try:
+        snapshot_player = replay.SnapshotPlayer(REPLAY_FILE)
+    except (OSError, EOFError, ValueError) as e:
+        main_logger.critical(f"Could not open the recording \'{REPLAY_FILE}\' ({e})")
+        sys.exit(1)
+    replay_frames = iter(snapshot_player)
+    DUMP1090_JSON = REPLAY_FILE
+    DUMP1090_IS_AVAILABLE = True
+    # stand in for `read_1090_config()` using what was saved with the recording
+    dump1090_receiver_version = snapshot_player.metadata.get('receiver_version', '')
+    is_readsb = 'wiedehopf' in dump1090_receiver_version
+    if snapshot_player.metadata.get('lat') is not None and snapshot_player.metadata.get('lon') is not None:
+        rlat = float(snapshot_player.metadata['lat'])
+        rlon = float(snapshot_player.metadata['lon'])
+        LOCATION_IS_SET = True
+        build_location_boxes()
     else:
-        main_logger.info("Beginning search for both dump1090 and dump978...")
-        with CF.ThreadPoolExecutor(
-            max_workers=2,
-            thread_name_prefix="search-thread"
-            ) as search_thread_executor:
-            search_futures = [
-                search_thread_executor.submit(dump1090_check),
-                search_thread_executor.submit(dump978_check)
-                ]
-            for search_future in CF.as_completed(search_futures):
-                _ = search_future.result()
-except (ImportError, KeyboardInterrupt):
-    main_logger.critical("Exit commanded before full initialization could complete.")
-    sys.exit(1)
+        main_logger.warning("The recording does not have a location. No aircraft will be selected.")
+    main_logger.info(f"Replaying \'{REPLAY_FILE}\' "
+                     f"(recorded {snapshot_player.metadata.get('created', 'at an unknown time')})")
+else:
+    try:
+        if PREFER_LOCAL and not is_posix:
+            main_logger.info("PREFER_LOCAL is enabled but this is not a posix system. Falling back to using the network.")
+        if NO_DUMP978_SEARCH:
+            main_logger.info("Searching for dump1090...")
+            dump1090_check()
+        else:
+            main_logger.info("Beginning search for both dump1090 and dump978...")
+            with CF.ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix="search-thread"
+                ) as search_thread_executor:
+                search_futures = [
+                    search_thread_executor.submit(dump1090_check),
+                    search_thread_executor.submit(dump978_check)
+                    ]
+                for search_future in CF.as_completed(search_futures):
+                    _ = search_future.result()
+    except (ImportError, KeyboardInterrupt):
+        main_logger.critical("Exit commanded before full initialization could complete.")
+        sys.exit(1)
+
+if DUMP1090_STREAM and DUMP1090_IS_AVAILABLE and snapshot_player is None:
+    try:
+        from utilities.stream_input import AircraftStream
+        stream_host, stream_port = DUMP1090_STREAM.rsplit(':', 1)
+        aircraft_stream = AircraftStream(stream_host, int(stream_port), expiry=max(LOCATION_TIMEOUT * 5, 300))
+        aircraft_stream.start()
+        # give it a moment to connect so that the first loop has data
+        for _ in range(20):
+            if aircraft_stream.connected:
+                break
+            time.sleep(0.25)
+        if aircraft_stream.connected:
+            main_logger.info(f"Receiving aircraft data from the stream at \'{DUMP1090_STREAM}\'")
+        else:
+            main_logger.warning(f"Could not connect to the aircraft stream at \'{DUMP1090_STREAM}\' yet. "
+                                "FlightGazer will keep trying in the background.")
+    except ValueError:
+        aircraft_stream = None
+        main_logger.warning(f"DUMP1090_STREAM \'{DUMP1090_STREAM}\' is not in the form of host:port. Ignoring.")
+    except ImportError:
+        aircraft_stream = None
+        main_logger.warning("Failed to load the stream handler. Falling back to polling dump1090.")
+
+if USING_FILESYSTEM and WATCH_LOCAL_JSON and aircraft_stream is None:
+    try:
+        from utilities.json_watcher import JSONFileWatcher
+        json_watcher = JSONFileWatcher(DUMP1090_JSON)
+        main_logger.info(f"Watching the dump1090 json for updates (using {json_watcher.start()}).")
+    except ImportError:
+        json_watcher = None
+        main_logger.warning("Failed to load the json watcher. Falling back to polling dump1090 on a fixed interval.")
 
 if DUMP1090_JSON and DUMP978_JSON:
     main_logger.info("Both dump1090 and dump978 are available, setting up speed tweaks...")
@@ -9293,11 +10006,37 @@ session = requests.Session()
 """ Session object to be used for the dump1090 polling. (improves response times by ~1.25x) """
 suntimes()
 
+if RECORD_FILE and DUMP1090_IS_AVAILABLE:
+    snapshot_recorder = replay.SnapshotRecorder(
+        RECORD_FILE,
+        {
+            'FlightGazer_version': VERSION,
+            'created': datetime.datetime.now().astimezone().replace(microsecond=0).isoformat(),
+            'source': DUMP1090_STREAM if aircraft_stream is not None else (DUMP1090_BINCRAFT or DUMP1090_JSON),
+            'receiver_version': dump1090_receiver_version,
+            'lat': rlat,
+            'lon': rlon,
+            'loop_interval': LOOP_INTERVAL,
+        }
+    )
+    try:
+        snapshot_recorder.start()
+        main_logger.info(f"Recording all {dump1090} snapshots to \'{RECORD_FILE}\'")
+    except OSError as e:
+        main_logger.error(f"Could not create the recording \'{RECORD_FILE}\' ({e}). Nothing will be recorded.")
+        snapshot_recorder = None
+elif RECORD_FILE:
+    main_logger.warning(f"There is no {dump1090} connection to record from.")
+
 if DATABASE_FILE.exists():
     main_logger.info("Aircraft database is present.")
     try:
         from utilities.database_lookup import DatabaseHandler
-        db = DatabaseHandler(database_location=DATABASE_FILE, timeout=LOOP_INTERVAL)
+        db = DatabaseHandler(
+            database_location=DATABASE_FILE,
+            timeout=LOOP_INTERVAL,
+            index_location=DATABASE_INDEX_FILE
+        )
         DATABASE_CONNECTED = db.connect()
         if db.is_connected():
             main_logger.info(f"Successfully connected to \'{DATABASE_FILE}\'")
@@ -9310,6 +10049,10 @@ if DATABASE_FILE.exists():
                             "Some additional aircraft info may not be available.")
 else:
     main_logger.info("Aircraft database is unavailable.")
+load_operator_index()
+load_warm_start()
+if not REPLAY_FILE:
+    main_scheduler.every(10).minutes.do(write_warm_start)
 
 if API_KEY and API_PERSISTENT_CACHE:
     main_logger.info("API persistent cache feature is enabled, loading features...")
@@ -9319,6 +10062,7 @@ if API_KEY and API_PERSISTENT_CACHE:
         API_cache_present = api_cache.connect()
         if api_cache.is_connected():
             api_cache.prune()
+            main_scheduler.every(5).minutes.do(api_cache.flush) # new entries are otherwise only committed in batches
             main_logger.info(f"Successfully connected to \'{API_CACHE_DATABASE}\'")
         else:
             main_logger.error("Could not connect to the database.")
@@ -9347,10 +10091,11 @@ if OPENWEATHER_API_KEY and DISPLAY_IS_VALID:
 
                 # recall that since the scheduler handles jobs in the order they're registered
                 # this will be the last job executed at the top of each hour
-                main_scheduler.every().hour.at(":00").do(WX_stuff.get_weather)
-                main_scheduler.every().hour.at(":15").do(WX_stuff.get_weather)
-                main_scheduler.every().hour.at(":30").do(WX_stuff.get_weather)
-                main_scheduler.every().hour.at(":45").do(WX_stuff.get_weather)
+                # (the scheduler only hands it off to `io_workers` so that it doesn't wait on the weather API)
+                main_scheduler.every().hour.at(":00").do(WX_stuff.request_update)
+                main_scheduler.every().hour.at(":15").do(WX_stuff.request_update)
+                main_scheduler.every().hour.at(":30").do(WX_stuff.request_update)
+                main_scheduler.every().hour.at(":45").do(WX_stuff.request_update)
             else:
                 main_logger.info("OpenWeather API failed. Weather information will be unavailable.")
         else:
@@ -9361,6 +10106,67 @@ if OPENWEATHER_API_KEY and DISPLAY_IS_VALID:
         main_logger.info("OpenWeather API key is present but location is not set. "
                          "Weather information will be unavailable.")
 
+def replay_work_complete(message) -> None:
+    """ Tells the main loop that it can move on to the next replayed snapshot. """
+    replay_work_done.set()
+
+def replay_sample(loop_start: float, filter_time: float) -> None:
+    """ Collect the per-stage timings (ms) for the snapshot that was just replayed. """
+    samples = {
+        'fetch': process_time[0],
+        'json parsing': process_time2[2],
+        'filtering': filter_time,
+        'plane selection': round(process_time[1] - filter_time, 3),
+        'total': round((time.perf_counter() - loop_start) * 1000, 3),
+    }
+    if INTERACTIVE:
+        samples['console print'] = process_time2[0]
+    if state_json:
+        # the export runs alongside the next snapshot, so this is the one from the previous loop
+        samples['state export'] = process_time2[3]
+    for stage, sample in samples.items():
+        replay_samples.setdefault(stage, []).append(sample)
+    replay_samples.setdefault('aircraft', []).append(general_stats['Tracking'])
+
+def replay_report() -> None:
+    """ Summarize a finished replay, print it and write it next to the recording as json, then shut down. """
+    elapsed = time.perf_counter() - replay_start if replay_start else 0.
+    snapshots = len(replay_samples.get('total', []))
+    aircraft = replay_samples.pop('aircraft', [])
+    report = {
+        'recording': str(Path(REPLAY_FILE).absolute()),
+        'FlightGazer_version': VERSION,
+        'snapshots': snapshots,
+        'elapsed_s': round(elapsed, 3),
+        'snapshots_per_second': round(snapshots / elapsed, 3) if elapsed else 0.,
+        'avg_aircraft_per_snapshot': round(sum(aircraft) / len(aircraft), 1) if aircraft else 0.,
+        'peak_rss_MiB': replay.peak_rss_MiB(),
+        'stages_ms': {stage: replay.summarize(samples) for stage, samples in replay_samples.items()},
+    }
+    lines = [
+        f"Replayed {snapshots} snapshot(s) from \'{REPLAY_FILE}\' in {report['elapsed_s']} s "
+        f"({report['snapshots_per_second']} snapshots/s, "
+        f"{report['avg_aircraft_per_snapshot']} aircraft per snapshot on average)",
+        f"Peak memory usage: {report['peak_rss_MiB']} MiB",
+        f"{'Stage (ms)':<16}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+    ]
+    for stage, stats in report['stages_ms'].items():
+        lines.append(
+            f"{stage:<16}{stats['mean']:>10.3f}{stats['p50']:>10.3f}"
+            f"{stats['p90']:>10.3f}{stats['p99']:>10.3f}{stats['max']:>10.3f}"
+        )
+    report_file = Path(f"{REPLAY_FILE}.benchmark.json")
+    try:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
+        lines.append(f"Results written to \'{report_file}\'")
+    except OSError as e:
+        main_logger.error(f"Could not write benchmark results to \'{report_file}\' ({e})")
+    print("\n" + "\n".join(lines))
+    for line in lines:
+        main_logger.info(line)
+    os.kill(os.getpid(), signal.SIGTERM) # let the main thread do the usual shutdown
+
 def main() -> None:
     """ Enters the main loop. """
     # define our main threads
@@ -9368,7 +10174,6 @@ def main() -> None:
     periodic_stuff.start()
     main_stuff = threading.Thread(target=main_loop_generator, name='Main-Data-Loop', daemon=True)
     airplane_watcher = threading.Thread(target=AirplaneParser, name='Airplane-Parser', daemon=True)
-    api_getter = threading.Thread(target=APIFetcher, name='API-Fetch-Thread', daemon=True)
     receiver_stuff = threading.Thread(target=read_receiver_stats, name='Receiver-Poller', daemon=True)
     watchdog_stuff = threading.Thread(target=dump1090Watchdog, name='Dump1090-Watchdog', daemon=True)
     console_stuff = threading.Thread(target=PrintToConsole, name='Console-Printer', daemon=True)
@@ -9382,7 +10187,7 @@ def main() -> None:
     if SYSTEMD_WATCHDOG_SEC:
         watchdogging.start()
 
-    if INTERACTIVE and not INSIDE_TMUX:
+    if INTERACTIVE and not INSIDE_TMUX and not REPLAY_FILE:
         try:
             print("\nInteractive mode enabled. Pausing here for 15 seconds\n"
                 "so you can read the above output before we enter the main loop.")
@@ -9432,11 +10237,13 @@ def main() -> None:
 
     global dump1090
     dump1090 = "readsb" if is_readsb else "dump1090" # tweak our text output where necessary
+    if snapshot_player is not None:
+        dispatcher.connect(replay_work_complete, signal=LOOP_WORK_COMPLETE, sender=PrintToConsole.print_to_console)
     main_logger.debug("Firing up threads...")
     main_stuff.start()
     syncing_stuff.start()
     airplane_watcher.start()
-    api_getter.start()
+    APIFetcher() # only needs to exist; it stays connected to its signals and looks things up on `io_workers`
     receiver_stuff.start()
     watchdog_stuff.start()
     console_stuff.start()
@@ -1,18 +1,59 @@
 """ Module that handles the persistent API results cache. """
-""" Derived from the original `database_lookup.py` module. """
+""" Derived from the original `database_lookup.py` module.
+Run this module directly to benchmark lookups against caches of increasing size. """
 import sqlite3
+import threading
 from pathlib import Path
-from time import perf_counter, time
+from time import perf_counter, time, monotonic
 import logging
 from collections import deque
 
 database_logger = logging.getLogger("API-cache-handler")
 
+SCHEMA_VERSION = 1
+""" Stored in the database's `user_version`. Caches made before this existed are version 0 (no indexes). """
+COMMIT_BATCH = 10
+""" Commit new entries after this many have been added... """
+COMMIT_INTERVAL = 300
+""" ...or once the oldest uncommitted entry is this many seconds old, whichever comes first. """
+
+# kept as constants so sqlite3 reuses the prepared statements
+_FETCH_FLIGHT = "SELECT * FROM results WHERE Flight = ? AND Time > ?;"
+_FETCH_IDENTITY = "SELECT * FROM results WHERE Identity = ? AND Time > ? ORDER BY Time DESC LIMIT 1;"
+_UPSERT = """
+    INSERT INTO results (
+        Flight,
+        Identity,
+        Origin,
+        OriginICAO,
+        OriginName,
+        OriginCity,
+        Destination,
+        DestinationICAO,
+        DestinationName,
+        DestinationCity,
+        Time
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(Flight) DO UPDATE SET
+        Identity=excluded.Identity,
+        Origin=excluded.Origin,
+        OriginICAO=excluded.OriginICAO,
+        OriginName=excluded.OriginName,
+        OriginCity=excluded.OriginCity,
+        Destination=excluded.Destination,
+        DestinationICAO=excluded.DestinationICAO,
+        DestinationName=excluded.DestinationName,
+        DestinationCity=excluded.DestinationCity,
+        Time=excluded.Time;
+"""
+
 class APICacheHandler:
     """ Handles the database querying. Pass a path for the database location,
     a timeout in seconds, and an entry staleness limiter in days.
     Once this class is instantiated, use `.connect()` to initiate the database connection. Don't forget
-    to call `.close()` at some point! (preferably during shutdown) """
+    to call `.close()` at some point! (preferably during shutdown) as new entries are committed in batches
+    (see `COMMIT_BATCH` and `COMMIT_INTERVAL`); `.flush()` commits them right away. """
     def __init__(self, database_location, timeout: float=1, stale: int=30):
         self.database_path = Path(database_location).as_posix()
         self.queries = 0
@@ -26,6 +67,13 @@ class APICacheHandler:
         self._access_times = deque(maxlen=50)
         self.average_speed = 0.0
         self.stale_age = stale * 86400 # seconds
+        self.journal_mode = None
+        self._lock = threading.Lock()
+        self._cursor = None
+        """ Reused for every `.fetch()` """
+        self._pending = 0
+        """ Entries added but not committed yet """
+        self._pending_since = 0.
 
     def connect(self) -> bool:
         """ Connect to the database that was provided when this class was instanced.
@@ -60,9 +108,15 @@ class APICacheHandler:
                     );
                 """)
                 self._connection.commit()
+                self.journal_mode = cursor.execute("PRAGMA journal_mode=WAL;").fetchone()[0]
+                # with write-ahead logging this can only lose the last commits on power loss, not corrupt anything
+                cursor.execute("PRAGMA synchronous=NORMAL;")
+                database_logger.debug(f"Database journaling: {self.journal_mode}")
+                self._migrate(cursor)
                 linecount: tuple = self._connection.execute("SELECT COUNT(*) FROM results;").fetchone()
                 database_logger.info(f"Amount of entries in database: {linecount[0]}")
                 cursor.close()
+                self._cursor = self._connection.cursor()
                 # reset the stats upon connection
                 self.queries = 0
                 self.query_misses = 0
@@ -78,6 +132,21 @@ class APICacheHandler:
                 self._connection = None
                 return False
 
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        """ Bring the schema of an existing cache up to `SCHEMA_VERSION`. """
+        version = cursor.execute("PRAGMA user_version;").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        database_logger.info(f"Upgrading API cache from schema version {version} to {SCHEMA_VERSION}...")
+        start = perf_counter()
+        if version < 1:
+            # `Flight` is already indexed as the primary key; these cover looking up by `Identity` and pruning by `Time`
+            cursor.execute("CREATE INDEX IF NOT EXISTS results_identity_time ON results (Identity, Time);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS results_time ON results (Time);")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+        self._connection.commit()
+        database_logger.info(f"Upgrade took {(perf_counter() - start) * 1000:.1f} ms.")
+
     def fetch(self, flight: str) -> dict | None:
         """ Fetch the associated database row given a Flight. Returns `None` if no result or the database isn't connected yet.
         Valid keys in returned dict are:
@@ -89,20 +158,14 @@ class APICacheHandler:
         if self._connection is not None:
             try:
                 start = perf_counter()
-                # match the callsign; usually works
-                cursor = self._connection.execute(
-                    f"SELECT * FROM results WHERE Flight = ? AND time > strftime('%s', 'now') - ?;",
-                    (flight, self.stale_age)
-                )
-                # try and see if we can match what the API reported
-                if not (result := cursor.fetchone()):
-                    # in case of matching flights, use the latest one
-                    cursor = self._connection.execute(
-                        f"SELECT * FROM results WHERE Identity = ? AND time > strftime('%s', 'now') - ? ORDER BY time DESC;",
-                        (flight, self.stale_age)
-                    )
-                    result = cursor.fetchone()
-                cursor.close()
+                cutoff = time() - self.stale_age
+                with self._lock:
+                    # match the callsign; usually works
+                    result = self._cursor.execute(_FETCH_FLIGHT, (flight, cutoff)).fetchone()
+                    # try and see if we can match what the API reported
+                    if not result:
+                        # in case of matching flights, use the latest one
+                        result = self._cursor.execute(_FETCH_IDENTITY, (flight, cutoff)).fetchone()
                 self.last_access_speed = (perf_counter() - start) * 1000
                 self._access_times.appendleft(self.last_access_speed)
                 self.average_speed = sum(self._access_times) / len(self._access_times)
@@ -125,7 +188,7 @@ class APICacheHandler:
             return None
 
     def append(self, data: dict) -> None:
-        """ Add new data to this database. """
+        """ Add new data to this database. It's committed along with the next few, or by `.flush()`. """
         flight = data.get('Flight')
         type = data.get('Type')
         if not flight:
@@ -149,60 +212,53 @@ class APICacheHandler:
         destination_city = data.get('DestinationInfo')[1]
         time_now = time()
 
-        cursor = self._connection.cursor()
         try:
-            cursor.execute(
-                """
-                INSERT INTO results (
-                    Flight,
-                    Identity,
-                    Origin,
-                    OriginICAO,
-                    OriginName,
-                    OriginCity,
-                    Destination,
-                    DestinationICAO,
-                    DestinationName,
-                    DestinationCity,
-                    Time
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(Flight) DO UPDATE SET
-                    Identity=excluded.Identity,
-                    Origin=excluded.Origin,
-                    OriginICAO=excluded.OriginICAO,
-                    OriginName=excluded.OriginName,
-                    OriginCity=excluded.OriginCity,
-                    Destination=excluded.Destination,
-                    DestinationICAO=excluded.DestinationICAO,
-                    DestinationName=excluded.DestinationName,
-                    DestinationCity=excluded.DestinationCity,
-                    Time=excluded.Time;
-                """,
-                (
-                    flight,
-                    identity,
-                    origin,
-                    origin_icao,
-                    origin_name,
-                    origin_city,
-                    destination,
-                    destination_icao,
-                    destination_name,
-                    destination_city,
-                    time_now
+            with self._lock:
+                self._connection.execute(
+                    _UPSERT,
+                    (
+                        flight,
+                        identity,
+                        origin,
+                        origin_icao,
+                        origin_name,
+                        origin_city,
+                        destination,
+                        destination_icao,
+                        destination_name,
+                        destination_city,
+                        time_now
+                    )
                 )
-            )
-            self._connection.commit()
-            cursor.close()
+                if self._pending == 0:
+                    self._pending_since = monotonic()
+                self._pending += 1
+                self.commits += 1
+                if self._pending >= COMMIT_BATCH or monotonic() - self._pending_since >= COMMIT_INTERVAL:
+                    self._commit()
             database_logger.debug(f"Successfully added entry for \'{flight}\'")
-            self.commits += 1
 
         except sqlite3.Error as e:
             database_logger.exception(f"Could not commit to database: {e}")
             self.errors += 1
             return
 
+    def _commit(self) -> None:
+        """ Commit the pending entries. Must be called with `_lock` held. """
+        self._connection.commit()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """ Commit any entries that haven't been committed yet. """
+        if self._connection is None or self._pending == 0:
+            return
+        try:
+            with self._lock:
+                self._commit()
+        except sqlite3.Error as e:
+            database_logger.exception(f"Could not commit to database: {e}")
+            self.errors += 1
+
     def prune(self) -> None:
         """ Prune old entries from the database. """
         if self._connection is None:
@@ -210,20 +266,15 @@ class APICacheHandler:
             return
 
         database_logger.debug(f"Pruning database for entries older than {round(self.stale_age / 86400, 1)} days...")
-        cursor = self._connection.cursor()
         try:
-            linecount_start = self._connection.execute("SELECT COUNT(*) FROM results;").fetchone()
-            cursor.execute(
-                f"""
-                DELETE FROM results
-                WHERE Time < strftime('%s', 'now') - {self.stale_age};
-                """
-            )
-            self._connection.commit()
-            linecount_end = self._connection.execute("SELECT COUNT(*) FROM results;").fetchone()
-            database_logger.debug(f"Pruned {linecount_start[0] - linecount_end[0]} entries; "
+            with self._lock:
+                cursor = self._connection.execute("DELETE FROM results WHERE Time < ?;", (time() - self.stale_age,))
+                pruned = cursor.rowcount
+                self._commit() # also takes care of anything pending
+                linecount_end = self._connection.execute("SELECT COUNT(*) FROM results;").fetchone()
+                cursor.close()
+            database_logger.debug(f"Pruned {pruned} entries; "
                                 f"database now has {linecount_end[0]} entries.")
-            cursor.close()
         except sqlite3.Error as e:
             database_logger.exception(f"Failed to prune database: {e}")
             self.errors += 1
@@ -241,8 +292,63 @@ class APICacheHandler:
     def close(self) -> None:
         """ Close the connection. """
         if self._connection is not None:
+            self.flush()
             self._connection.close()
             database_logger.debug("Database successfully closed.")
             self._connection = None
         else:
-            database_logger.warning("Attempt to close database with no established connection.")
\ No newline at end of file
+            database_logger.warning("Attempt to close database with no established connection.")
+
+
+if __name__ == '__main__':
+    # benchmark lookups against caches of increasing size, before (schema version 0) and after the indexes
+    import random
+    import tempfile
+
+    logging.basicConfig(level=logging.WARNING)
+    random.seed(1090)
+    LOOKUPS = 2000
+
+    def _fill(handler: APICacheHandler, rows: int) -> list[tuple[str, str]]:
+        now = time()
+        entries = []
+        with handler._lock:
+            for i in range(rows):
+                flight = f"{random.choice(('AAL', 'DAL', 'UAL', 'SWA', 'JBU'))}{i}"
+                identity = f"{flight[:2]}{i}"
+                handler._connection.execute(
+                    _UPSERT,
+                    (flight, identity, 'ORD', 'KORD', 'Chicago O\'Hare', 'Chicago',
+                     'JFK', 'KJFK', 'John F. Kennedy', 'New York',
+                     now - random.uniform(0, handler.stale_age * 1.5))
+                )
+                entries.append((flight, identity))
+            handler._connection.commit()
+        return entries
+
+    def _time(handler: APICacheHandler, keys: list[str]) -> float:
+        start = perf_counter()
+        for key in keys:
+            handler.fetch(key)
+        return (perf_counter() - start) / len(keys) * 1e6
+
+    print(f"SQLite {sqlite3.sqlite_version}, average of {LOOKUPS} lookups (µs)")
+    print(f"{'rows':>7} {'schema':>6} | {'by Flight':>10} {'by Identity':>11} {'miss':>8} | {'prune (ms)':>10}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for rows in (1000, 10000, 100000):
+            for schema in (0, SCHEMA_VERSION):
+                handler = APICacheHandler(Path(temp_dir, f"bench_{rows}_{schema}.db"), stale=30)
+                handler.connect()
+                if schema == 0:
+                    handler._connection.execute("DROP INDEX results_identity_time;")
+                    handler._connection.execute("DROP INDEX results_time;")
+                entries = _fill(handler, rows)
+                sample = random.sample(entries, min(LOOKUPS, rows))
+                by_flight = _time(handler, [flight for flight, _ in sample])
+                by_identity = _time(handler, [identity for _, identity in sample])
+                miss = _time(handler, [f"ZZZ{i}" for i in range(LOOKUPS)])
+                start = perf_counter()
+                handler.prune()
+                prune_time = (perf_counter() - start) * 1000
+                handler.close()
+                print(f"{rows:>7} {schema:>6} | {by_flight:>10.1f} {by_identity:>11.1f} {miss:>8.1f} | {prune_time:>10.1f}")
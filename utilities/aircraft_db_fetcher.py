@@ -5,7 +5,7 @@ and all the volunteers for maintaining the actual database.
 This script was created for use with the FlightGazer project (https://github.com/WeegeeNumbuh1/FlightGazer).
 This database is covered by the ODC-By License (https://opendatacommons.org/licenses/by/1-0/). """
 # by WeegeeNumbuh1
-# Last updated: v.11.4.6
+# Last updated: v.11.7.0
 
 print("********** FlightGazer Aircraft Database Importer **********\n")
 import csv
@@ -27,6 +27,7 @@ from argparse import ArgumentParser
 script_start = perf_counter()
 CURRENT_DIR = Path(__file__).resolve().parent
 OUTPUT_FILE = Path(f"{CURRENT_DIR}/database.db")
+INDEX_FILE = Path(f"{CURRENT_DIR}/database.index")
 if os.name == 'posix':
     try:
         DB_OWNER = OUTPUT_FILE.owner()
@@ -89,6 +90,35 @@ def systemd_notify(message: str) -> None:
     with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as sock:
         sock.sendto(message.encode(), notify_socket)
 
+def write_index(version: str) -> None:
+    """ Build the memory-mapped index of the database that FlightGazer looks aircraft up from
+    (see `aircraft_index.py`), unless there already is one for this `version`.
+    FlightGazer queries the database directly if this fails, so it's not fatal. """
+    try:
+        import aircraft_index
+        try:
+            index = aircraft_index.AircraftIndex(INDEX_FILE)
+            index_ver = index.version
+            index.close()
+            if index_ver == version:
+                print("Aircraft index is up to date.")
+                return
+        except (OSError, ValueError):
+            pass
+        print(f"Building aircraft index at \'{INDEX_FILE}\'...")
+        index_start = perf_counter()
+        _index_conn = sqlite3.connect(f"file:{OUTPUT_FILE.as_posix()}?mode=ro", uri=True)
+        try:
+            index_count = aircraft_index.build_index(_index_conn, version, INDEX_FILE)
+        finally:
+            _index_conn.close()
+        if os.name == 'posix' and DB_OWNER:
+            chown(INDEX_FILE, user=DB_OWNER)
+        print(f"Indexed {index_count} aircraft in {perf_counter() - index_start:.2f} seconds. "
+              f"Index size: {INDEX_FILE.stat().st_size / (1024 * 1024):.3f} MiB")
+    except Exception as e:
+        print(f"Failed to build the aircraft index ({e}). FlightGazer will query the database directly.")
+
 fetcher_session = requests.Session()
 current_db_ver = None
 if (jrnl := Path(f"{CURRENT_DIR}/database.db-journal")).exists():
@@ -151,6 +181,7 @@ if current_db_ver is not None:
     if current_db_ver == db_ver:
         fetcher_session.close()
         print("Database versions are the same, no need to update.")
+        write_index(current_db_ver)
         print("\n***** Done. *****")
         sys.exit(0)
     else:
@@ -472,6 +503,7 @@ db_size_new = OUTPUT_FILE.stat().st_size
 print(f"Modifications took {perf_counter() - write_start:.2f} seconds.")
 print(f"Database size: {db_size_new / (1024 * 1024):.3f} MiB ")
 print(f"Deltas: {(db_size_new - db_size_old) / 1024:.2f} KiB, {total_changes} changes.")
+write_index(db_ver)
 print("\n***** Done. *****")
 print(f"Total wall time: {perf_counter() - script_start:.2f} seconds.")
 print("Database importer exiting...")
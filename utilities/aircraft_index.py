@@ -0,0 +1,158 @@
+""" Module that builds and reads a read-only, memory-mapped index of the aircraft database (`database.db`)
+on behalf of FlightGazer. Looking up an aircraft is a binary search over the file in place; no SQL statements,
+no `sqlite3.Row` objects, and the pages are shared between every process that has the file open.
+The SQLite database remains the source of truth; the index is rebuilt by `aircraft_db_fetcher.py` whenever
+the database changes and is only used while its version matches the database's.
+
+File format (little-endian, every section starts on a 4-byte boundary):
+- magic bytes `FGADB1\\n\\0`
+- 4-byte record count and 4-byte length, then the database version string (padded)
+- the keys: each ICAO as a 4-byte integer, sorted
+- the offsets: where each record starts in the heap, plus one more for where the last one ends (4 bytes each)
+- the heap: each record's fields (see `FIELDS`) in UTF-8, separated by `\\x1f`, with `\\x00` standing in for NULL """
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from pathlib import Path
+
+MAGIC = b'FGADB1\n\x00'
+_HEADER = struct.Struct('<II')
+FIELDS = ('reg', 'type', 'flags', 'desc', 'year', 'ownop')
+""" Fields stored for each aircraft besides its `icao` """
+INTEGER_FIELDS = ('flags', 'year')
+""" Fields stored as integers in the database (when they have a value) """
+SEPARATOR = '\x1f'
+NULL = '\x00'
+TABLE_CHARS = '0123456789ABCDEF'
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+def _pad(length: int) -> int:
+    return -length % 4
+
+def _encode(value) -> str:
+    if value is None:
+        return NULL
+    return str(value).replace(SEPARATOR, ' ')
+
+def _decode(value: str, integer: bool):
+    """ Reverses `_encode()`. For the integer fields, SQLite would have already turned
+    any text that looks like an integer into one, so anything that looks like one was one. """
+    if value == NULL:
+        return None
+    if integer and value.lstrip('-').isdigit() and str(int(value)) == value:
+        return int(value)
+    return value
+
+def build_index(connection, version: str, destination) -> int:
+    """ Write an index of every aircraft in the database at `connection` (an open `sqlite3` connection)
+    to `destination`, tagged with the database `version`. Rows are read one table at a time in order, so this
+    doesn't need to hold the database in memory. The file is replaced atomically.
+    Returns the number of aircraft indexed. Raises `ValueError` if the database isn't sorted the way it should be. """
+    destination = Path(destination)
+    heap_file = destination.with_name(f"{destination.name}.heap.tmp")
+    temp_file = destination.with_name(f"{destination.name}.tmp")
+    keys = bytearray()
+    offsets = bytearray()
+    heap_size = 0
+    last_key = -1
+    try:
+        with open(heap_file, 'wb') as heap:
+            for char in TABLE_CHARS:
+                cursor = connection.execute(
+                    f"SELECT icao, {', '.join(FIELDS)} FROM ICAO_{char} ORDER BY icao"
+                )
+                for row in cursor:
+                    icao = row[0]
+                    # only index what `DatabaseHandler.fetch()` could ever find for a real ICAO hex
+                    if not isinstance(icao, str) or len(icao) != 6 or icao != icao.upper():
+                        continue
+                    try:
+                        key = int(icao, 16)
+                    except ValueError:
+                        continue
+                    if key <= last_key:
+                        raise ValueError(f"aircraft database is not in order at \'{icao}\'")
+                    last_key = key
+                    record = SEPARATOR.join(_encode(value) for value in row[1:]).encode('utf-8')
+                    keys += key.to_bytes(4, 'little')
+                    offsets += heap_size.to_bytes(4, 'little')
+                    heap.write(record)
+                    heap_size += len(record)
+                cursor.close()
+        offsets += heap_size.to_bytes(4, 'little')
+        count = len(keys) // 4
+
+        version_bytes = version.encode('utf-8')
+        with open(temp_file, 'wb') as f:
+            header = MAGIC + _HEADER.pack(count, len(version_bytes)) + version_bytes
+            f.write(header + b'\x00' * _pad(len(header)))
+            f.write(keys)
+            f.write(offsets)
+            with open(heap_file, 'rb') as heap:
+                while chunk := heap.read(1048576):
+                    f.write(chunk)
+        os.replace(temp_file, destination)
+    finally:
+        heap_file.unlink(missing_ok=True)
+        temp_file.unlink(missing_ok=True)
+    return count
+
+class AircraftIndex:
+    """ Reads aircraft out of a file made by `build_index()`. Pass the file path.
+    Use `.get()` to look up an ICAO hex; `.version` is the version of the database it was made from.
+    Raises `OSError` if the file can't be opened and `ValueError` if it isn't an aircraft index. """
+    def __init__(self, file_location):
+        self.file_path = Path(file_location)
+        with open(self.file_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        try:
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"\'{self.file_path}\' is not an aircraft index")
+            count, version_length = _HEADER.unpack_from(self._map, len(MAGIC))
+            header_length = len(MAGIC) + _HEADER.size + version_length
+            self.version: str = self._map[header_length - version_length:header_length].decode('utf-8')
+            keys_start = header_length + _pad(header_length)
+            offsets_start = keys_start + count * 4
+            self._heap_start = offsets_start + (count + 1) * 4
+            if self._heap_start > len(self._map):
+                raise ValueError(f"\'{self.file_path}\' is truncated")
+            if sys.byteorder == 'little':
+                # look at the keys and offsets right where they are in the file
+                self._keys = self._view[keys_start:offsets_start].cast('I')
+                self._offsets = self._view[offsets_start:self._heap_start].cast('I')
+            else:
+                self._keys = struct.unpack_from(f'<{count}I', self._map, keys_start)
+                self._offsets = struct.unpack_from(f'<{count + 1}I', self._map, offsets_start)
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise ValueError(str(e)) from None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, icao: str) -> dict | None:
+        """ The database row for an ICAO hex as a dict (same keys and values as `DatabaseHandler.fetch()`),
+        or `None` if it isn't in the database. """
+        if len(icao) != 6 or not _HEX_DIGITS.issuperset(icao):
+            return None
+        key = int(icao, 16)
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return None
+        start = self._heap_start + self._offsets[i]
+        end = self._heap_start + self._offsets[i + 1]
+        result = {'icao': f"{key:06X}"}
+        for field, value in zip(FIELDS, str(self._view[start:end], 'utf-8').split(SEPARATOR)):
+            result[field] = _decode(value, field in INTEGER_FIELDS)
+        return result
+
+    def close(self) -> None:
+        # the views have to be let go before the map can be closed
+        for view in ('_keys', '_offsets'):
+            if isinstance(getattr(self, view, None), memoryview):
+                getattr(self, view).release()
+        self._view.release()
+        self._map.close()
@@ -0,0 +1,94 @@
+""" Module that holds the record FlightGazer keeps for each aircraft it's processing (what the main loop calls a "loop packet").
+A record has a fixed set of fields (see `FIELDS`, and `main_loop_generator.dump1090_loop()` for what they mean) stored in
+slots, which takes well under half the memory of a dict with the same keys. Fields can be read as
+attributes (`record.Flight`, the fastest way and what FlightGazer itself uses) or like a dict (`record['Flight']`,
+`record.get('Flight')`) so code written for the old dicts keeps working. Use `.as_dict()` where a real dict is needed, such as for json. """
+
+FIELDS = (
+    'ID', 'Flight', 'Country', 'Altitude', 'Speed', 'Distance', 'Direction', 'DirectionDegrees',
+    'Latitude', 'Longitude', 'Track', 'VertSpeed', 'RSSI', 'Elevation', 'SlantRange',
+    'Operator', 'Telephony', 'OperatorAKA', 'Owner', 'AircraftDesc', 'ICAOType', 'CategoryDesc',
+    'TrackingFlag', 'Registration', 'Squawk', 'Priority', 'Source', 'OnGround', 'Distressed',
+    'NavigationAccuracy', 'ApproachRate', 'FutureLatitude', 'FutureLongitude', 'FutureDistance',
+    'Flyby', 'Staleness', 'Timestamp',
+)
+_FIELD_SET = frozenset(FIELDS)
+
+class AircraftRecord:
+    """ One aircraft in one loop. Every field has to be given (as keywords) when it's made.
+    Fields can be changed until the record is handed to the other threads (see `utilities/loop_snapshot.py`). """
+    __slots__ = FIELDS
+
+    def __init__(self, *, ID, Flight, Country, Altitude, Speed, Distance, Direction, DirectionDegrees,
+                 Latitude, Longitude, Track, VertSpeed, RSSI, Elevation, SlantRange,
+                 Operator, Telephony, OperatorAKA, Owner, AircraftDesc, ICAOType, CategoryDesc,
+                 TrackingFlag, Registration, Squawk, Priority, Source, OnGround, Distressed,
+                 NavigationAccuracy, ApproachRate, FutureLatitude, FutureLongitude, FutureDistance,
+                 Flyby, Staleness, Timestamp):
+        self.ID = ID
+        self.Flight = Flight
+        self.Country = Country
+        self.Altitude = Altitude
+        self.Speed = Speed
+        self.Distance = Distance
+        self.Direction = Direction
+        self.DirectionDegrees = DirectionDegrees
+        self.Latitude = Latitude
+        self.Longitude = Longitude
+        self.Track = Track
+        self.VertSpeed = VertSpeed
+        self.RSSI = RSSI
+        self.Elevation = Elevation
+        self.SlantRange = SlantRange
+        self.Operator = Operator
+        self.Telephony = Telephony
+        self.OperatorAKA = OperatorAKA
+        self.Owner = Owner
+        self.AircraftDesc = AircraftDesc
+        self.ICAOType = ICAOType
+        self.CategoryDesc = CategoryDesc
+        self.TrackingFlag = TrackingFlag
+        self.Registration = Registration
+        self.Squawk = Squawk
+        self.Priority = Priority
+        self.Source = Source
+        self.OnGround = OnGround
+        self.Distressed = Distressed
+        self.NavigationAccuracy = NavigationAccuracy
+        self.ApproachRate = ApproachRate
+        self.FutureLatitude = FutureLatitude
+        self.FutureLongitude = FutureLongitude
+        self.FutureDistance = FutureDistance
+        self.Flyby = Flyby
+        self.Staleness = Staleness
+        self.Timestamp = Timestamp
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"AircraftRecord({self.as_dict()})"
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in _FIELD_SET else default
+
+    def keys(self) -> tuple[str, ...]:
+        return FIELDS
+
+    def as_dict(self) -> dict:
+        """ A plain dict of this record with the same keys the loop packets have always had. """
+        return {field: getattr(self, field) for field in FIELDS}
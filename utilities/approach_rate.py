@@ -0,0 +1,72 @@
+""" Module that keeps a short history of each aircraft's slant range on behalf of FlightGazer's plane selector.
+Each aircraft gets a small ring buffer of `(timestamp, slant range)` samples that is updated in place once per loop,
+so working out its approach rate doesn't require going through every plane of every past snapshot.
+Samples only count while their snapshot is still within the last `window` snapshots, the same as keeping
+the last `window` snapshots in a deque. """
+from collections import deque
+
+class ApproachRateTracker:
+    """ Sliding window history of the relevant planes' slant ranges. Feed it the relevant planes list
+    (dicts with the `ID`, `SlantRange`, and `Timestamp` keys) once per loop with `.record()`, and use
+    `.approach_rate()` to get a plane's approach rate from the recorded snapshots. """
+    def __init__(self, window: int = 5):
+        self.window = window
+        self._snapshot = 0
+        """ Sequence number of the last recorded snapshot """
+        self._history: dict[str, deque] = {}
+
+    def record(self, planes: list[dict]) -> None:
+        """ Add a snapshot of planes. The oldest snapshot drops out once there are more than `window` of them. """
+        self._snapshot += 1
+        snapshot = self._snapshot
+        for plane in planes:
+            if (samples := self._history.get(plane.get('ID'))) is None:
+                samples = self._history[plane.get('ID')] = deque(maxlen=self.window)
+            samples.appendleft((snapshot, plane.get('Timestamp'), plane.get('SlantRange')))
+        if snapshot % self.window == 0:
+            # drop planes that haven't been in any of the snapshots still in the window
+            oldest = snapshot - self.window
+            for id_ in [id_ for id_, samples in self._history.items() if samples[0][0] <= oldest]:
+                del self._history[id_]
+
+    def clear(self) -> None:
+        self._history.clear()
+
+    def dump(self) -> dict:
+        """ The recorded history, for saving elsewhere. Timestamps are left as they were given. """
+        return {
+            'snapshot': self._snapshot,
+            'planes': {plane_id: list(samples) for plane_id, samples in list(self._history.items())},
+        }
+
+    def restore(self, state: dict, shift: float = 0.) -> None:
+        """ Put back a history from `.dump()`, adding `shift` to the timestamps
+        (to move them onto the clock used for the `Timestamp` of new snapshots). """
+        self._snapshot = state['snapshot']
+        self._history = {
+            plane_id: deque(
+                ((snapshot, timestamp + shift, slant_range) for snapshot, timestamp, slant_range in samples),
+                maxlen=self.window
+            )
+            for plane_id, samples in state['planes'].items()
+        }
+
+    def samples(self, plane_id: str) -> list[tuple[float, float]]:
+        """ `(timestamp, slant range)` samples for a plane still within the window, newest first. """
+        if (samples := self._history.get(plane_id)) is None:
+            return []
+        oldest = self._snapshot - self.window
+        return [(timestamp, slant_range) for snapshot, timestamp, slant_range in samples if snapshot > oldest]
+
+    def approach_rate(self, plane_id: str) -> float:
+        """ Average rate of change of the plane's slant range over the window, in units per hour
+        (positive when approaching). Returns 0 if there aren't at least two samples. """
+        samples = self.samples(plane_id)
+        if len(samples) <= 1:
+            return 0.
+        rates = [
+            (samples[i + 1][1] - samples[i][1]) * 3600 /
+            (samples[i][0] - samples[i + 1][0])
+            for i in range(len(samples) - 1)
+        ]
+        return round(sum(rates) / len(rates), 3)
@@ -0,0 +1,64 @@
+""" Module that does FlightGazer's per-aircraft geometry for a whole snapshot at once using NumPy.
+Each function here mirrors its scalar counterpart in `FlightGazer.py` (same formulas, same order of operations)
+but works on arrays, which pays off once there are more than a few dozen aircraft to go through.
+Values are returned unrounded; FlightGazer rounds them the same way it rounds the scalar results.
+If NumPy isn't available, `NUMPY_IMPORTED` is False and nothing here should be used. """
+
+try:
+    import numpy as np
+    NUMPY_IMPORTED = True
+except ImportError:
+    NUMPY_IMPORTED = False
+
+EARTH_RADIUS = 3440
+""" Earth arithmetic mean radius defined by the IUGG in nautical miles """
+
+def columns(aircraft: list[dict], *keys: str):
+    """ Pull `keys` out of a list of aircraft dicts into float arrays, one per key.
+    Missing or `None` values become NaN. """
+    return tuple(np.array([a.get(key) for a in aircraft], dtype=float) for key in keys)
+
+def positions(aircraft: list[dict]):
+    """ Latitude and longitude arrays for a list of aircraft dicts. Positions that are missing
+    or exactly (0, 0) (which dump1090 uses for an invalid position) become NaN. """
+    lat, lon = columns(aircraft, 'lat', 'lon')
+    invalid = (lat == 0) & (lon == 0)
+    lat[invalid] = np.nan
+    lon[invalid] = np.nan
+    return lat, lon
+
+def greatcircle(lat0: float, lon0: float, lat1, lon1, distance_multiplier: float = 1):
+    """ Distance from (`lat0`, `lon0`) to each of the points in `lat1`, `lon1` (in the selected units).
+    Same as `greatcircle()`; NaN where there is no position. """
+    lat0 = lat0 * np.pi / 180.0
+    lon0 = lon0 * np.pi / 180.0
+    lat1 = lat1 * np.pi / 180.0
+    lon1 = lon1 * np.pi / 180.0
+    # clip to guard against rounding pushing this just outside of acos' domain when a point is at the origin
+    cos_angle = np.clip(
+        np.sin(lat0) * np.sin(lat1)
+        + np.cos(lat0) * np.cos(lat1) * np.cos(np.abs(lon1 - lon0)),
+        -1.0,
+        1.0
+    )
+    return EARTH_RADIUS * distance_multiplier * np.arccos(cos_angle)
+
+def bearing(lat0: float, lon0: float, lat1, lon1):
+    """ Direction in degrees (-180 to 180) of each point from (`lat0`, `lon0`).
+    Same as the calculation in `relative_direction()` when `rdir` isn't given; NaN where there is no position. """
+    return np.arctan2((lon1 - lon0), (lat1 - lat0)) * (180 / np.pi)
+
+def elevation_and_slant(greatcircle_dist, altitude, distance_multiplier: float = 1, altitude_multiplier: float = 1):
+    """ Elevation angles (degrees) and slant ranges (selected units) for arrays of distances and altitudes.
+    Same as `elevation_and_slant()`, including returning 0 for both when the distance is zero or negative. """
+    with np.errstate(invalid='ignore'):
+        drop_in_height = EARTH_RADIUS * (1 - np.cos(greatcircle_dist / (EARTH_RADIUS * distance_multiplier)))
+        dist_nm = (greatcircle_dist / distance_multiplier)
+        alt_nm = altitude / (altitude_multiplier * 6076.115)
+        alt_apparent = alt_nm - drop_in_height
+        slant_range = np.sqrt(dist_nm**2 + alt_nm**2)
+        elevation = np.degrees(np.arctan2(alt_apparent, dist_nm))
+    no_distance = ~(greatcircle_dist > 0)
+    elevation[no_distance] = 0.
+    slant_range[no_distance] = 0.
+    return elevation, slant_range * distance_multiplier
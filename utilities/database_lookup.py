@@ -4,15 +4,22 @@ from pathlib import Path
 from time import perf_counter
 import logging
 from collections import deque
+from utilities.aircraft_index import AircraftIndex
 
 database_logger = logging.getLogger("database-handler")
+MAX_BATCH = 500
+""" Most ICAOs to put in a single query (older SQLite versions allow at most 999 parameters) """
 
 class DatabaseHandler:
     """ Handles the database querying. Pass a path for the database location and a timeout in seconds.
+    Optionally, pass the path of an aircraft index built from the database (see `aircraft_index.py`); while it's
+    for the same version as the database, lookups go through it instead of SQLite.
     Once this class is instantiated, use `.connect()` to initiate the database connection. Don't forget
     to call `.close()` at some point! (preferably during shutdown) """
-    def __init__(self, database_location, timeout: float = 1):
+    def __init__(self, database_location, timeout: float = 1, index_location = None):
         self.database_path = Path(database_location).as_posix()
+        self.index_path = Path(index_location) if index_location is not None else None
+        self._index: AircraftIndex | None = None
         self.queries = 0
         self.query_misses = 0
         self.query_errors = 0
@@ -47,6 +54,7 @@ class DatabaseHandler:
                     self.last_access_speed = 0.0
                     self._access_times.clear()
                     self.average_speed = 0.0
+                    self._load_index()
             return True
         else:
             try:
@@ -67,6 +75,7 @@ class DatabaseHandler:
                         f"created on: {result['created_date']}"
                     )
                     database_logger.debug(f"Database journaling: {self.journal_mode}")
+                    self._load_index()
                     # reset the stats upon connection
                     self.queries = 0
                     self.query_misses = 0
@@ -89,6 +98,29 @@ class DatabaseHandler:
                 self._connection = None
                 return False
 
+    def _load_index(self) -> None:
+        """ Start using the aircraft index if there is one for the current database version; stop using it otherwise. """
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self.index_path is None:
+            return
+        try:
+            index = AircraftIndex(self.index_path)
+        except FileNotFoundError:
+            database_logger.debug("No aircraft index available, querying the database directly.")
+            return
+        except (OSError, ValueError) as e:
+            database_logger.warning(f"Could not load aircraft index, querying the database directly. ({e})")
+            return
+        if index.version != self.database_version:
+            database_logger.info(f"Aircraft index is for a different database version ({index.version}), "
+                                 "querying the database directly.")
+            index.close()
+            return
+        self._index = index
+        database_logger.info(f"Using aircraft index with {len(index)} entries.")
+
     def fetch(self, icao: str) -> dict | None:
         """ Fetch the associated database row given an ICAO. Returns `None` if no result or the database isn't connected yet.
         Valid keys in returned dict are `icao`, `reg`, `type`, `flags`, `desc`, `year`, `ownop`.
@@ -98,9 +130,13 @@ class DatabaseHandler:
         if self._connection is not None:
             try:
                 start = perf_counter()
-                cursor = self._connection.execute(f"SELECT * FROM ICAO_{icao[0]} WHERE icao = ?", (icao.upper(),))
-                result = cursor.fetchone()
-                cursor.close()
+                if self._index is not None:
+                    result = self._index.get(icao)
+                else:
+                    cursor = self._connection.execute(f"SELECT * FROM ICAO_{icao[0]} WHERE icao = ?", (icao.upper(),))
+                    if (result := cursor.fetchone()) is not None:
+                        result = dict(result)
+                    cursor.close()
                 self.last_access_speed = (perf_counter() - start) * 1000
                 self._access_times.appendleft(self.last_access_speed)
                 self.average_speed = sum(self._access_times) / len(self._access_times)
@@ -114,12 +150,58 @@ class DatabaseHandler:
             return None
         if result:
             # database_logger.debug(f"Database hit for {icao}, lookup took {self.last_access_speed:.3f} ms")
-            return dict(result)
+            return result
         else:
             database_logger.info(f"Rare event! Could not find database entry for \'{icao}\'")
             self.query_misses += 1
             return None
 
+    def fetch_many(self, icaos) -> dict[str, dict | None]:
+        """ Same as `fetch()`, but for a whole batch of ICAOs at once using one query per table.
+        Returns a dict keyed by each given ICAO (as given) with its row, or `None` if there was no result.
+        ICAOs whose query failed are left out of the returned dict. `queries` and `query_misses` count each ICAO;
+        `query_errors` counts each failed query. The access speed stats are for the whole batch. """
+        results = {}
+        if self._connection is None:
+            database_logger.debug("Attempt to query database with no connection.")
+            self.query_errors += 1
+            return results
+        start = perf_counter()
+        if self._index is not None:
+            tables = {'index': list(icaos)}
+        else:
+            tables: dict[str, list[str]] = {}
+            for icao in icaos:
+                tables.setdefault(icao[0].upper(), []).append(icao)
+        for table, batch in tables.items():
+            for i in range(0, len(batch), MAX_BATCH):
+                chunk = batch[i:i + MAX_BATCH]
+                try:
+                    if self._index is not None:
+                        rows = {icao.upper(): self._index.get(icao) for icao in chunk}
+                    else:
+                        cursor = self._connection.execute(
+                            f"SELECT * FROM ICAO_{table} WHERE icao IN ({','.join('?' * len(chunk))})",
+                            [icao.upper() for icao in chunk]
+                        )
+                        rows = {row['icao']: dict(row) for row in cursor.fetchall()}
+                        cursor.close()
+                except sqlite3.Error as e:
+                    database_logger.exception(f"{e}")
+                    self.query_errors += 1
+                    continue
+                for icao in chunk:
+                    if (result := rows.get(icao.upper())) is None:
+                        database_logger.info(f"Rare event! Could not find database entry for \'{icao}\'")
+                        self.query_misses += 1
+                    results[icao] = result
+                self.queries += len(chunk)
+        if results:
+            self.last_access_speed = (perf_counter() - start) * 1000
+            self._access_times.appendleft(self.last_access_speed)
+            self.average_speed = sum(self._access_times) / len(self._access_times)
+        return results
+
     def is_connected(self) -> bool:
         """ Check if we are connected to the database. """
         if self._connection is not None:
@@ -129,6 +211,9 @@ class DatabaseHandler:
 
     def close(self) -> None:
         """ Close the connection. """
+        if self._index is not None:
+            self._index.close()
+            self._index = None
         if self._connection is not None:
             self._connection.close()
             database_logger.debug("Database successfully closed.")
@@ -0,0 +1,116 @@
+""" Module that holds the lookups FlightGazer enriches aircraft with (aircraft database rows by ICAO hex,
+operators by callsign) so the same aircraft and airlines aren't looked up again every time they show up during the day.
+This is the hot tier in front of the slower sources (the aircraft database and `operators.bin`): a size-bounded LRU
+with optional expiry, which keeps its contents when the area empties out. The owner decides when the contents are
+no longer valid (e.g. when the aircraft database version changes) and calls `.clear()`.
+Results that came back empty can be cached as well (negative caching), with their own expiry. """
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+MISSING = object()
+""" Returned by `EnrichmentCache.get()` when there is nothing cached (`None` can be a cached result) """
+
+class EnrichmentCache:
+    """ LRU cache of lookup results. `maxsize` is the most entries kept; the least recently used one is evicted
+    to make room. Entries expire `ttl` seconds after they were added (`None` means they don't expire).
+    `None` results are only kept if `negative_ttl` is given, and expire after that many seconds.
+    Safe to use from multiple threads. """
+    def __init__(self, maxsize: int, ttl: float | None = None, negative_ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict = OrderedDict()
+        """ key -> (expiry time or None, value), least recently used first """
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """ The cached result for `key`, or `MISSING` if there isn't one (or it expired). """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.misses += 1
+                return MISSING
+            expiry, value = entry
+            if expiry is not None and monotonic() >= expiry:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            if value is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        """ Cache `value` for `key`. `None` is only cached when negative caching is enabled. """
+        if value is None:
+            if self.negative_ttl is None:
+                return
+            ttl = self.negative_ttl
+        else:
+            ttl = self.ttl
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl if ttl is not None else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        """ Change `maxsize`, evicting the least recently used entries if there are now too many. """
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def dump(self) -> list[list]:
+        """ Everything that's cached as `[key, expiry, value]` (least recently used first), for saving elsewhere.
+        The expiry is on the monotonic clock, or `None`. """
+        with self._lock:
+            return [[key, expiry, value] for key, (expiry, value) in self._entries.items()]
+
+    def restore(self, entries: list[list], shift: float = 0.) -> int:
+        """ Put back entries from `.dump()`, adding `shift` to their expiry (to move them onto this monotonic clock).
+        Entries that have since expired are skipped. Returns how many were restored. """
+        now = monotonic()
+        restored = 0
+        with self._lock:
+            for key, expiry, value in entries:
+                if expiry is not None and (expiry := expiry + shift) <= now:
+                    continue
+                self._entries[key] = (expiry, value)
+                self._entries.move_to_end(key)
+                restored += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return restored
+
+    def clear(self) -> None:
+        """ Drop everything that's cached (the counters are kept). """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """ Counters for the state file. """
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.maxsize,
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': round((self.hits + self.negative_hits) / lookups, 3) if lookups else 0.,
+        }
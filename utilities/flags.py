@@ -6,8 +6,10 @@ Annex 10 Vol III, Second Edition, July 2007 (with amendments through 92, 2024-11
 Matches this commit: https://github.com/wiedehopf/tar1090/commit/28d21edcf86182eb066b569af916feb4085656ac
 Previously: 38cfa15353f9dcbee4ed1433f6873fe2a4356997
 Last update: November 2025
+The ranges are compiled into a flat, sorted table when this module is imported so that a lookup is a binary search.
+Run this module directly to check the table against a scan of `ICAO_Ranges` and to benchmark the two.
 """
-from functools import lru_cache
+from bisect import bisect_right
 
 ICAO_Ranges = [
     {"start": 0x004000, "end": 0x0047FF, "country": "Zimbabwe", "country_code": "zw"},
@@ -235,15 +237,69 @@ ICAO_Ranges = [
     # {"start": 0xF00000, "end": 0xFFFFFF, "country": "Unassigned (reserved for future use)", "country_code": "??"},
 ]
 
-@lru_cache(maxsize=500)
+def _compile_ranges(ranges: list[dict]) -> tuple[list[int], list[str]]:
+    """ Flatten `ranges` into the starts of consecutive, non-overlapping segments and each segment's country code
+    ('??' for the gaps). Where ranges overlap, the one listed first wins, same as scanning the list in order. """
+    boundaries: dict[int, tuple[list[int], list[int]]] = {}
+    for i, entry in enumerate(ranges):
+        boundaries.setdefault(entry['start'], ([], []))[0].append(i)
+        boundaries.setdefault(entry['end'] + 1, ([], []))[1].append(i)
+    starts: list[int] = []
+    codes: list[str] = []
+    active: set[int] = set()
+    for point in sorted(boundaries):
+        opening, closing = boundaries[point]
+        active.difference_update(closing)
+        active.update(opening)
+        code = ranges[min(active)]['country_code'] if active else "??"
+        if codes and codes[-1] == code:
+            continue # same as the segment before it, so just extend that one
+        starts.append(point)
+        codes.append(code)
+    return starts, codes
+
+_SEGMENT_STARTS, _SEGMENT_CODES = _compile_ranges(ICAO_Ranges)
+
 def getICAO(icao: str) -> str:
     """ Returns country code from ICAO Range. Input must be a hexadecimal as string. Returns '??' if no match. """
     try:
         if icao.startswith("~"): return "??"
-        hexa = int(icao, 16)
-        for entry in ICAO_Ranges:
-            if hexa >= entry['start'] and hexa <= entry['end']:
-                return entry['country_code']
-        return "??"
+        i = bisect_right(_SEGMENT_STARTS, int(icao, 16)) - 1
+        if i < 0:
+            return "??"
+        return _SEGMENT_CODES[i]
     except Exception:
-        return "??"
\ No newline at end of file
+        return "??"
+
+if __name__ == '__main__':
+    import random
+    from timeit import timeit
+
+    def scan(icao: str) -> str:
+        """ The original lookup, for reference: go through `ICAO_Ranges` until one matches. """
+        try:
+            if icao.startswith("~"): return "??"
+            hexa = int(icao, 16)
+            for entry in ICAO_Ranges:
+                if hexa >= entry['start'] and hexa <= entry['end']:
+                    return entry['country_code']
+            return "??"
+        except Exception:
+            return "??"
+
+    print(f"{len(ICAO_Ranges)} ranges compiled into {len(_SEGMENT_STARTS)} segments.")
+    # every edge of every range, plus a spread of random addresses and some bad input
+    edges = {value + offset for entry in ICAO_Ranges
+             for value in (entry['start'], entry['end']) for offset in (-1, 0, 1)}
+    random.seed(0)
+    samples = [f"{value:06x}" for value in sorted(edges | {random.randrange(0x1000000) for _ in range(100000)})
+               if value >= 0]
+    samples += ["~a1b2c3", "", "zzzzzz", "1000000"]
+    mismatches = [icao for icao in samples if getICAO(icao) != scan(icao)]
+    print(f"Checked {len(samples)} addresses: {len(mismatches)} mismatches {mismatches[:10]}")
+
+    hexes = [f"{random.randrange(0x1000000):06x}" for _ in range(5000)]
+    for name, function in (("linear scan", scan), ("bisect", getICAO)):
+        elapsed = timeit(lambda: [function(icao) for icao in hexes], number=20)
+        print(f"{name:>12}: {elapsed / (20 * len(hexes)) * 1e6:.2f} us per lookup")
+    raise SystemExit(1 if mismatches else 0)
\ No newline at end of file
@@ -0,0 +1,164 @@
+""" Module that watches a local dump1090/readsb json file for updates on behalf of FlightGazer.
+Uses inotify (Linux only) through `ctypes` when available and falls back to polling the file's metadata otherwise. """
+import os
+import ctypes
+import ctypes.util
+import struct
+import select
+import logging
+from pathlib import Path
+from time import monotonic, sleep
+
+watcher_logger = logging.getLogger("json-watcher")
+
+# from <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct('iIII') # wd, mask, cookie, len
+
+class JSONFileWatcher:
+    """ Watches a json file that is atomically rewritten by its producer (dump1090 and its derivatives write to a
+    temporary file and rename it over the old one). Pass the path of the json file and a polling interval (in seconds)
+    for when inotify is unavailable. Once this class is instantiated, use `.start()` to begin watching, then
+    `.wait()` to block until the file has been rewritten. Don't forget to call `.close()` at some point! """
+    def __init__(self, file_location, poll_interval: float = 0.05):
+        self.file_path = Path(file_location)
+        self.backend = ''
+        """ Either `inotify` or `polling` once started. """
+        self.events = 0
+        """ How many file updates have been seen. """
+        self._poll_interval = poll_interval
+        self._fd = None
+        self._libc = None
+        self._last_signature = None
+
+    def start(self) -> str:
+        """ Begin watching the file. Tries inotify first and falls back to polling. Returns the backend in use. """
+        if self.backend:
+            return self.backend
+        if self._setup_inotify():
+            self.backend = 'inotify'
+        else:
+            self.backend = 'polling'
+            self._last_signature = self._signature()
+        watcher_logger.debug(f"Watching \'{self.file_path}\' using {self.backend}.")
+        return self.backend
+
+    def _setup_inotify(self) -> bool:
+        """ Set up an inotify watch on the parent directory. We watch the directory as the file itself
+        is replaced on every write, which would otherwise invalidate a watch placed on the file. """
+        if not hasattr(os, 'uname') or os.uname().sysname != 'Linux':
+            return False
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            wd = self._libc.inotify_add_watch(
+                fd,
+                os.fsencode(self.file_path.parent),
+                _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF
+            )
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+            self._fd = fd
+            return True
+        except (OSError, AttributeError) as e:
+            watcher_logger.debug(f"inotify is unavailable ({e}), falling back to polling.")
+            self._fd = None
+            return False
+
+    def _signature(self) -> tuple | None:
+        """ A cheap fingerprint of the file used when polling. """
+        try:
+            s = os.stat(self.file_path)
+            return (s.st_ino, s.st_mtime_ns, s.st_size)
+        except OSError:
+            return None
+
+    def _drain(self) -> bool:
+        """ Read all queued inotify events. Returns `True` if any of them were for our file.
+        If the watched directory goes away, switch over to polling. """
+        updated = False
+        name = os.fsencode(self.file_path.name)
+        while True:
+            try:
+                buffer = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            except OSError:
+                buffer = b''
+            if not buffer:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                event_name = buffer[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                    watcher_logger.warning(f"Lost the watch on \'{self.file_path.parent}\', falling back to polling.")
+                    self._close_fd()
+                    self.backend = 'polling'
+                    self._last_signature = self._signature()
+                    return True
+                if event_name == name:
+                    updated = True
+        return updated
+
+    def wait(self, timeout: float) -> bool:
+        """ Block for up to `timeout` seconds until the file is rewritten. Returns `True` if an update was seen
+        (including one that landed since the last call or `.clear()`), `False` if we timed out. """
+        if not self.backend: # not started or already closed
+            sleep(max(timeout, 0))
+            return False
+        deadline = monotonic() + max(timeout, 0)
+        if self.backend == 'inotify':
+            while (remaining := deadline - monotonic()) > 0:
+                try:
+                    ready, _, _ = select.select([self._fd], [], [], remaining)
+                except (OSError, ValueError):
+                    break
+                if ready and self._drain():
+                    self.events += 1
+                    return True
+                if self.backend != 'inotify':
+                    break
+            if self.backend == 'inotify':
+                return False
+        while True:
+            signature = self._signature()
+            if signature is not None and signature != self._last_signature:
+                self._last_signature = signature
+                self.events += 1
+                return True
+            if (remaining := deadline - monotonic()) <= 0:
+                return False
+            sleep(min(self._poll_interval, remaining))
+
+    def clear(self) -> None:
+        """ Forget any updates that happened since the last `.wait()`. """
+        if self.backend == 'inotify':
+            self._drain()
+        elif self.backend == 'polling':
+            self._last_signature = self._signature()
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def close(self) -> None:
+        """ Stop watching the file. """
+        self._close_fd()
+        self.backend = ''
+        watcher_logger.debug(f"Stopped watching \'{self.file_path}\'.")
@@ -0,0 +1,25 @@
+""" Module that holds what FlightGazer's main loop publishes every time it processes a dump1090 snapshot.
+Each tick makes a new `LoopSnapshot` and swaps it in place of the last one in a single assignment, so the
+other threads can hold on to whichever one they picked up and read it without copying it or locking anything.
+Nothing in a snapshot is changed after it's published; the next tick makes a new one instead. """
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+from utilities.aircraft_record import AircraftRecord
+
+class LoopSnapshot(NamedTuple):
+    """ One tick of the main loop. `sequence` goes up by one every tick, so a reader can tell whether it has
+    already seen this one. `started` is the `perf_counter()` time the main loop started on it.
+    `stats` is the read-only `general_stats` and `planes` holds the `relevant_planes` of this tick,
+    the same `AircraftRecord`s the main loop made. """
+    sequence: int
+    started: float
+    stats: Mapping
+    planes: tuple[AircraftRecord, ...]
+
+EMPTY_SNAPSHOT = LoopSnapshot(0, 0., MappingProxyType({'Tracking': 0, 'Range': 0.}), ())
+""" What there is before the main loop has published anything """
+
+def publish(previous: LoopSnapshot, started: float, stats: dict, planes) -> LoopSnapshot:
+    """ The snapshot that comes after `previous`. `stats` and `planes` are copied, so the caller can keep using them.
+    The planes themselves are not copied; don't change them once they're published. """
+    return LoopSnapshot(previous.sequence + 1, started, MappingProxyType(dict(stats)), tuple(planes))
@@ -0,0 +1,127 @@
+""" Module that compiles the lookup tables in `operators.py` into a compact, sorted binary file
+and reads operators back out of it on demand (memory-mapped), so FlightGazer doesn't need to import
+`operators.py` and keep thousands of dicts around just to look up the few dozen operators it sees in a day.
+`operators.py` remains the source of truth; the compiled file is rebuilt whenever it's out of date.
+
+File format:
+- magic bytes `FGOPS1\\n`
+- 4-byte record count and 4-byte length (little-endian), then the `GENERATED` timestamp of the source `operators.py`
+- the index: for each record in order of its 3 letter code, the code (3 bytes), its offset into the data (4 bytes),
+  and its length (2 bytes)
+- the data: each record's fields (see `FIELDS`) in UTF-8, separated by tabs """
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from pathlib import Path
+
+MAGIC = b'FGOPS1\n'
+_HEADER = struct.Struct('<II')
+_ENTRY = struct.Struct('<3sIH')
+FIELDS = ('Company', 'Country', 'Telephony', 'FriendlyName')
+""" Fields stored for each operator besides its `3Ltr` code """
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def read_generated(source) -> str | None:
+    """ Get the `GENERATED` timestamp out of an `operators.py` without importing it.
+    Returns `None` if the file doesn't exist or doesn't have one (older versions). """
+    try:
+        with open(source, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f):
+                if line.startswith('GENERATED = '):
+                    return line.split('=', 1)[1].strip().strip('\'"')
+                if line_number > 50: # it's always near the top
+                    break
+    except OSError:
+        pass
+    return None
+
+def compile_tables(operators_module, destination) -> int:
+    """ Write the `A_TABLE` to `Z_TABLE` lookup tables of an imported `operators.py` to `destination`.
+    If a code shows up more than once, the first one wins. Returns the number of records written.
+    The file is replaced atomically. Raises `OSError` if it can't be written. """
+    records: dict[bytes, bytes] = {}
+    for letter in ALPHABET:
+        for entry in getattr(operators_module, f'{letter}_TABLE', []):
+            code = entry['3Ltr'].encode('ascii')
+            if len(code) != 3 or code in records:
+                continue
+            records[code] = '\t'.join(
+                str(entry.get(field) or '').replace('\t', ' ') for field in FIELDS
+            ).encode('utf-8')
+    generated = str(getattr(operators_module, 'GENERATED', '')).encode('utf-8')
+
+    index = bytearray()
+    data = bytearray()
+    for code in sorted(records):
+        index += _ENTRY.pack(code, len(data), len(records[code]))
+        data += records[code]
+
+    destination = Path(destination)
+    temp_file = destination.with_name(f"{destination.name}.tmp")
+    with open(temp_file, 'wb') as f:
+        f.write(MAGIC + _HEADER.pack(len(records), len(generated)) + generated)
+        f.write(index)
+        f.write(data)
+    os.replace(temp_file, destination)
+    return len(records)
+
+class _Codes:
+    """ Sequence view of the codes in the index so `bisect` can search it in place. """
+    def __init__(self, buffer, start: int, count: int):
+        self._buffer = buffer
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        position = self._start + i * _ENTRY.size
+        return self._buffer[position:position + 3]
+
+class OperatorRecords:
+    """ Reads operators out of a file made by `compile_tables()`. Pass the file path.
+    Use `.get()` to look up a 3 letter code; records are read from the file only when asked for.
+    Raises `OSError` if the file can't be opened and `ValueError` if it isn't a compiled operators file. """
+    def __init__(self, file_location):
+        self.file_path = Path(file_location)
+        with open(self.file_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"\'{self.file_path}\' is not a compiled operators file")
+            count, generated_length = _HEADER.unpack_from(self._map, len(MAGIC))
+            index_start = len(MAGIC) + _HEADER.size + generated_length
+            self.generated: str = self._map[index_start - generated_length:index_start].decode('utf-8')
+            self._index_start = index_start
+            self._data_start = index_start + count * _ENTRY.size
+            if self._data_start > len(self._map):
+                raise ValueError(f"\'{self.file_path}\' is truncated")
+            self._codes = _Codes(self._map, index_start, count)
+        except (ValueError, struct.error) as e:
+            self._map.close()
+            raise ValueError(str(e)) from None
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def get(self, code: str) -> dict | None:
+        """ The record for a 3 letter code, with the keys `3Ltr`, `Company`, `Country`, `Telephony`,
+        and `FriendlyName` (same as the entries in `operators.py`), or `None` if there isn't one. """
+        try:
+            key = code.encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        i = bisect_left(self._codes, key)
+        if i == len(self._codes) or self._codes[i] != key:
+            return None
+        _, offset, length = _ENTRY.unpack_from(self._map, self._index_start + i * _ENTRY.size)
+        start = self._data_start + offset
+        values = self._map[start:start + length].decode('utf-8').split('\t')
+        record = {'3Ltr': code}
+        record.update(zip(FIELDS, values))
+        return record
+
+    def close(self) -> None:
+        self._map.close()
@@ -412,6 +412,15 @@ except Exception as e:
     restore_old()
     valid_check = False
 
+if valid_check:
+    # FlightGazer reads from a compiled copy of the database; it would rebuild this itself, but may as well do it now
+    try:
+        import operator_records
+        compiled_path = Path(current_path, 'operators.bin')
+        print(f"Compiled {operator_records.compile_tables(op, compiled_path)} entries to {compiled_path}.")
+    except Exception as e:
+        print(f"Could not compile the new database (FlightGazer will try again when it starts): {e}")
+
 print(f"Total wall time: {perf_counter() - script_start:.2f} seconds.")
 print("\n***** Done. *****")
 if valid_check:
@@ -0,0 +1,61 @@
+""" Module that scores the aircraft in the area to decide which one FlightGazer should focus on next.
+Each aircraft gets a weighted score from a set of criteria (see `Criterion`); the default criteria are how close
+the aircraft is (line of sight) and how quickly it's approaching. More can be added, or the weights changed,
+by handing `Prioritizer` a different set of criteria without touching the selection algorithm itself. """
+from heapq import heapify, heappop
+from operator import attrgetter
+from typing import Callable, Container, NamedTuple
+
+class Criterion(NamedTuple):
+    """ One thing to score aircraft on. `value` gets the raw value from an aircraft. The raw values are scaled
+    across the aircraft being scored so that the smallest scores `low` and the largest scores `high`
+    (when they're all the same, everyone scores 0), then multiplied by `weight`. """
+    name: str
+    weight: float
+    value: Callable
+    low: float = 0.
+    high: float = 1.
+
+DEFAULT_CRITERIA: tuple[Criterion, ...] = (
+    # closer to the site has a higher priority
+    Criterion('line of sight', 0.6, attrgetter('SlantRange'), low=1., high=0.),
+    # scales between -1 and 1 so that a plane that's about to leave the area is held back
+    Criterion('approach rate', 0.4, attrgetter('ApproachRate'), low=-1., high=1.),
+)
+""" The weights add to 1, so scores range from -0.4 to 1 """
+
+class Prioritizer:
+    """ Scores aircraft with `criteria` (defaults to `DEFAULT_CRITERIA`) and picks the best one. """
+    def __init__(self, criteria: tuple[Criterion, ...] = DEFAULT_CRITERIA):
+        self.criteria = tuple(criteria)
+
+    def scores(self, planes) -> list[float]:
+        """ The score of each of `planes` (in the same order), rounded to 3 decimal places. """
+        totals = [0.] * len(planes)
+        for criterion in self.criteria:
+            values = [criterion.value(plane) for plane in planes]
+            if not values:
+                break
+            smallest = min(values)
+            spread = max(values) - smallest
+            if spread <= 0:
+                continue
+            span = criterion.high - criterion.low
+            for i, value in enumerate(values):
+                totals[i] += (criterion.low + (span * (value - smallest) / spread)) * criterion.weight
+        return [round(total, 3) for total in totals]
+
+    def ranked(self, planes):
+        """ Go through the IDs of `planes` from the best score to the worst. Ties go to whichever comes first in `planes`.
+        Only sorts as much as it needs to, for callers that stop at the first one that works. """
+        heap = [(-score, i) for i, score in enumerate(self.scores(planes))]
+        heapify(heap)
+        while heap:
+            yield planes[heappop(heap)[1]].ID
+
+    def best(self, planes, exclude: Container[str] = ()) -> str | None:
+        """ The ID of the best scoring of `planes` that isn't in `exclude`, or `None` if there isn't one. """
+        for id_ in self.ranked(planes):
+            if id_ not in exclude:
+                return id_
+        return None
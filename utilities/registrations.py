@@ -7,10 +7,14 @@ working backwards to an algorithm that generates that pattern,
 spot-checking aircraft to see if it worked.
 YMMV.
 Translated to Python from:
-https://github.com/wiedehopf/tar1090/blob/master/html/registrations.js by WeegeeNumbuh1 """
+https://github.com/wiedehopf/tar1090/blob/master/html/registrations.js by WeegeeNumbuh1
+The ranges of every scheme are laid out in one sorted table when this module is imported, so a lookup
+is a binary search and then a single decode. Run this module directly to check the table against trying
+each scheme in turn (over the whole 24-bit address space) and to benchmark the two. """
 
 from math import floor
-from functools import lru_cache
+from bisect import bisect_right
+from functools import partial
 
 limited_alphabet = "ABCDEFGHJKLMNPQRSTUVWXYZ" # 24 chars; no I, O
 full_alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ" # 26 chars
@@ -105,191 +109,242 @@ for mapping in stride_mappings:
 for i, entry in enumerate(numeric_mappings):
     numeric_mappings[i]['end'] = entry['start'] + entry['count'] - 1
 
-@lru_cache(maxsize=500)
-def registration_from_hexid(hexid_input: str) -> str | None:
-    """ Hex id needs to be a string. Returns a registration or None. """
-    # input validation
-    try:
-        # convert to int
-        if hexid_input.startswith("~"): return None
-        hexid_input = int(hexid_input, 16)
-    except:
-        return None
+def _n_reg(hexid: int) -> str | None:
+    # US N-numbers
+    def n_letter(rem) -> str:
+        if (rem == 0):
+            return ""
 
-    def stride_reg(hexid) -> str | None:
-        # try the mappings in stride_mappings
-        for mapping in stride_mappings:
-            if (hexid < mapping['start'] or hexid > mapping['end']):
-                continue
-
-            offset = hexid - mapping['start'] + mapping['offset']
-
-            i1 = floor(offset / mapping['s1'])
-            offset = offset % mapping['s1']
-            i2 = floor(offset / mapping['s2'])
-            offset = offset % mapping['s2']
-            i3 = offset
-
-            if (i1 < 0
-                or i1 >= len(mapping['alphabet'])
-                or i2 < 0
-                or i2 >= len(mapping['alphabet'])
-                or i3 < 0 or i3 >= len(mapping['alphabet'])
-                ):
-                continue
-
-            return mapping['prefix'] + mapping['alphabet'][i1] + mapping['alphabet'][i2] + mapping['alphabet'][i3]
-        else:
-            # nothing
-            return None
-
-    def numeric_reg(hexid) -> str | None:
-        # try the mappings in numeric_mappings
-        for mapping in numeric_mappings:
-            if (hexid < mapping['start'] or hexid > mapping['end']):
-                continue
+        rem -= 1
+        return limited_alphabet[rem]
 
-            reg = f"{(hexid - mapping['start'] + mapping['first'])}"
-            return mapping['template'][:len(mapping['template']) - len(reg)] + reg
-        else:
-            return None
+    def n_letters(rem) -> str:
+        if (rem == 0):
+            return ""
 
-    def n_reg(hexid) -> str | None:
-        # US N-numbers
-        def n_letter(rem) -> str:
-            if (rem == 0):
-                return ""
+        rem -= 1
+        return limited_alphabet[floor(rem / 25)] + n_letter(rem % 25)
 
-            rem -= 1
-            return limited_alphabet[rem]
+    offset = hexid - 0xA00001
+    if (offset < 0 or offset >= 915399):
+        return None
 
-        def n_letters(rem) -> str:
-            if (rem == 0):
-                return ""
+    digit1 = floor(offset / 101711) + 1
+    reg = "N" + f"{digit1}"
+    offset = offset % 101711
+    if (offset <= 600):
+        # Na, NaA .. NaZ, NaAA .. NaZZ
+        return reg + n_letters(offset)
 
-            rem -= 1
-            return limited_alphabet[floor(rem / 25)] + n_letter(rem % 25)
+    # Na0* .. Na9*
+    offset -= 601
 
-        offset = hexid - 0xA00001
-        if (offset < 0 or offset >= 915399):
-            return None
+    digit2 = floor(offset / 10111)
+    reg = reg + f"{digit2}"
+    offset = offset % 10111
 
-        digit1 = floor(offset / 101711) + 1
-        reg = "N" + f"{digit1}"
-        offset = offset % 101711
-        if (offset <= 600):
-            # Na, NaA .. NaZ, NaAA .. NaZZ
-            return reg + n_letters(offset)
+    if (offset <= 600):
+        # Nab, NabA..NabZ, NabAA..NabZZ
+        return reg + n_letters(offset)
 
-        # Na0* .. Na9*
-        offset -= 601
+    # Nab0* .. Nab9*
+    offset -= 601
 
-        digit2 = floor(offset / 10111)
-        reg = reg + f"{digit2}"
-        offset = offset % 10111
+    digit3 = floor(offset / 951)
+    reg = reg + f"{digit3}"
+    offset = offset % 951
 
-        if (offset <= 600):
-            # Nab, NabA..NabZ, NabAA..NabZZ
-            return reg + n_letters(offset)
+    if (offset <= 600):
+        # Nabc, NabcA .. NabcZ, NabcAA .. NabcZZ
+        return reg + n_letters(offset)
 
-        # Nab0* .. Nab9*
-        offset -= 601
+    # Nabc0* .. Nabc9*
+    offset -= 601
 
-        digit3 = floor(offset / 951)
-        reg = reg + f"{digit3}"
-        offset = offset % 951
+    digit4 = floor(offset / 35)
+    reg = reg + f"{digit4}"
+    offset = offset % 35
 
-        if (offset <= 600):
-            # Nabc, NabcA .. NabcZ, NabcAA .. NabcZZ
-            return reg + n_letters(offset)
+    if (offset <= 24):
+        # Nabcd, NabcdA .. NabcdZ
+        return reg + n_letter(offset)
 
-        # Nabc0* .. Nabc9*
-        offset -= 601
+    # Nabcd0 .. Nabcd9
+    offset -= 25
+    return reg + f"{offset}"
 
-        digit4 = floor(offset / 35)
-        reg = reg + f"{digit4}"
-        offset = offset % 35
+# South Korea
+def _hl_reg(hexid: int) -> str | None:
+    if (hexid >= 0x71BA00 and hexid <= 0x71BF99):
+        return "HL" + hex(hexid - 0x71BA00 + 0x7200)[2:]
 
-        if (offset <= 24):
-            # Nabcd, NabcdA .. NabcdZ
-            return reg + n_letter(offset)
+    if (hexid >= 0x71C000 and hexid <= 0x71C099):
+        return "HL" + hex(hexid - 0x71C000 + 0x8000)[2:]
 
-        # Nabcd0 .. Nabcd9
-        offset -= 25
-        return reg + f"{offset}"
+    if ((hexid >= 0x71C200 and hexid <= 0x71C399)
+        or (hexid >= 0x71500 and hexid <= 0x71599)
+        or (hexid >= 0x71700 and hexid <= 0x71799)
+    ):
+        # note: 71C400 - 71C499 and 71C600 - 71C699 are unallocated
+        return "HL" + hex(hexid - 0x71C200 + 0x8200)[2:]
 
-    # South Korea
-    def hl_reg(hexid) -> str | None:
-        if (hexid >= 0x71BA00 and hexid <= 0x71BF99):
-            return "HL" + hex(hexid - 0x71BA00 + 0x7200)[2:]
+    return None
 
-        if (hexid >= 0x71C000 and hexid <= 0x71C099):
-            return "HL" + hex(hexid - 0x71C000 + 0x8000)[2:]
+# Japan
+def _ja_reg(hexid: int) -> str | None:
+    offset = hexid - 0x840000
+    if (offset < 0 or offset >= 229840):
+        return None
 
-        if ((hexid >= 0x71C200 and hexid <= 0x71C399)
-            or (hexid >= 0x71500 and hexid <= 0x71599)
-            or (hexid >= 0x71700 and hexid <= 0x71799)
-        ):
-            # note: 71C400 - 71C499 and 71C600 - 71C699 are unallocated
-            return "HL" + hex(hexid - 0x71C200 + 0x8200)[2:]
+    reg = "JA"
 
+    digit1 = floor(offset / 22984)
+    if (digit1 < 0 or digit1 > 9):
         return None
+    reg = reg + f"{digit1}"
+    offset = offset % 22984
 
-    # Japan
-    def ja_reg(hexid) -> str | None:
-        offset = hexid - 0x840000
-        if (offset < 0 or offset >= 229840):
-            return None
-
-        reg = "JA"
-
-        digit1 = floor(offset / 22984)
-        if (digit1 < 0 or digit1 > 9):
-            return None
-        reg = reg + f"{digit1}"
-        offset = offset % 22984
-
-        digit2 = floor(offset / 916)
-        if (digit2 < 0 or digit2 > 9):
-            return None
-        reg = reg + f"{digit2}"
-        offset = offset % 916
-
-        if (offset < 340):
-            # 3rd is a digit, 4th is a digit or letter
-            digit3 = floor(offset / 34)
-            reg = reg + f"{digit3}"
-            offset = offset % 34
-
-            if (offset < 10):
-                # 4th is a digit
-                return reg + f"{offset}"
-
-            # 4th is a letter
-            offset -= 10
-            return reg + limited_alphabet[offset]
-
-        # 3rd and 4th are letters
-        offset -= 340
-        letter3 = floor(offset / 24)
-        return reg + limited_alphabet[letter3] + limited_alphabet[offset % 24]
-
-    def lookup(hexid) -> str | None:
-        if (reg := n_reg(hexid)) is not None:
-            return reg
+    digit2 = floor(offset / 916)
+    if (digit2 < 0 or digit2 > 9):
+        return None
+    reg = reg + f"{digit2}"
+    offset = offset % 916
 
-        if (reg := ja_reg(hexid)) is not None:
-            return reg
+    if (offset < 340):
+        # 3rd is a digit, 4th is a digit or letter
+        digit3 = floor(offset / 34)
+        reg = reg + f"{digit3}"
+        offset = offset % 34
+
+        if (offset < 10):
+            # 4th is a digit
+            return reg + f"{offset}"
+
+        # 4th is a letter
+        offset -= 10
+        return reg + limited_alphabet[offset]
+
+    # 3rd and 4th are letters
+    offset -= 340
+    letter3 = floor(offset / 24)
+    return reg + limited_alphabet[letter3] + limited_alphabet[offset % 24]
+
+def _numeric_reg(mapping: dict, hexid: int) -> str | None:
+    # decode a hexid within one of the ranges in numeric_mappings
+    reg = f"{(hexid - mapping['start'] + mapping['first'])}"
+    return mapping['template'][:len(mapping['template']) - len(reg)] + reg
+
+def _stride_reg(mapping: dict, hexid: int) -> str | None:
+    # decode a hexid within one of the ranges in stride_mappings
+    offset = hexid - mapping['start'] + mapping['offset']
+
+    i1 = floor(offset / mapping['s1'])
+    offset = offset % mapping['s1']
+    i2 = floor(offset / mapping['s2'])
+    offset = offset % mapping['s2']
+    i3 = offset
+
+    if (i1 < 0
+        or i1 >= len(mapping['alphabet'])
+        or i2 < 0
+        or i2 >= len(mapping['alphabet'])
+        or i3 < 0 or i3 >= len(mapping['alphabet'])
+        ):
+        return None
 
-        if (reg := hl_reg(hexid)) is not None:
+    return mapping['prefix'] + mapping['alphabet'][i1] + mapping['alphabet'][i2] + mapping['alphabet'][i3]
+
+def _compile_schemes() -> tuple[list[int], list[tuple]]:
+    """ Lay out the hexid ranges of every scheme above as consecutive, non-overlapping segments. Returns the start
+    of each segment and the decoders for it, in the order they would be tried (same order as the original lookup:
+    US, Japan, South Korea, then `numeric_mappings` and `stride_mappings` in order). Most segments have one decoder;
+    the ones outside of every scheme have none. """
+    schemes = [
+        (0xA00001, 0xA00001 + 915399 - 1, _n_reg),
+        (0x840000, 0x840000 + 229840 - 1, _ja_reg),
+        (0x71BA00, 0x71BF99, _hl_reg),
+        (0x71C000, 0x71C099, _hl_reg),
+        (0x71C200, 0x71C399, _hl_reg),
+        (0x71500, 0x71599, _hl_reg),
+        (0x71700, 0x71799, _hl_reg),
+    ]
+    schemes += [(mapping['start'], mapping['end'], partial(_numeric_reg, mapping)) for mapping in numeric_mappings]
+    schemes += [(mapping['start'], mapping['end'], partial(_stride_reg, mapping)) for mapping in stride_mappings]
+
+    boundaries: dict[int, tuple[list[int], list[int]]] = {0: ([], [])}
+    for i, (start, end, _) in enumerate(schemes):
+        boundaries.setdefault(start, ([], []))[0].append(i)
+        boundaries.setdefault(end + 1, ([], []))[1].append(i)
+    starts: list[int] = []
+    decoders: list[tuple] = []
+    active: set[int] = set()
+    for point in sorted(boundaries):
+        opening, closing = boundaries[point]
+        active.difference_update(closing)
+        active.update(opening)
+        segment = tuple(schemes[i][2] for i in sorted(active))
+        if decoders and decoders[-1] == segment:
+            continue
+        starts.append(point)
+        decoders.append(segment)
+    return starts, decoders
+
+_SEGMENT_STARTS, _SEGMENT_DECODERS = _compile_schemes()
+# the first segment starts at 0 and the last one runs past 0xFFFFFF, both with no decoders,
+# so anything outside of the 24-bit range (even a negative number) lands on a segment with nothing to decode
+
+def _lookup(hexid: int) -> str | None:
+    for decode in _SEGMENT_DECODERS[bisect_right(_SEGMENT_STARTS, hexid) - 1]:
+        if (reg := decode(hexid)) is not None:
             return reg
+    return None
 
-        if (reg := numeric_reg(hexid)) is not None:
-            return reg
+def registration_from_hexid(hexid_input: str) -> str | None:
+    """ Hex id needs to be a string. Returns a registration or None. """
+    # input validation
+    try:
+        # convert to int
+        if hexid_input.startswith("~"): return None
+        hexid_input = int(hexid_input, 16)
+    except:
+        return None
 
-        if (reg := stride_reg(hexid)) is not None:
-            return reg
+    return _lookup(hexid_input)
+
+if __name__ == '__main__':
+    from timeit import timeit
+    import random
 
+    def chained_lookup(hexid: int) -> str | None:
+        """ The original lookup, for reference: try each scheme (and each mapping) in turn until one works. """
+        for decode in (_n_reg, _ja_reg, _hl_reg):
+            if (reg := decode(hexid)) is not None:
+                return reg
+        for mapping in numeric_mappings:
+            if mapping['start'] <= hexid <= mapping['end']:
+                return _numeric_reg(mapping, hexid)
+        for mapping in stride_mappings:
+            if mapping['start'] <= hexid <= mapping['end'] and (reg := _stride_reg(mapping, hexid)) is not None:
+                return reg
         return None
 
-    return lookup(hexid_input)
\ No newline at end of file
+    print(f"Compiled {len(_SEGMENT_STARTS)} segments. Checking every 24-bit address, this will take a while...")
+    mismatches = []
+    for hexid in range(0x1000000):
+        if _lookup(hexid) != chained_lookup(hexid):
+            mismatches.append(hexid)
+    for hexid in (-1, 0x1000000):
+        if _lookup(hexid) is not None:
+            mismatches.append(hexid)
+    print(f"{len(mismatches)} mismatches {[hex(hexid) for hexid in mismatches[:10]]}")
+
+    random.seed(0)
+    hexes = [random.randrange(0x1000000) for _ in range(5000)]
+    # mostly the ranges that have registrations, as that's where the original lookup is the slowest
+    ranges = [(0xA00001, 0xA00001 + 915398), (0x840000, 0x840000 + 229839)]
+    ranges += [(mapping['start'], mapping['end']) for mapping in numeric_mappings + stride_mappings]
+    hexes += [random.randrange(start, end + 1) for start, end in random.choices(ranges, k=20000)]
+    for name, function in (("chained", chained_lookup), ("bisect", _lookup)):
+        elapsed = timeit(lambda: [function(hexid) for hexid in hexes], number=10)
+        print(f"{name:>8}: {elapsed / (10 * len(hexes)) * 1e6:.2f} us per lookup")
+    raise SystemExit(1 if mismatches else 0)
@@ -0,0 +1,113 @@
+""" Module that records and replays dump1090 snapshots on behalf of FlightGazer, along with the
+statistics used to report on a replay. This is what backs FlightGazer's `--record` and `--replay` flags.
+
+Recording format (gzip-compressed):
+- magic bytes `FGREC1\\n`
+- a header: 4-byte length (little-endian) followed by a json object of metadata about the site
+- any number of snapshots: an 8-byte float (Unix time when fetched), a 1-byte payload kind,
+  a 4-byte payload length, then the payload exactly as it was read from dump1090 """
+import gzip
+import json
+import struct
+import threading
+import math
+from pathlib import Path
+from time import time
+
+MAGIC = b'FGREC1\n'
+_LENGTH = struct.Struct('<I')
+_RECORD = struct.Struct('<dBI')
+
+PAYLOAD_KINDS = ('json', 'bincraft', 'bincraft.zst')
+""" What a recorded payload is. The index is what's stored in the recording. """
+
+class SnapshotRecorder:
+    """ Writes dump1090 snapshots to a recording. Pass the file path and a dict of metadata to store with it
+    (such as the site location). Once this class is instantiated, use `.start()` to open the file.
+    Don't forget to call `.close()` at some point! """
+    def __init__(self, file_location, metadata: dict):
+        self.file_path = Path(file_location)
+        self.metadata = metadata
+        self.snapshots = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """ Open the recording for writing. Raises `OSError` if it can't be created. """
+        # favor speed over size; this runs in the main loop
+        self._file = gzip.open(self.file_path, 'wb', compresslevel=1)
+        header = json.dumps(self.metadata).encode()
+        self._file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+
+    def write(self, kind: str, payload: bytes, timestamp: float | None = None) -> None:
+        """ Append a snapshot. `kind` must be one of `PAYLOAD_KINDS`. """
+        if self._file is None:
+            return
+        with self._lock:
+            self._file.write(_RECORD.pack(timestamp or time(), PAYLOAD_KINDS.index(kind), len(payload)))
+            self._file.write(payload)
+            self.snapshots += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class SnapshotPlayer:
+    """ Reads a recording made by `SnapshotRecorder`. The metadata is available right after instancing;
+    iterate over the instance to get `(timestamp, kind, payload)` tuples. Raises `ValueError` if the file isn't a recording. """
+    def __init__(self, file_location):
+        self.file_path = Path(file_location)
+        self.snapshots = 0
+        self._file = gzip.open(self.file_path, 'rb')
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"\'{self.file_path}\' is not a FlightGazer recording")
+        (length,) = _LENGTH.unpack(self._file.read(_LENGTH.size))
+        self.metadata: dict = json.loads(self._file.read(length))
+
+    def __iter__(self):
+        while True:
+            record = self._file.read(_RECORD.size)
+            if len(record) < _RECORD.size:
+                return
+            timestamp, kind, length = _RECORD.unpack(record)
+            payload = self._file.read(length)
+            if len(payload) < length: # recording was cut off
+                return
+            self.snapshots += 1
+            yield timestamp, PAYLOAD_KINDS[kind], payload
+
+    def close(self) -> None:
+        self._file.close()
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """ Nearest-rank percentile of an already sorted list. Returns 0 for an empty list. """
+    if not sorted_samples:
+        return 0.
+    rank = max(math.ceil(pct / 100 * len(sorted_samples)) - 1, 0)
+    return sorted_samples[rank]
+
+def summarize(samples: list[float]) -> dict:
+    """ Summary statistics for a list of timing samples. """
+    ordered = sorted(samples)
+    return {
+        'samples': len(ordered),
+        'mean': round(sum(ordered) / len(ordered), 3) if ordered else 0.,
+        'p50': round(percentile(ordered, 50), 3),
+        'p90': round(percentile(ordered, 90), 3),
+        'p99': round(percentile(ordered, 99), 3),
+        'max': round(ordered[-1], 3) if ordered else 0.,
+    }
+
+def peak_rss_MiB() -> float | None:
+    """ Peak resident memory of this process in MiB, or `None` if it can't be determined on this platform. """
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return round(peak / (1048576 if sys.platform == 'darwin' else 1024), 3)
+    except (ImportError, AttributeError):
+        return None
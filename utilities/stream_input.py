@@ -0,0 +1,248 @@
+""" Module that keeps a live aircraft table from readsb's streaming network outputs on behalf of FlightGazer.
+Instead of fetching and parsing a whole `aircraft.json` every loop, this connects to readsb's SBS/BaseStation
+output (`--net-sbs-port`, usually 30003) or its JSON position output (`--net-json-port`, usually 30047)
+and updates a per-aircraft table one message at a time. The format is detected from the messages themselves.
+Can also be run directly to replay a recorded stream for testing:
+`python stream_input.py <recorded file> [port] [messages per second]` """
+import socket
+import threading
+import logging
+import json
+from time import monotonic, time, sleep
+
+try:
+    import orjson
+    ORJSON_IMPORTED = True
+except ImportError:
+    ORJSON_IMPORTED = False
+
+stream_logger = logging.getLogger("stream-input")
+
+_SBS_NUMERIC_FIELDS = (
+    # (field index, json key, conversion)
+    (11, 'alt_baro', int),
+    (12, 'gs', float),
+    (13, 'track', float),
+    (16, 'baro_rate', int),
+)
+
+class AircraftStream:
+    """ Maintains an aircraft table from a readsb streaming output. Pass the host and port to connect to,
+    and how long (in seconds) an aircraft can go without any messages before it's dropped from the table.
+    Once this class is instantiated, use `.start()` to begin receiving in the background and `.snapshot()` to
+    get the current table in the same form as the `aircraft` list of `aircraft.json`.
+    Don't forget to call `.close()` at some point! """
+    def __init__(self, host: str, port: int, expiry: float = 300, reconnect_delay: float = 10):
+        self.host = host
+        self.port = port
+        self.expiry = expiry
+        self.connected = False
+        self.stream_format = ''
+        """ Either `sbs` or `json` once messages arrive. """
+        self.messages = 0
+        self.bad_messages = 0
+        self.bytes_received = 0
+        self.snapshot_bytes = 0
+        """ Bytes received between the last two calls to `.snapshot()` """
+        self._bytes_at_last_snapshot = 0
+        self.last_message_time = 0. # monotonic
+        self._reconnect_delay = reconnect_delay
+        self._table: dict[str, dict] = {}
+        self._last_prune = 0.
+        self._lock = threading.Lock()
+        self._running = False
+        self._socket = None
+        self._thread = None
+
+    def start(self) -> None:
+        """ Start receiving in a background thread. Reconnects on its own if the connection drops. """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._receiver, name='Stream-Receiver', daemon=True)
+        self._thread.start()
+
+    def _receiver(self) -> None:
+        failures = 0
+        while self._running:
+            try:
+                self._socket = socket.create_connection((self.host, self.port), timeout=5)
+                self._socket.settimeout(30)
+                self.connected = True
+                failures = 0
+                stream_logger.info(f"Connected to aircraft stream at {self.host}:{self.port}")
+                buffer = b''
+                while self._running:
+                    chunk = self._socket.recv(65536)
+                    if not chunk:
+                        raise ConnectionError("connection closed by remote host")
+                    self.bytes_received += len(chunk)
+                    buffer += chunk
+                    *lines, buffer = buffer.split(b'\n')
+                    now = monotonic()
+                    with self._lock:
+                        for line in lines:
+                            self._process(line, now)
+                        if now - self._last_prune > 1:
+                            self._prune(now)
+            except (OSError, ConnectionError) as e:
+                if not self._running:
+                    break
+                failures += 1
+                if self.connected or failures == 1:
+                    stream_logger.warning(f"Aircraft stream at {self.host}:{self.port} is unavailable ({e}). "
+                                          f"Retrying every {self._reconnect_delay} seconds.")
+                self.connected = False
+                sleep(self._reconnect_delay)
+            except Exception:
+                # never let the receiver die; drop what's buffered and start over with a fresh connection
+                if not self._running:
+                    break
+                stream_logger.error(f"Unexpected error while receiving from the aircraft stream at "
+                                    f"{self.host}:{self.port}. Reconnecting.", exc_info=True)
+                self.connected = False
+                sleep(self._reconnect_delay)
+            finally:
+                self._close_socket()
+        self.connected = False
+
+    def _process(self, line: bytes, now: float) -> None:
+        """ Parse a single message and fold it into the table. Must be called with the lock held. """
+        line = line.strip()
+        if not line:
+            return
+        try:
+            if line[0] == 0x7B: # '{'
+                self.stream_format = 'json'
+                self._process_json(line, now)
+            elif line.startswith((b'MSG,', b'MLAT,')):
+                self.stream_format = 'sbs'
+                self._process_sbs(line.decode('ascii', 'replace').split(','), now)
+            else:
+                return # SEL, ID, AIR, STA messages, etc
+            self.messages += 1
+            self.last_message_time = now
+        except (ValueError, IndexError, KeyError, TypeError):
+            self.bad_messages += 1
+
+    def _entry(self, hex_: str, now: float) -> dict:
+        if (entry := self._table.get(hex_)) is None:
+            entry = self._table[hex_] = {'data': {'hex': hex_}, 'updated': now, 'position_updated': None}
+        entry['updated'] = now
+        return entry
+
+    def _process_json(self, line: bytes, now: float) -> None:
+        message = orjson.loads(line) if ORJSON_IMPORTED else json.loads(line)
+        entry = self._entry(message['hex'], now)
+        # readsb sends the full current state of the aircraft with every message
+        message.pop('now', None)
+        seen_pos = message.pop('seen_pos', None)
+        message.pop('seen', None)
+        entry['data'] = message
+        if 'lat' in message and seen_pos is not None:
+            entry['position_updated'] = now - seen_pos
+
+    def _process_sbs(self, fields: list[str], now: float) -> None:
+        # MSG,type,session,aircraft,hex,flight id,date gen,time gen,date log,time log,
+        # callsign,altitude,ground speed,track,lat,lon,vertical rate,squawk,alert,emergency,spi,on ground
+        hex_ = fields[4].strip().lower()
+        if not hex_:
+            raise ValueError("no hex")
+        entry = self._entry(hex_, now)
+        data = entry['data']
+        data['type'] = 'mlat' if fields[0] == 'MLAT' else data.get('type', 'adsb_icao')
+        if (callsign := fields[10].strip()):
+            data['flight'] = callsign
+        for index, key, convert in _SBS_NUMERIC_FIELDS:
+            if (value := fields[index].strip()):
+                data[key] = convert(float(value)) if convert is int else convert(value)
+        if fields[14].strip() and fields[15].strip():
+            data['lat'] = float(fields[14])
+            data['lon'] = float(fields[15])
+            entry['position_updated'] = now
+        if (squawk := fields[17].strip()):
+            data['squawk'] = squawk
+        if len(fields) > 21:
+            on_ground = fields[21].strip()
+            if on_ground in ('-1', '1'):
+                data['alt_baro'] = 'ground'
+            elif on_ground == '0' and data.get('alt_baro') == 'ground':
+                del data['alt_baro']
+
+    def _prune(self, now: float) -> None:
+        """ Drop aircraft we haven't heard from in a while. Must be called with the lock held. """
+        self._last_prune = now
+        stale = [hex_ for hex_, entry in self._table.items() if now - entry['updated'] > self.expiry]
+        for hex_ in stale:
+            del self._table[hex_]
+
+    def snapshot(self) -> dict:
+        """ Returns the current aircraft table in the same form as `aircraft.json` (a dict with the `now`
+        and `aircraft` keys), with `seen` and `seen_pos` calculated for the moment this is called. """
+        now = monotonic()
+        aircraft = []
+        with self._lock:
+            self.snapshot_bytes = self.bytes_received - self._bytes_at_last_snapshot
+            self._bytes_at_last_snapshot = self.bytes_received
+            self._prune(now)
+            for entry in self._table.values():
+                ac = entry['data'].copy()
+                ac['seen'] = round(now - entry['updated'], 1)
+                if entry['position_updated'] is not None:
+                    ac['seen_pos'] = round(now - entry['position_updated'], 1)
+                aircraft.append(ac)
+        return {'now': time(), 'messages': self.messages, 'aircraft': aircraft}
+
+    def _close_socket(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+
+    def close(self) -> None:
+        """ Stop receiving and disconnect. """
+        self._running = False
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._close_socket()
+        stream_logger.debug(f"Disconnected from aircraft stream at {self.host}:{self.port}")
+
+def replay_server(recording, port: int = 30003, rate: float = 200) -> None:
+    """ Serve a recorded stream (one message per line, as captured with something like
+    `nc localhost 30003 > recording.txt`) to a single client at a time, on a loop, at `rate` messages per second. """
+    with open(recording, 'rb') as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError(f"{recording} has no messages in it")
+    with socket.create_server(('127.0.0.1', port)) as server:
+        print(f"Replaying {len(lines)} messages from {recording} on port {port} at {rate} msg/s")
+        while True:
+            client, address = server.accept()
+            print(f"Client connected: {address}")
+            with client:
+                try:
+                    while True:
+                        for line in lines:
+                            client.sendall(line + b'\n')
+                            sleep(1 / rate)
+                except OSError:
+                    print("Client disconnected.")
+
+if __name__ == '__main__':
+    import sys
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    try:
+        replay_server(
+            sys.argv[1],
+            int(sys.argv[2]) if len(sys.argv) > 2 else 30003,
+            float(sys.argv[3]) if len(sys.argv) > 3 else 200,
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,302 @@
+""" Module that generates synthetic dump1090 traffic for scaling tests of FlightGazer.
+Creates recordings (see `replay.py`) of `aircraft.json` snapshots around a given location with aircraft
+that actually move between snapshots, along with the messier things a busy receiver sees:
+a mix of ADS-B/UAT/MLAT/TIS-B `type` values, the same aircraft heard twice, distress squawks,
+far-away (DX) targets, aircraft on the ground, and stale positions.
+Run directly to write recordings for a range of aircraft counts, and optionally replay each through FlightGazer
+to get a curve of loop time against aircraft count:
+`python traffic_generator.py <lat> <lon> [-o output directory] [--counts 10,100,1000] [--run [--flightgazer-args "-f"]]` """
+import argparse
+import csv
+import json
+import math
+import random
+import subprocess
+import sys
+import shlex
+from pathlib import Path
+from time import time
+
+try:
+    from utilities.replay import SnapshotRecorder
+except ImportError: # run directly from this directory
+    from replay import SnapshotRecorder
+
+DEFAULT_COUNTS = (10, 50, 100, 250, 500, 1000, 2000, 3500, 5000)
+SPAWN_RADIUS = 200
+""" How far out (nmi) normal traffic is spread. DX targets are placed beyond this. """
+
+_AIRLINES = ('AAL', 'DAL', 'UAL', 'SWA', 'JBU', 'ASA', 'FFT', 'SKW', 'ENY', 'RPA', 'FDX', 'UPS', 'BAW', 'DLH', 'AFR', 'ACA')
+_CATEGORIES = ('A1', 'A2', 'A3', 'A3', 'A3', 'A4', 'A5', 'A7', 'B1', 'B6')
+_TYPES = (
+    # (weight, type, is UAT)
+    (0.74, 'adsb_icao', False),
+    (0.08, 'mlat', False),
+    (0.05, 'adsb_icao', True),
+    (0.04, 'tisb_icao', False),
+    (0.03, 'adsr_icao', False),
+    (0.02, 'adsb_icao_nt', False),
+    (0.02, 'mode_s', False), # no position
+    (0.02, 'tisb_trackfile', False),
+)
+
+class SyntheticTraffic:
+    """ A set of `count` simulated aircraft around `lat`, `lon`. Call `.step()` to move everyone along
+    and `.snapshot()` to get the current state in the same form as `aircraft.json`.
+    The same `seed` always produces the same traffic. """
+    def __init__(self, lat: float, lon: float, count: int, seed: int = 0):
+        self.lat = lat
+        self.lon = lon
+        self.count = count
+        self.messages = 0
+        self._random = random.Random(seed)
+        self._used_hexes: set[str] = set()
+        self.aircraft = [self._spawn(index) for index in range(count)]
+
+    def _position_at(self, distance: float, bearing: float) -> tuple[float, float]:
+        """ Flat-earth offset from the site; plenty accurate for test data. """
+        lat = self.lat + (distance * math.cos(math.radians(bearing))) / 60
+        lon = self.lon + (distance * math.sin(math.radians(bearing))) / (60 * max(math.cos(math.radians(self.lat)), 0.01))
+        return max(min(lat, 89.9), -89.9), ((lon + 180) % 360) - 180
+
+    def _new_hex(self, tisb: bool) -> str:
+        while True:
+            hex_ = f"{self._random.randint(0x100000, 0xEFFFFF):06x}"
+            if hex_ not in self._used_hexes:
+                self._used_hexes.add(hex_)
+                return f"~{hex_}" if tisb else hex_
+
+    def _spawn(self, index: int) -> dict:
+        r = self._random
+        pick = r.random()
+        for weight, type_, is_uat in _TYPES:
+            if pick < weight:
+                break
+            pick -= weight
+        # a handful of aircraft are special cases; at least one of each once there's enough traffic
+        nearby = index % 100 == 1 # within the default RANGE and HEIGHT_LIMIT so the selection algorithm has work to do
+        dx = index % 100 == 2 # far beyond line of sight
+        distressed = index % 500 == 3
+        on_ground = index % 50 == 4
+        if dx:
+            distance = r.uniform(300, 450)
+        elif nearby:
+            distance = r.uniform(0.2, 1.)
+        else:
+            # denser towards the site like real coverage
+            distance = SPAWN_RADIUS * math.sqrt(r.random())
+        lat, lon = self._position_at(distance, r.uniform(0, 360))
+        altitude = r.randint(1000, 12000) if nearby else r.randint(500, 45000)
+        aircraft = {
+            'hex': self._new_hex(type_.startswith('tisb')),
+            'type': type_,
+            'uat': is_uat,
+            'lat': lat,
+            'lon': lon,
+            'alt': altitude,
+            'on_ground': on_ground,
+            'gs': 0. if on_ground else r.uniform(90, 140) if nearby else r.uniform(90, 520),
+            'track': r.uniform(0, 360),
+            # degrees per second; nearby aircraft circle (about 1 nmi across) so that they stay nearby
+            'turn_rate': r.choice((-3., 3.)) if nearby else r.choice((0., 0., 0., r.uniform(-3, 3))),
+            'baro_rate': 0 if on_ground else r.choice((0, 0, r.randrange(-2000, 2000, 64))),
+            'squawk': r.choice(('7500', '7600', '7700')) if distressed else f"{r.randint(0, 0o7777):04o}",
+            'flight': f"{r.choice(_AIRLINES)}{r.randint(1, 9999)}" if r.random() < 0.8 else None,
+            'category': r.choice(_CATEGORIES),
+            'rssi': round(r.uniform(-35, -3), 1),
+            'has_position': type_ != 'mode_s',
+            'stale': r.random() < 0.02, # position hasn't updated in a while
+            'duplicate': r.random() < 0.03, # also heard through a second source (MLAT or UAT)
+            'dx': dx,
+            'seen_pos': 0.,
+        }
+        return aircraft
+
+    def step(self, dt: float) -> None:
+        """ Advance all aircraft by `dt` seconds. Aircraft that wander off are replaced by new ones. """
+        r = self._random
+        for index, a in enumerate(self.aircraft):
+            a['track'] = (a['track'] + a['turn_rate'] * dt) % 360
+            distance = a['gs'] * dt / 3600
+            a['lat'] += distance * math.cos(math.radians(a['track'])) / 60
+            a['lon'] += distance * math.sin(math.radians(a['track'])) / (60 * max(math.cos(math.radians(a['lat'])), 0.01))
+            a['alt'] = max(a['alt'] + a['baro_rate'] * dt / 60, 0)
+            a['seen_pos'] = a['seen_pos'] + dt if a['stale'] else round(r.uniform(0, min(dt, 5)), 1)
+            self.messages += r.randint(1, 8)
+            if not a['dx'] and math.hypot(a['lat'] - self.lat, (a['lon'] - self.lon) * math.cos(math.radians(self.lat))) * 60 > SPAWN_RADIUS:
+                self._used_hexes.discard(a['hex'].lstrip('~'))
+                self.aircraft[index] = self._spawn(index)
+
+    def _as_json(self, a: dict, type_: str, uat: bool) -> dict:
+        entry = {
+            'hex': a['hex'],
+            'type': type_,
+            'alt_baro': 'ground' if a['on_ground'] else int(a['alt']),
+            'gs': round(a['gs'], 1),
+            'track': round(a['track'], 2),
+            'baro_rate': a['baro_rate'],
+            'squawk': a['squawk'],
+            'category': a['category'],
+            'messages': self.messages,
+            'seen': round(min(a['seen_pos'], 1.), 1),
+            'rssi': a['rssi'],
+        }
+        if a['flight']:
+            entry['flight'] = f"{a['flight']:<8}"
+        if a['has_position']:
+            entry['lat'] = round(a['lat'], 6)
+            entry['lon'] = round(a['lon'], 6)
+            entry['nic'] = 8
+            entry['nac_p'] = 9 if type_ != 'mlat' else 0
+            entry['seen_pos'] = round(a['seen_pos'], 1)
+        if uat:
+            entry['uat_version'] = 2
+        return entry
+
+    def snapshot(self, now: float) -> dict:
+        """ The current state of all aircraft in the same form as `aircraft.json`. """
+        aircraft = []
+        for a in self.aircraft:
+            aircraft.append(self._as_json(a, a['type'], a['uat']))
+            if a['duplicate'] and a['has_position']:
+                # the same aircraft from a second source, which FlightGazer has to deduplicate
+                aircraft.append(self._as_json(a, 'mlat' if a['uat'] else 'adsb_icao', not a['uat']))
+        return {'now': round(now, 1), 'messages': self.messages, 'aircraft': aircraft}
+
+def write_recording(
+    file_location,
+    lat: float,
+    lon: float,
+    count: int,
+    snapshots: int = 60,
+    interval: float = 2,
+    seed: int = 0
+) -> Path:
+    """ Write a recording of `snapshots` snapshots of `count` synthetic aircraft, `interval` seconds apart. """
+    traffic = SyntheticTraffic(lat, lon, count, seed)
+    recorder = SnapshotRecorder(
+        file_location,
+        {
+            'FlightGazer_version': 'synthetic',
+            'created': f"synthetic traffic, {count} aircraft, seed {seed}",
+            'source': 'traffic_generator.py',
+            'receiver_version': 'wiedehopf synthetic',
+            'lat': lat,
+            'lon': lon,
+            'loop_interval': interval,
+        }
+    )
+    recorder.start()
+    try:
+        timestamp = time() - snapshots * interval
+        for _ in range(snapshots):
+            traffic.step(interval)
+            timestamp += interval
+            snapshot = traffic.snapshot(timestamp)
+            recorder.write('json', json.dumps(snapshot, separators=(',', ':')).encode(), timestamp)
+    finally:
+        recorder.close()
+    return Path(file_location)
+
+def scaling_curve(
+    recordings: dict[int, Path],
+    python: str = sys.executable,
+    flightgazer_args: list[str] | None = None,
+    loop_interval: float = 2
+) -> list[dict]:
+    """ Replay each recording through FlightGazer (`{aircraft count: recording}`) and collect the results into rows
+    of the scaling curve. A count whose replay fails is reported with empty results. """
+    script = Path(__file__).resolve().parent.parent / 'FlightGazer.py'
+    rows = []
+    for count, recording in sorted(recordings.items()):
+        print(f"Replaying {count} aircraft...", flush=True)
+        result_file = Path(f"{recording}.benchmark.json")
+        result_file.unlink(missing_ok=True)
+        subprocess.run(
+            [python, str(script), '--replay', str(recording), *(flightgazer_args or [])],
+            stdout=subprocess.DEVNULL,
+            check=False
+        )
+        row = {'aircraft': count}
+        try:
+            with open(result_file, 'r') as f:
+                result = json.load(f)
+            total = result['stages_ms']['total']
+            row |= {
+                'mean_loop_ms': total['mean'],
+                'p50_loop_ms': total['p50'],
+                'p99_loop_ms': total['p99'],
+                'max_loop_ms': total['max'],
+                'snapshots_per_second': result['snapshots_per_second'],
+                'peak_rss_MiB': result['peak_rss_MiB'],
+                'p99_pct_of_loop_interval': round(total['p99'] / (loop_interval * 10), 1),
+            }
+        except (OSError, KeyError, ValueError):
+            print(f"  No results for {count} aircraft; check the FlightGazer log.")
+        rows.append(row)
+    return rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic dump1090 traffic recordings for FlightGazer scaling tests.")
+    parser.add_argument('lat', type=float, help="Latitude of the simulated site.")
+    parser.add_argument('lon', type=float, help="Longitude of the simulated site.")
+    parser.add_argument('-o', '--output', default='synthetic-traffic', help="Directory to write the recordings to.")
+    parser.add_argument(
+        '--counts',
+        default=','.join(str(c) for c in DEFAULT_COUNTS),
+        help="Comma-separated aircraft counts to generate."
+    )
+    parser.add_argument('--snapshots', type=int, default=60, help="Snapshots per recording.")
+    parser.add_argument('--interval', type=float, default=2, help="Seconds between snapshots (match LOOP_INTERVAL).")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--run',
+        action='store_true',
+        help="Replay each recording through FlightGazer and write the scaling curve to scaling_curve.csv."
+    )
+    parser.add_argument('--python', default=sys.executable, help="Python interpreter to run FlightGazer with.")
+    parser.add_argument(
+        '--flightgazer-args',
+        default='',
+        help="Extra arguments to pass to FlightGazer when replaying (ex: \"-f\" for No Filter mode)."
+    )
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    recordings = {}
+    for count in (int(c) for c in args.counts.split(',') if c.strip()):
+        recordings[count] = write_recording(
+            output / f"synthetic-{count}.fgrec",
+            args.lat,
+            args.lon,
+            count,
+            args.snapshots,
+            args.interval,
+            args.seed
+        )
+        print(f"Wrote {recordings[count]}")
+    if not args.run:
+        return
+
+    rows = scaling_curve(recordings, args.python, shlex.split(args.flightgazer_args), args.interval)
+    fields = [
+        'aircraft', 'mean_loop_ms', 'p50_loop_ms', 'p99_loop_ms', 'max_loop_ms',
+        'snapshots_per_second', 'peak_rss_MiB', 'p99_pct_of_loop_interval'
+    ]
+    curve_file = output / 'scaling_curve.csv'
+    with open(curve_file, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    print()
+    widths = [len(field) + 2 for field in fields]
+    print(''.join(f"{field:>{width}}" for field, width in zip(fields, widths)))
+    for row in rows:
+        print(''.join(f"{str(row.get(field, '-')):>{width}}" for field, width in zip(fields, widths)))
+        if row.get('p99_loop_ms', 0) > args.interval * 1000:
+            print(f"  ^ the pipeline can no longer keep up with a {args.interval} second loop interval")
+    print(f"\nScaling curve written to \'{curve_file}\'")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+""" Module that saves and restores a snapshot of FlightGazer's runtime state (the day's flybys, recent approach
+history, lookup caches, and what the synchronizer has worked out) so that a restart doesn't have to start from scratch.
+FlightGazer decides what goes in the snapshot; this module only handles writing it out and reading it back.
+
+The snapshot is a single json object:
+- `version`: the format version (see `FORMAT_VERSION`)
+- `saved`: Unix time when it was written
+- `monotonic`: the writer's monotonic clock at that moment, so monotonic timestamps in the snapshot can be moved
+  onto the reader's clock (see `load()`)
+- `sections`: whatever was handed to `save()` """
+import json
+import os
+from pathlib import Path
+from time import monotonic, time
+
+try:
+    import orjson
+    ORJSON_IMPORTED = True
+except ImportError:
+    ORJSON_IMPORTED = False
+
+FORMAT_VERSION = 1
+
+def save(file_location, sections: dict) -> int:
+    """ Write `sections` (anything json can represent) to `file_location`. The file is replaced atomically
+    so a crash while writing can't leave half a snapshot behind. Returns the number of bytes written.
+    Raises `OSError` if the file can't be written. """
+    snapshot = {
+        'version': FORMAT_VERSION,
+        'saved': time(),
+        'monotonic': monotonic(),
+        'sections': sections,
+    }
+    if ORJSON_IMPORTED:
+        data = orjson.dumps(snapshot)
+    else:
+        data = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+    destination = Path(file_location)
+    temp_file = destination.with_name(f"{destination.name}.tmp")
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, destination)
+    return len(data)
+
+def load(file_location, max_age: float) -> tuple[dict, float, float]:
+    """ Read a snapshot written by `save()`. Returns its sections, how many seconds ago it was written,
+    and the shift to add to the monotonic timestamps in it to put them on this process's monotonic clock
+    (this also works across reboots, where the monotonic clock starts over).
+    Raises `OSError` if the file can't be read and `ValueError` if it isn't a usable snapshot
+    (not a snapshot, a different version, or older than `max_age` seconds). """
+    with open(file_location, 'rb') as f:
+        data = f.read()
+    try:
+        snapshot = orjson.loads(data) if ORJSON_IMPORTED else json.loads(data)
+        version = snapshot['version']
+        saved = float(snapshot['saved'])
+        saved_monotonic = float(snapshot['monotonic'])
+        sections = snapshot['sections']
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"not a warm-start snapshot ({e})") from None
+    if version != FORMAT_VERSION:
+        raise ValueError(f"snapshot is version {version}, expected {FORMAT_VERSION}")
+    if not isinstance(sections, dict):
+        raise ValueError("snapshot has no sections")
+    age = time() - saved
+    if age > max_age or age < 0:
+        raise ValueError(f"snapshot is too old or from the future ({age:.0f} seconds)")
+    # where the snapshot's monotonic clock reading would be on ours
+    shift = (monotonic() - age) - saved_monotonic
+    return sections, age, shift